@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Aim preview for the Gorilla game: draws the predicted banana arc while a player
+charges a throw (SPACE) or drags the mouse.
+
+The arc is computed with physics.iter_trajectory (no jitter) and rendered once
+into a small polyline surface. Results are memoized per (angle, power) bucket,
+so holding SPACE only recomputes when the power crosses into a new bucket.
+"""
+
+from collections import OrderedDict
+import pygame
+from physics import launch_state, iter_trajectory, iter_integrated, throw_velocity_kmph
+
+class AimPreview:
+    """
+    Cached predicted-arc overlay.
+    """
+
+    def __init__(self, dt: float = 1 / 60, angle_bucket: float = 1.0, power_bucket: float = 2.0,
+                 max_points: int = 600, dot_every: int = 3, cache_size: int = 256,
+                 color=(255, 255, 255)):
+        """
+        :param dt: Sampling step of the arc in seconds (matches the game tick).
+        :param angle_bucket: Angle quantization in degrees.
+        :param power_bucket: Power quantization in controller units (0..100).
+        :param max_points: Upper bound on samples per arc.
+        :param dot_every: Draw one dot per this many samples.
+        :param cache_size: Number of memoized arcs kept (LRU).
+        :param color: Dot color.
+        """
+        self.dt = dt
+        self.angle_bucket = angle_bucket
+        self.power_bucket = power_bucket
+        self.max_points = max_points
+        self.dot_every = dot_every
+        self.cache_size = cache_size
+        self.color = color
+
+        self._cache = OrderedDict()  # key -> (surface, topleft) or None
+        self._key = None
+        self._current = None
+
+    def invalidate(self) -> None:
+        """Drops every memoized arc. Call whenever the city or gorillas change."""
+        self._cache.clear()
+        self._key = None
+        self._current = None
+
+    def update(self, start_x: float, start_y: float, angle: float, power: float, wind_mps2: float,
+               facing_left: bool, obstacles: list, screen_width: int, screen_height: int,
+               wind_field=None) -> None:
+        """
+        Selects (or computes) the arc for the current aiming inputs.
+
+        :param start_x: Thrower x (banana launch point).
+        :param start_y: Thrower y.
+        :param angle: Controller angle in degrees.
+        :param power: Controller power (0..100).
+        :param wind_mps2: Wind that the next throw will use.
+        :param facing_left: True when the right-hand gorilla throws.
+        :param obstacles: Game collision objects; everything except the sun ends the arc.
+        :param screen_width: Screen width.
+        :param screen_height: Screen height.
+        :param wind_field: Optional wind.WindField the next throw will fly through.
+        """
+        angle_q = round(angle / self.angle_bucket) * self.angle_bucket
+        power_q = round(power / self.power_bucket) * self.power_bucket
+        key = (start_x, start_y, angle_q, power_q, wind_mps2, facing_left, screen_width, screen_height, id(wind_field))
+        if key == self._key:
+            return
+
+        self._key = key
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self._current = self._cache[key]
+            return
+
+        self._current = self._build(start_x, start_y, angle_q, power_q, wind_mps2, facing_left,
+                                    obstacles, screen_width, screen_height, wind_field)
+        self._cache[key] = self._current
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _build(self, start_x, start_y, angle, power, wind_mps2, facing_left, obstacles, screen_width, screen_height,
+               wind_field):
+        """Computes the arc and rasterizes it into a tightly-sized surface."""
+        velocity = throw_velocity_kmph(power, screen_width)
+        if facing_left:
+            angle, velocity = -angle, -velocity
+        vx, vy, ax, ay = launch_state(angle, velocity, 9.8, wind_mps2)
+
+        bounds = dict(min_x=0, max_x=screen_width, max_y=screen_height, max_steps=self.max_points)
+        if wind_field is None:
+            path = iter_trajectory(start_x, start_y, vx, vy, ax, ay, self.dt, **bounds)
+        else:
+            path = iter_integrated(start_x, start_y, vx, vy, self.dt, wind_field.accelerator(ay), **bounds)
+
+        rects = [obj.rect for obj in obstacles if obj.name != "sun"]
+        points = []
+        for i, (x, y) in enumerate(path):
+            # the launch point itself sits inside the thrower's hitbox
+            if i > 0 and any(rect.collidepoint(x, y) for rect in rects):
+                break
+            if i % self.dot_every == 0 and y >= 0:
+                points.append((int(x), int(y)))
+
+        if not points:
+            return None
+
+        min_x = min(p[0] for p in points)
+        min_y = min(p[1] for p in points)
+        width = max(p[0] for p in points) - min_x + 2
+        height = max(p[1] for p in points) - min_y + 2
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for x, y in points:
+            surface.fill(self.color, (x - min_x, y - min_y, 2, 2))
+        return surface, (min_x, min_y)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Blits the current arc, if any."""
+        if self._current is not None:
+            surface, topleft = self._current
+            screen.blit(surface, topleft)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Per-frame allocation tracking for the Gorilla game (opt-in, tracemalloc based).
+
+AllocationTracker has the same begin_frame()/lap()/end_frame() interface as
+frame_timer.FrameTimer, so Game.frame drives it like any other frame probe.
+For every phase it records:
+
+  - alloc bytes: high-water mark of traced memory above the phase start,
+                 i.e. how much the phase allocated transiently
+  - net bytes  : traced memory retained by the phase
+  - net blocks : change in allocated memory blocks (objects kept alive)
+
+and for every frame the number of GC collections and the time spent in them.
+Only Python-level allocations are traced; SDL surface pixel buffers are not.
+
+Run as a script it plays a scripted headless session and fails (exit 1) when
+steady-state play exceeds the allocation budget:
+
+    python alloc_tracker.py --frames 600 --budget-bytes 65536 --leak-bytes 262144
+"""
+
+import os
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+
+class AllocationTracker:
+    """
+    Attributes allocations to game phases, one row per frame.
+    """
+
+    def __init__(self, phases: tuple = ("events", "update", "render", "flip"), snapshot_every: int = 0,
+                 frames: int = 600):
+        """
+        :param phases: Phase names (same as the FrameTimer phases).
+        :param snapshot_every: If > 0, take tracemalloc snapshots around each phase every N frames
+                               and aggregate the allocating source lines (slow, for attribution).
+        :param frames: Number of frames kept.
+        """
+        self.phases = tuple(phases)
+        self.snapshot_every = snapshot_every
+        self.capacity = frames
+        self.rows = []
+        self.sites = defaultdict(Counter)  # phase -> {"file:line": bytes}
+
+        self._frame = 0
+        self._row = None
+        self._start_current = 0
+        self._start_blocks = 0
+        self._snapshot = None
+        self._gc_start = 0.0
+        self._gc_time = 0.0
+        self._gc_count = 0
+
+    def start(self) -> None:
+        """Starts tracemalloc and GC pause accounting."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1 if not self.snapshot_every else 8)
+        gc.callbacks.append(self._on_gc)
+
+    def stop(self) -> None:
+        """Stops tracing."""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            self._gc_time += time.perf_counter() - self._gc_start
+            self._gc_count += 1
+
+    def _take_snapshot(self):
+        # leave out the tracker's and tracemalloc's own allocations
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    def _mark(self):
+        if self.snapshot_every and self._frame % self.snapshot_every == 0:
+            self._snapshot = self._take_snapshot()
+        else:
+            self._snapshot = None
+        self._start_current = tracemalloc.get_traced_memory()[0]
+        self._start_blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+
+    def begin_frame(self) -> None:
+        self._row = {"frame": self._frame}
+        self._gc_time = 0.0
+        self._gc_count = 0
+        self._mark()
+
+    def lap(self, phase: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        # the tracker's own bookkeeping is small and constant, so it is not subtracted
+        self._row[phase] = (peak - self._start_current, current - self._start_current, blocks - self._start_blocks)
+        if self._snapshot is not None:
+            after = self._take_snapshot()
+            for stat in after.compare_to(self._snapshot, "lineno")[:10]:
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    self.sites[phase][f"{frame.filename}:{frame.lineno}"] += stat.size_diff
+        self._mark()
+
+    def end_frame(self) -> None:
+        self._row["gc_collections"] = self._gc_count
+        self._row["gc_ms"] = self._gc_time * 1000
+        self.rows.append(self._row)
+        if len(self.rows) > self.capacity:
+            del self.rows[0]
+        self._frame += 1
+
+    def report(self, skip: int = 0) -> dict:
+        """
+        Summarizes frames after the first `skip` (warm-up):
+        per phase mean/max alloc bytes, mean net bytes, total net bytes and net blocks,
+        plus per-frame totals and GC statistics.
+        """
+        rows = self.rows[skip:]
+        summary = {"frames": len(rows)}
+        if not rows:
+            return summary
+        frame_alloc = [0] * len(rows)
+        frame_net = 0
+        for phase in self.phases:
+            values = [row.get(phase, (0, 0, 0)) for row in rows]
+            for i, v in enumerate(values):
+                frame_alloc[i] += v[0]
+            frame_net += sum(v[1] for v in values)
+            summary[phase] = {
+                "alloc_bytes_mean": sum(v[0] for v in values) / len(rows),
+                "alloc_bytes_max": max(v[0] for v in values),
+                "net_bytes_mean": sum(v[1] for v in values) / len(rows),
+                "net_bytes_total": sum(v[1] for v in values),
+                "net_blocks_total": sum(v[2] for v in values),
+            }
+        frame_alloc.sort()
+        summary["frame_alloc_bytes_median"] = frame_alloc[len(frame_alloc) // 2]
+        summary["frame_alloc_bytes_max"] = frame_alloc[-1]
+        summary["net_bytes_total"] = frame_net
+        summary["gc_collections"] = sum(row["gc_collections"] for row in rows)
+        summary["gc_ms_max"] = max(row["gc_ms"] for row in rows)
+        return summary
+
+    def top_sites(self, phase: str, limit: int = 10) -> list:
+        """Most allocating source lines of a phase (requires snapshot_every > 0)."""
+        return self.sites[phase].most_common(limit)
+
+def scripted_session(game, frames: int, throw_every: int = 120):
+    """
+    Plays `frames` frames headless: charges power with SPACE and releases it
+    every `throw_every` frames, alternating aim angles.
+    """
+    import pygame
+    for n in range(frames):
+        step = n % throw_every
+        if step == 1:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" ", scancode=44))
+        elif step == 60:
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE, mod=0, unicode=" ", scancode=44))
+        if not game.frame(1 / 60):
+            break
+
+def main():
+    import argparse
+    import random
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    parser = argparse.ArgumentParser(description="Per-frame allocation budget check")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=120, help="frames excluded from the budget")
+    parser.add_argument("--budget-bytes", type=int, default=64 * 1024,
+                        help="max median bytes allocated per steady-state frame")
+    parser.add_argument("--leak-bytes", type=int, default=256 * 1024,
+                        help="max memory retained over the steady-state frames")
+    parser.add_argument("--sites", action="store_true", help="attribute allocations to source lines")
+    parser.add_argument("--seed", type=int, default=1990)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    from game import Game
+    game = Game(background_assets=False)
+    game.round_delay_ms = 0
+
+    tracker = AllocationTracker(snapshot_every=30 if args.sites else 0, frames=args.frames)
+    tracker.start()
+    game.frame_probes.append(tracker)
+    scripted_session(game, args.frames)
+    tracker.stop()
+
+    summary = tracker.report(skip=args.warmup)
+    print(f"frames: {summary['frames']}")
+    for phase in tracker.phases:
+        stats = summary[phase]
+        print(f"{phase:<8} alloc mean {stats['alloc_bytes_mean']:>10.0f} B  max {stats['alloc_bytes_max']:>10} B"
+              f"  net {stats['net_bytes_total']:>10} B  blocks {stats['net_blocks_total']:>7}")
+        for site, size in tracker.top_sites(phase, 5):
+            print(f"           {size:>10} B  {site}")
+    print(f"frame alloc median {summary['frame_alloc_bytes_median']} B, max {summary['frame_alloc_bytes_max']} B")
+    print(f"net retained {summary['net_bytes_total']} B, GC runs {summary['gc_collections']}, worst GC pause {summary['gc_ms_max']:.2f} ms")
+
+    failed = False
+    if summary["frame_alloc_bytes_median"] > args.budget_bytes:
+        print(f"FAIL: median per-frame allocation exceeds budget of {args.budget_bytes} B")
+        failed = True
+    if summary["net_bytes_total"] > args.leak_bytes:
+        print(f"FAIL: retained memory exceeds {args.leak_bytes} B")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
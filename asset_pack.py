@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+"""
+Compiled asset pack for the Gorilla game.
+
+The sprites are stored as GORILLA.BAS DATA integers and decoded bit by bit on
+every run, the gorillas and sun are replayed from QBDraw display lists every
+frame and the sound effects are synthesized from PLAY strings (synth.py). This module
+compiles all of them ahead of time into one versioned file:
+
+    header    4s magic "GAPK", u16 version, u16 reserved, u32 manifest length
+    manifest  UTF-8 JSON: {"version", "source_digest", "entries": {name: entry}}
+              image entry = {"kind": "image", "offset", "size", "width", "height",
+                             "anchor": [x, y], "row", "sha256"}
+              pcm entry   = {"kind": "pcm", "offset", "size", "sample_rate", "sha256"}
+    blobs     raw entry data (images: RGBA rows, pcm: mono int16 samples),
+              offsets relative to the blob start
+
+source_digest hashes the modules that produce the assets (SOURCE_MODULES), so a
+pack built before any of them changed is reported as stale and the game falls
+back to live decoding (see assets.load_assets). At runtime the file is
+memory-mapped once and surfaces are created straight from the mapped bytes.
+
+Figures carry an anchor: the pixel of the image that sits at the figure's draw
+origin (Gorilla x/y, sun centre), so blitting at origin - anchor reproduces the
+QBDraw output pixel for pixel. pygame.draw.arc does not round the same way
+near the top edge of a surface, so a figure drawn there (the sun) is rasterized
+at its in-game row and pinned to it ("row"); elsewhere it falls back to QBDraw.
+
+Usage:
+    python asset_pack.py build [gorilla.pack]
+    python asset_pack.py info [gorilla.pack]
+    python asset_pack.py verify [gorilla.pack]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+
+MAGIC = b"GAPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK = os.path.join(_HERE, "gorilla.pack")
+SOURCE_MODULES = ("asset_pack.py", "graphics.py", "gorilla.py", "qbdraw.py", "utils.py", "synth.py")
+
+# Scratch canvas for rasterizing figures, with the draw origin at its centre
+_CANVAS_SIZE = 128
+# Row the game draws the sun at (Game.sun_y)
+SUN_Y = 25
+
+def source_digest() -> str:
+    """SHA-256 over the modules that produce the packed assets."""
+    digest = hashlib.sha256()
+    for name in SOURCE_MODULES:
+        with open(os.path.join(_HERE, name), "rb") as f:
+            digest.update(name.encode())
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def rasterize_figure(display_list, row: int = None) -> tuple:
+    """
+    Rasterizes a recorded QBDraw figure (qbdraw.DisplayList) and crops it.
+
+    :param display_list: The figure, relative to its draw origin.
+    :param row: Pin the figure to this screen row: it is rasterized with its origin
+                there and only valid when drawn there. None rasterizes it at the
+                canvas centre, valid anywhere away from the top edge.
+    :return: (surface, (anchor_x, anchor_y, row)).
+    """
+    origin_y = _CANVAS_SIZE // 2 if row is None else row
+    surface, (anchor_x, anchor_y) = display_list.rasterize(
+        origin=(_CANVAS_SIZE // 2, origin_y), size=(_CANVAS_SIZE, _CANVAS_SIZE))
+    return surface, (anchor_x, anchor_y, row)
+
+def compile_figures() -> dict:
+    """
+    Pre-rasterizes the gorilla poses and both sun faces.
+
+    :return: {name: (surface, anchor)}; names match Graphics.draw_gorilla / draw_sun.
+             The sun is pinned to SUN_Y, the gorillas are valid at any row.
+    """
+    from gorilla import Gorilla
+    from graphics import Graphics
+    from qbdraw import QBDraw
+
+    def sun(happy):
+        drawer = QBDraw.recorder(scale=1)
+        Graphics._sun_commands(drawer, happy)
+        return drawer.display_list()
+
+    figures = {}
+    for state in (Gorilla.ARMS_DOWN, Gorilla.LEFT_UP, Gorilla.RIGHT_UP):
+        figures[f"gorilla_{state}"] = rasterize_figure(Gorilla(0, 0, state).display_list())
+    figures["sun_happy"] = rasterize_figure(sun(True), SUN_Y)
+    figures["sun_surprised"] = rasterize_figure(sun(False), SUN_Y)
+    return figures
+
+def compile_images() -> dict:
+    """
+    Every image that goes into a pack.
+
+    :return: {name: (surface, anchor)}; sprites are anchored at their top-left corner.
+    """
+    from graphics import decode_sprites
+    images = {name: (surface, (0, 0, None)) for name, surface in decode_sprites().items()}
+    images.update(compile_figures())
+    return images
+
+def compile_sounds() -> dict:
+    """
+    Renders the synth.EFFECTS clips at synth.SAMPLE_RATE.
+
+    :return: {"sound_<effect>": mono int16 samples}, as sound.Sound looks them up.
+    """
+    import synth
+    return {f"sound_{name}": synth.render_play(music) for name, music in synth.EFFECTS.items()}
+
+def build_pack(path: str = DEFAULT_PACK) -> dict:
+    """
+    Compiles the assets and writes the pack.
+
+    :return: The manifest that was written.
+    """
+    import synth
+
+    entries = {}
+    blobs = []
+
+    def add(name, data, **fields):
+        entries[name] = dict(fields, offset=sum(map(len, blobs)), size=len(data),
+                             sha256=hashlib.sha256(data).hexdigest())
+        blobs.append(data)
+
+    for name, (surface, (anchor_x, anchor_y, row)) in sorted(compile_images().items()):
+        add(name, pygame.image.tobytes(surface, "RGBA"), kind="image",
+            width=surface.get_width(), height=surface.get_height(), anchor=[anchor_x, anchor_y], row=row)
+    for name, samples in sorted(compile_sounds().items()):
+        add(name, samples.astype("<i2").tobytes(), kind="pcm", sample_rate=synth.SAMPLE_RATE)
+
+    manifest = {"version": VERSION, "source_digest": source_digest(), "entries": entries}
+    manifest_bytes = json.dumps(manifest, sort_keys=True).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(manifest_bytes)))
+        f.write(manifest_bytes)
+        for data in blobs:
+            f.write(data)
+    return manifest
+
+class AssetPack:
+    """
+    Memory-mapped, read-only view of an asset pack.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, manifest_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset pack")
+        start = HEADER.size
+        self.manifest = json.loads(bytes(self._map[start:start + manifest_length]).decode("utf-8"))
+        self.entries = self.manifest["entries"]
+        self._blob_start = start + manifest_length
+
+    def is_stale(self) -> bool:
+        """True when the asset sources changed since the pack was built."""
+        return self.manifest.get("source_digest") != source_digest()
+
+    def data(self, name: str) -> memoryview:
+        """Zero-copy view of one entry's bytes."""
+        entry = self.entries[name]
+        start = self._blob_start + entry["offset"]
+        return memoryview(self._map)[start:start + entry["size"]]
+
+    def surface(self, name: str) -> pygame.Surface:
+        """Builds an image entry's surface directly on the mapped bytes."""
+        entry = self.entries[name]
+        return pygame.image.frombuffer(self.data(name), (entry["width"], entry["height"]), "RGBA")
+
+    def images(self) -> tuple:
+        """
+        :return: ({name: surface}, {name: (anchor_x, anchor_y, row)}) for every image entry.
+        """
+        surfaces, anchors = {}, {}
+        for name, entry in self.entries.items():
+            if entry["kind"] == "image":
+                surfaces[name] = self.surface(name)
+                anchors[name] = (*entry["anchor"], entry["row"])
+        return surfaces, anchors
+
+    def verify(self) -> list:
+        """Names of the entries whose bytes no longer match their content hash."""
+        return [name for name, entry in self.entries.items()
+                if hashlib.sha256(self.data(name)).hexdigest() != entry["sha256"]]
+
+def load_pack(path: str = DEFAULT_PACK):
+    """
+    Opens a pack for runtime use.
+
+    :return: An AssetPack, or None when the file is missing, unreadable or stale.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        pack = AssetPack(path)
+    except (OSError, ValueError, KeyError):
+        return None
+    if pack.is_stale():
+        return None
+    return pack
+
+def main():
+    parser = argparse.ArgumentParser(description="Gorilla asset pack compiler")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for command in ("build", "info", "verify"):
+        sub.add_parser(command).add_argument("path", nargs="?", default=DEFAULT_PACK)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        manifest = build_pack(args.path)
+        print(f"wrote {len(manifest['entries'])} assets to {args.path} ({os.path.getsize(args.path)} bytes)")
+        return
+
+    pack = AssetPack(args.path)
+    if args.command == "info":
+        print(f"{args.path}: {len(pack.entries)} assets, {'stale' if pack.is_stale() else 'up to date'}")
+        for name, entry in sorted(pack.entries.items()):
+            if entry["kind"] == "pcm":
+                seconds = entry["size"] / 2 / entry["sample_rate"]
+                print(f"  {name:<16} pcm    {seconds:.2f} s at {entry['sample_rate']} Hz  {entry['size']} bytes")
+                continue
+            row = "" if entry["row"] is None else f"  row {entry['row']}"
+            print(f"  {name:<16} {entry['kind']:<6} {entry['width']}x{entry['height']}"
+                  f"  anchor {tuple(entry['anchor'])}{row}  {entry['size']} bytes")
+    else:
+        bad = pack.verify()
+        stale = pack.is_stale()
+        print(f"{len(pack.entries) - len(bad)}/{len(pack.entries)} hashes match, "
+              f"sources {'changed' if stale else 'unchanged'}")
+        if bad or stale:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
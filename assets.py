@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Background asset loading for the Gorilla game.
+
+Decoding the EGA sprites and opening the mixer/WAV files used to happen inside
+Game.__init__, before the window showed anything. start_loading() moves both
+onto a worker thread and returns a Future; the game polls it each frame and
+installs the assets once they are ready (the banana is skipped and sounds are
+silent until then).
+
+When a fresh compiled pack exists (asset_pack.py), the sprites, the
+pre-rasterized gorilla/sun figures and the rendered sound clips come from it;
+otherwise the sprites are decoded live, the figures keep being drawn with
+QBDraw and the sounds are synthesized (synth.py).
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+class LoadedAssets:
+    """
+    Result of load_assets().
+    """
+
+    def __init__(self, sprites: dict, anchors: dict, sound, timings: dict, pack=None):
+        """
+        :param sprites: Decoded surfaces keyed like Graphics.ega_surfaces.
+        :param anchors: Anchors of the pre-rasterized figures among the sprites.
+        :param sound: A sound.Sound, or None when audio is unavailable.
+        :param timings: Seconds spent per step ("sprites", "sound").
+        :param pack: The asset_pack.AssetPack the sprites came from (their surfaces
+                     share its memory map), or None when they were decoded live.
+        """
+        self.sprites = sprites
+        self.anchors = anchors
+        self.sound = sound
+        self.timings = timings
+        self.pack = pack
+
+def load_assets(scale_factor: int = 1, with_sound: bool = True, pack_path: str = None) -> LoadedAssets:
+    """
+    Decodes the sprites and loads the sounds. Safe to run off the main thread:
+    it only creates plain surfaces (no display conversion) and the mixer.
+
+    :param scale_factor: Sprite scale factor (see Graphics). The pack holds unscaled
+                         assets, so other factors always decode live.
+    :param with_sound: False skips the mixer entirely (headless tools).
+    :param pack_path: Asset pack to use; defaults to asset_pack.DEFAULT_PACK.
+    """
+    timings = {}
+    start = time.perf_counter()
+    pack = None
+    if scale_factor == 1:
+        from asset_pack import load_pack, DEFAULT_PACK
+        pack = load_pack(pack_path or DEFAULT_PACK)
+    if pack is not None:
+        sprites, anchors = pack.images()
+    else:
+        from graphics import decode_sprites
+        sprites, anchors = decode_sprites(scale_factor), {}
+    timings["sprites"] = time.perf_counter() - start
+
+    sound = None
+    if with_sound:
+        from sound import load_sound
+        start = time.perf_counter()
+        sound = load_sound(pack)
+        timings["sound"] = time.perf_counter() - start
+    return LoadedAssets(sprites, anchors, sound, timings, pack)
+
+def start_loading(scale_factor: int = 1, with_sound: bool = True) -> Future:
+    """
+    Runs load_assets() on a background thread.
+
+    :return: A Future resolving to LoadedAssets.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+    future = executor.submit(load_assets, scale_factor, with_sound)
+    executor.shutdown(wait=False)
+    return future
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+"""
+Audio channel scheduling for the Gorilla game.
+
+Playing every effect with Sound.play() lets pygame pick any free channel, so a
+burst of explosions can use up the mixer and cut off the victory jingle at
+random. AudioScheduler instead gives each category of sound its own reserved
+channels, caps the number of voices playing at once, and when a category (or
+the cap) is full it steals the lowest-priority, oldest voice. It never steals
+a voice with a higher priority than the new one; the new sound is dropped
+instead. Requests for the same effect within one frame (coalesce_ms) are
+merged into a single voice.
+
+Backends:
+    PygameBackend  plays on reserved pygame.mixer channels
+    NullBackend    silent; tracks voice lifetimes from clip lengths against the
+                   scheduler clock, for headless simulations (see
+                   Sound.headless and the stress rapid_impacts scenario)
+"""
+
+import pygame
+
+# Reserved channels per category
+DEFAULT_CATEGORIES = {"music": 1, "jingle": 1, "sfx": 4}
+
+class SilentClip:
+    """
+    Stand-in for a pygame.mixer.Sound when nothing is played (NullBackend).
+    """
+    __slots__ = ("length",)
+
+    def __init__(self, length: float):
+        """
+        :param length: Clip length in seconds.
+        """
+        self.length = length
+
+    def get_length(self) -> float:
+        return self.length
+
+class PygameBackend:
+    """
+    Plays clips on channels reserved from pygame.mixer.
+    """
+
+    def open(self, count: int) -> None:
+        """Reserves channels 0..count-1, so pygame never hands them to plain Sound.play()."""
+        pygame.mixer.set_num_channels(max(count, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(count)
+        self._channels = [pygame.mixer.Channel(i) for i in range(count)]
+
+    def play(self, channel: int, clip, now: float) -> None:
+        self._channels[channel].play(clip)
+
+    def stop(self, channel: int) -> None:
+        self._channels[channel].stop()
+
+    def busy(self, channel: int, now: float) -> bool:
+        return self._channels[channel].get_busy()
+
+class NullBackend:
+    """
+    Silent backend; a voice is busy until its clip length has elapsed on the scheduler clock.
+    """
+
+    def open(self, count: int) -> None:
+        self._ends = [0.0] * count
+
+    def play(self, channel: int, clip, now: float) -> None:
+        self._ends[channel] = now + clip.get_length() * 1000.0
+
+    def stop(self, channel: int) -> None:
+        self._ends[channel] = 0.0
+
+    def busy(self, channel: int, now: float) -> bool:
+        return now < self._ends[channel]
+
+class AudioScheduler:
+    """
+    Assigns sounds to reserved channels with a voice cap, priorities and coalescing.
+    """
+
+    def __init__(self, backend=None, categories: dict = None, max_voices: int = 5,
+                 coalesce_ms: float = 15, clock=None):
+        """
+        :param backend: PygameBackend (default) or NullBackend.
+        :param categories: Channels reserved per category (default DEFAULT_CATEGORIES).
+        :param max_voices: Most voices playing at once, across all categories.
+        :param coalesce_ms: Repeats of one effect within this window share a voice; the
+                            default is just under one 60 fps frame (get_ticks steps in
+                            whole ms, so frames are 16-17 ms apart).
+        :param clock: Callable returning the time in ms (default pygame.time.get_ticks);
+                      simulations pass their own frame clock.
+        """
+        self.backend = backend or PygameBackend()
+        self.categories = dict(categories or DEFAULT_CATEGORIES)
+        self.max_voices = max_voices
+        self.coalesce_ms = coalesce_ms
+        self.clock = clock or pygame.time.get_ticks
+
+        self._channels = {}
+        count = 0
+        for category, channels in self.categories.items():
+            self._channels[category] = range(count, count + channels)
+            count += channels
+        self.backend.open(count)
+        # Per channel: (name, priority, started_ms) of the voice playing there, or None
+        self._voices = [None] * count
+        self._last_started = {}
+        self.stats = {"played": 0, "coalesced": 0, "stolen": 0, "dropped": 0}
+
+    def _reap(self, now: float) -> None:
+        for channel, voice in enumerate(self._voices):
+            if voice is not None and not self.backend.busy(channel, now):
+                self._voices[channel] = None
+
+    def _victim(self, channels, priority: int):
+        """Lowest-priority, oldest voice on these channels that may be replaced, or None."""
+        best = None
+        for channel in channels:
+            voice = self._voices[channel]
+            if voice is None or voice[1] > priority:
+                continue
+            if best is None or (voice[1], voice[2]) < (self._voices[best][1], self._voices[best][2]):
+                best = channel
+        return best
+
+    def play(self, name: str, clip, category: str = "sfx", priority: int = 0) -> bool:
+        """
+        Requests a sound.
+
+        :param name: Effect name; repeats within coalesce_ms are merged.
+        :param clip: pygame.mixer.Sound (or SilentClip for NullBackend).
+        :param category: One of the scheduler's categories.
+        :param priority: Higher values may steal voices of lower or equal priority.
+        :return: True when a voice started, False when it was coalesced or dropped.
+        """
+        now = self.clock()
+        last = self._last_started.get(name)
+        if last is not None and now - last < self.coalesce_ms:
+            self.stats["coalesced"] += 1
+            return False
+
+        self._reap(now)
+        channels = self._channels[category]
+        free = [channel for channel in channels if self._voices[channel] is None]
+        active = sum(voice is not None for voice in self._voices)
+
+        if free and active < self.max_voices:
+            channel = free[0]
+        else:
+            # Category full: replace one of its voices. Cap reached: free a voice anywhere.
+            victim = self._victim(channels if not free else range(len(self._voices)), priority)
+            if victim is None:
+                self.stats["dropped"] += 1
+                return False
+            self.backend.stop(victim)
+            self._voices[victim] = None
+            self.stats["stolen"] += 1
+            channel = free[0] if free else victim
+
+        self.backend.play(channel, clip, now)
+        self._voices[channel] = (name, priority, now)
+        self._last_started[name] = now
+        self.stats["played"] += 1
+        return True
+
+    def active_voices(self) -> list:
+        """(channel, name, priority) of the voices currently playing."""
+        self._reap(self.clock())
+        return [(channel, voice[0], voice[1]) for channel, voice in enumerate(self._voices) if voice is not None]
+
+    def stop_all(self) -> None:
+        for channel, voice in enumerate(self._voices):
+            if voice is not None:
+                self.backend.stop(channel)
+                self._voices[channel] = None
@@ -7,7 +7,8 @@ Manages position, velocity, angle, drawing, flight updates, and collision detect
 import math
 import pygame
 from graphics import Graphics
-from utils import meters_to_pixels, kmph_to_pixels_per_sec, SKY_COLOR, BANANA_COLOR, SUN_COLOR
+from physics import INTEGRATORS, INTEGRATOR_NAMES, closed_form_stepper, launch_state, iter_trajectory
+from utils import SKY_COLOR, BANANA_COLOR, SUN_COLOR
 
 class Banana:
     """
@@ -23,42 +24,64 @@ class Banana:
         gravity_mps2: float = 9.8,
         wind_mps2: float = 0,
         rpm: float = 200.0,
-        graphics=None
+        graphics=None,
+        integrator: str = "semi_euler",
+        wind_field=None
     ):
+        """
+        :param integrator: Flight integrator, one of physics.INTEGRATOR_NAMES
+                           ("closed_form", "semi_euler", "symplectic_euler", "verlet", "rk4").
+        :param wind_field: Optional wind.WindField; replaces wind_mps2 with a position-dependent wind.
+        """
+        if integrator not in INTEGRATOR_NAMES:
+            raise ValueError(f"Unknown integrator: {integrator}")
+        if wind_field is not None and integrator == "closed_form":
+            raise ValueError("closed_form integrator needs constant wind; use verlet with a wind field")
+
         self.x = x
         self.y = y
         self.angle_deg = angle_deg
         self.rpm = rpm
         self.graphics = graphics
 
-        # Convert real-world units to pixels
-        gravity_px = meters_to_pixels(gravity_mps2)
-        wind_px = meters_to_pixels(wind_mps2)
-        velocity_px = kmph_to_pixels_per_sec(velocity_kmph)
-
         self.angle_rad = math.radians(angle_deg)
 
-        # Velocity components
-        self.vx = math.cos(self.angle_rad) * velocity_px
-        self.vy = -math.sin(self.angle_rad) * velocity_px
-
-        self.gravity = gravity_px
-        self.wind = wind_px
+        # Convert real-world units to pixels (shared with physics.iter_trajectory)
+        self.vx, self.vy, self.wind, self.gravity = launch_state(angle_deg, velocity_kmph, gravity_mps2, wind_mps2)
 
         self.alive = True
         self.dt_acc = 0.0
 
+        # Launch state (closed-form flight and trajectory())
+        self.integrator = integrator
+        self.x0, self.y0 = x, y
+        self.vx0, self.vy0 = self.vx, self.vy
+        if integrator == "closed_form":
+            self._step = closed_form_stepper(x, y, self.vx, self.vy, self.wind, self.gravity)
+        else:
+            self._step = INTEGRATORS[integrator]
+
+        self.wind_field = wind_field
+        if wind_field is not None:
+            self.acceleration = wind_field.accelerator(self.gravity)
+
+    def acceleration(self, x: float, y: float) -> tuple:
+        """Acceleration (pixels/s^2) acting on the banana at (x, y)."""
+        return self.wind, self.gravity
+
+    def trajectory(self, dt: float, **bounds):
+        """
+        Lazily yields the analytic (x, y) path from the launch point, sampled every dt.
+        Keyword bounds are passed to physics.iter_trajectory (min_x, max_x, max_y, max_steps).
+        """
+        return iter_trajectory(self.x0, self.y0, self.vx0, self.vy0, self.wind, self.gravity, dt, **bounds)
+
     def update(self, dt: float, screen_width: int, screen_height: int) -> None:
         if not self.alive:
             return
 
         self.dt_acc += dt
-
-        self.vx += self.wind * dt
-        self.x += self.vx * dt
-
-        self.y += self.vy * dt
-        self.vy += self.gravity * dt
+        self.x, self.y, self.vx, self.vy = self._step(self.x, self.y, self.vx, self.vy, dt, self.acceleration)
 
         if self.x < 0 or self.x > screen_width or self.y > screen_height:
             self.alive = False
@@ -75,12 +98,12 @@ class Banana:
 
         self.graphics.draw_banana(self.x, self.y, selected_orientation)
 
-    def XXcheck_collision(self, screen: pygame.Surface, collision_objects: list[dict]) -> str:
+    def XXcheck_collision(self, screen: pygame.Surface, collision_objects: list) -> str:
         """
         Flexible collision detection using collision objects dict list.
 
         :param screen: Game screen surface.
-        :param collision_objects: List of dictionaries defining collision targets.
+        :param collision_objects: List of collision.CollisionObject targets.
         :return: The collided object's name, or "none".
         """
         check_x = int(self.x)
@@ -95,9 +118,9 @@ class Banana:
         color_at_pos = screen.get_at((check_x, check_y))[:3]
 
         for obj in collision_objects:
-            rect = obj.get("rect")
-            color = obj.get("color")
-            name = obj.get("name", "unknown")
+            rect = obj.rect
+            color = getattr(obj, "color", None)
+            name = obj.name
 
             if rect.collidepoint(check_x, check_y):
                 if color:
@@ -111,24 +134,25 @@ class Banana:
 
         return "none"
 
-    def check_collision(self, collision_objects: list[dict]) -> str:
+    def check_collision(self, collision_objects: list, bounds: pygame.Rect = None) -> str:
         """
         Simplified and reliable collision detection using rect-only collision.
 
-        :param collision_objects: List of dictionaries defining collision targets.
+        :param collision_objects: List of collision.CollisionObject targets.
+        :param bounds: Playfield rect for the boundary check; defaults to the display surface
+                       (pass it explicitly when running headless).
         :return: The collided object's name, or "none".
         """
         check_point = pygame.math.Vector2(self.x, self.y)
 
         for obj in collision_objects:
-            rect = obj.get("rect")
-            name = obj.get("name", "unknown")
-
-            if rect.collidepoint(check_point):
-                return name
+            if obj.rect.collidepoint(check_point):
+                return obj.name
 
         # Boundary checking as fallback
-        if not pygame.display.get_surface().get_rect().collidepoint(check_point):
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_rect()
+        if not bounds.collidepoint(check_point):
             #self.alive = False
             return "boundary"
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Accuracy/cost benchmark for the banana flight integrators.
+
+For a grid of shots (angle, velocity, wind) and a set of tick rates, every
+integrator in physics.INTEGRATOR_NAMES is stepped through Banana.update and
+compared against the analytic trajectory:
+
+  - traj err : worst position error over the whole flight (pixels)
+  - impact err: error of the x coordinate where the banana crosses the
+                impact line, linearly interpolated between ticks (pixels)
+  - us/step  : cost of one Banana.update call
+
+The last line recommends the cheapest integrator whose impact error stays
+within one pixel at every tick rate.
+
+Usage:
+    python bench_integrators.py [--rates 30 60 144] [--steps 20000]
+"""
+
+import argparse
+import itertools
+import math
+import time
+
+from banana import Banana
+from physics import INTEGRATOR_NAMES, closed_form_position
+
+START_X, START_Y = 100.0, 500.0
+IMPACT_DROP = 150.0          # impact line, pixels below the launch point
+MAX_FLIGHT_S = 8.0
+
+ANGLES = (20, 45, 70)
+VELOCITIES_KMPH = (25, 45, 70)
+WINDS_MPS2 = (-2.0, 0.0, 2.0)
+
+def analytic_impact_x(banana: Banana, impact_y: float) -> float:
+    """Solves y(t) = impact_y for the descending branch and returns x(t)."""
+    a = 0.5 * banana.gravity
+    b = banana.vy0
+    c = banana.y0 - impact_y
+    t = (-b + math.sqrt(b * b - 4 * a * c)) / (2 * a)
+    return closed_form_position(banana.x0, banana.y0, banana.vx0, banana.vy0, banana.wind, banana.gravity, t)[0]
+
+def measure_shot(integrator: str, angle: float, velocity: float, wind: float, dt: float) -> tuple:
+    """Flies one shot and returns (max trajectory error, impact error) in pixels."""
+    banana = Banana(START_X, START_Y, angle, velocity_kmph=velocity, wind_mps2=wind, integrator=integrator)
+    impact_y = START_Y + IMPACT_DROP
+    max_err = 0.0
+    t = 0.0
+    prev_x, prev_y = banana.x, banana.y
+
+    while t < MAX_FLIGHT_S:
+        banana.update(dt, 10 ** 9, 10 ** 9)
+        t += dt
+        ex, ey = closed_form_position(banana.x0, banana.y0, banana.vx0, banana.vy0, banana.wind, banana.gravity, t)
+        max_err = max(max_err, math.hypot(banana.x - ex, banana.y - ey))
+        if banana.y >= impact_y and banana.vy > 0:
+            frac = (impact_y - prev_y) / (banana.y - prev_y)
+            hit_x = prev_x + frac * (banana.x - prev_x)
+            return max_err, abs(hit_x - analytic_impact_x(banana, impact_y))
+        prev_x, prev_y = banana.x, banana.y
+
+    return max_err, float("inf")
+
+def measure_cost(integrator: str, steps: int) -> float:
+    """Returns microseconds per Banana.update call."""
+    banana = Banana(START_X, START_Y, 45, velocity_kmph=45, wind_mps2=1.0, integrator=integrator)
+    update = banana.update
+    dt = 1 / 60
+    start = time.perf_counter()
+    for _ in range(steps):
+        update(dt, 10 ** 9, 10 ** 9)
+    return (time.perf_counter() - start) * 1e6 / steps
+
+def main():
+    parser = argparse.ArgumentParser(description="Banana integrator accuracy/cost benchmark")
+    parser.add_argument("--rates", type=int, nargs="+", default=[30, 60, 144], help="tick rates (Hz)")
+    parser.add_argument("--steps", type=int, default=20000, help="steps used to time each integrator")
+    args = parser.parse_args()
+
+    shots = list(itertools.product(ANGLES, VELOCITIES_KMPH, WINDS_MPS2))
+    results = {}
+
+    header = f"{'integrator':<18}{'us/step':>9}" + "".join(f"{f'{r}Hz traj':>12}{f'{r}Hz hit':>10}" for r in args.rates)
+    print(header)
+    print("-" * len(header))
+
+    for name in INTEGRATOR_NAMES:
+        cost = measure_cost(name, args.steps)
+        row = f"{name:<18}{cost:>9.2f}"
+        worst_impact = 0.0
+        for rate in args.rates:
+            errors = [measure_shot(name, a, v, w, 1.0 / rate) for a, v, w in shots]
+            traj = max(e[0] for e in errors)
+            impact = max(e[1] for e in errors)
+            worst_impact = max(worst_impact, impact)
+            row += f"{traj:>12.3f}{impact:>10.3f}"
+        results[name] = (cost, worst_impact)
+        print(row)
+
+    within = [name for name, (cost, impact) in results.items() if impact <= 1.0]
+    if within:
+        best = min(within, key=lambda n: results[n][0])
+        print(f"\nCheapest integrator within 1px impact error: {best} ({results[best][0]:.2f} us/step)")
+    else:
+        print("\nNo integrator keeps impact points within 1px at these tick rates.")
+
+if __name__ == '__main__':
+    main()
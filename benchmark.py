@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for the Gorilla game's hot paths.
+
+Runs headless (SDL dummy video/audio drivers) from fixed seeds, so two runs on
+the same machine time exactly the same work. Results are written as JSON and
+can be compared against a stored baseline; any case slower than the baseline by
+more than the threshold is reported as a regression (exit status 1), and so is
+any case whose median exceeds its time budget.
+
+Usage:
+    python benchmark.py                              # run and print
+    python benchmark.py --save-baseline              # store benchmark_baseline.json
+    python benchmark.py --compare                    # compare with the stored baseline
+    python benchmark.py --output run.json --filter render
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import pygame
+
+SEED = 1990
+DEFAULT_BASELINE = "benchmark_baseline.json"
+
+# name -> (factory, iterations, budget_us); the factory takes the game and
+# returns (run, setup); setup may be None and is not timed
+BENCHMARKS = {}
+# One frame at 60 fps
+FRAME_BUDGET_US = 1e6 / 60
+
+def benchmark(name: str, iterations: int = 200, budget_us: float = None):
+    """
+    Registers a benchmark factory under `name`.
+
+    :param budget_us: Time the median call must stay within; the run reports PASS/FAIL against it.
+    """
+    def register(factory):
+        BENCHMARKS[name] = (factory, iterations, budget_us)
+        return factory
+    return register
+
+@benchmark("decode_ega", iterations=50)
+def bench_decode_ega(game):
+    from graphics import decode_ega, banana_ega_data
+    sprites = list(banana_ega_data.values())
+
+    def run():
+        for data in sprites:
+            decode_ega(data)
+    return run, None
+
+@benchmark("generate_buildings")
+def bench_generate_buildings(game):
+    city = game.cityscape
+    return city.generate_buildings, lambda: random.seed(SEED)
+
+@benchmark("generate_windows")
+def bench_generate_windows(game):
+    buildings = game.cityscape.buildings
+
+    def run():
+        for building in buildings:
+            building.generate_windows()
+    return run, lambda: random.seed(SEED)
+
+@benchmark("game_render")
+def bench_game_render(game):
+    return game.render, None
+
+@benchmark("gorilla_draw", iterations=1000)
+def bench_gorilla_draw(game):
+    gorilla = game.gorilla1
+    return lambda: gorilla.draw(game.screen), None
+
+@benchmark("banana_flight")
+def bench_banana_flight(game):
+    from banana import Banana
+    x, y = game.gorilla1.x, game.gorilla1.y
+    objects = game.collision_objects
+    width, height = game.screen_width, game.screen_height
+
+    def run():
+        banana = Banana(x, y, 60, velocity_kmph=60, wind_mps2=0.5, integrator=game.banana_integrator)
+        for _ in range(1000):
+            banana.update(1 / 60, width, height)
+            if banana.check_collision(objects) not in ("none", "sun") or not banana.alive:
+                break
+    return run, None
+
+@benchmark("destroy_building_area")
+def bench_destroy_building_area(game):
+    from cityscape import CityScape
+    city = CityScape(game.screen_width, game.screen_height)
+    targets = []
+
+    def setup():
+        random.seed(SEED)
+        city.generate_buildings()
+        targets[:] = [(b.x + b.width // 2, b.building_top + 5) for b in city.buildings]
+
+    def run():
+        for x, y in targets:
+            city.destroy_building_area(x, y, 30)
+    return run, setup
+
+@benchmark("paint_fullscreen", iterations=50, budget_us=FRAME_BUDGET_US)
+def bench_paint_fullscreen(game):
+    """QBDraw PAINT over a whole screen broken up by ring outlines (budget: one 60 fps frame)."""
+    from qbdraw import paint
+    width, height = game.screen_width, game.screen_height
+    border = (255, 255, 255)
+    scene = pygame.Surface((width, height)).convert()
+    scene.fill((0, 0, 0))
+    for _ in range(60):
+        # Rings stay clear of the seed at (0, 0), so most of the screen is one region
+        radius = random.randint(10, 60)
+        center = (random.randrange(radius + 3, width), random.randrange(radius + 3, height))
+        pygame.draw.circle(scene, border, center, radius, 2)
+    canvas = scene.copy()
+
+    def setup():
+        canvas.blit(scene, (0, 0))
+
+    return lambda: paint(canvas, 0, 0, (0, 0, 170), border), setup
+
+@benchmark("put_xor_banana", iterations=1000)
+def bench_put_xor_banana(game):
+    """Erase-and-redraw of a moving banana with two XOR PUTs instead of a scene repaint."""
+    from graphics import banana_ega_data
+    from qbdraw import ImageBuffer, put_image
+    image = ImageBuffer.from_ega(banana_ega_data["Left"], game.screen)
+    x, y = game.gorilla1.x, game.gorilla1.y - 60
+
+    def run():
+        put_image(game.screen, x, y, image, "XOR")
+        put_image(game.screen, x + 3, y - 2, image, "XOR")
+    return run, None
+
+def run_case(game, name: str, iterations: int) -> dict:
+    """Times one registered benchmark, returning per-call statistics in microseconds."""
+    factory = BENCHMARKS[name][0]
+    random.seed(SEED)
+    run, setup = factory(game)
+
+    for _ in range(max(1, iterations // 10)):  # warm-up
+        if setup:
+            setup()
+        run()
+
+    samples = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1e6)
+
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "median_us": statistics.median(samples),
+        "min_us": samples[0],
+        "p90_us": samples[int(0.9 * (len(samples) - 1))],
+    }
+
+def make_game():
+    """Builds a seeded Game on the dummy display."""
+    random.seed(SEED)
+    from game import Game
+    game = Game(background_assets=False)
+    game.render()
+    return game
+
+def compare(results: dict, baseline: dict, threshold: float, stat: str = "median_us") -> list:
+    """Returns (name, baseline_us, current_us, ratio) for every case slower than threshold allows."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        ratio = current[stat] / base[stat] if base[stat] else 1.0
+        if ratio > 1.0 + threshold:
+            regressions.append((name, base[stat], current[stat], ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Gorilla hot-path benchmarks")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown (0.15 = 15%%)")
+    parser.add_argument("--stat", default="median_us", choices=("median_us", "min_us", "p90_us"),
+                        help="statistic compared against the baseline (min_us is steadier on noisy machines)")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply iteration counts")
+    args = parser.parse_args()
+
+    game = make_game()
+    results = {}
+    print(f"{'case':<24}{'median us':>12}{'min us':>12}{'p90 us':>12}{'budget':>16}")
+    for name, (_, iterations, budget_us) in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        stats = run_case(game, name, max(1, int(iterations * args.scale)))
+        budget = ""
+        if budget_us:
+            stats["budget_us"] = budget_us
+            stats["within_budget"] = stats["median_us"] <= budget_us
+            budget = f"{'PASS' if stats['within_budget'] else 'FAIL'} {budget_us:.0f}"
+        results[name] = stats
+        print(f"{name:<24}{stats['median_us']:>12.1f}{stats['min_us']:>12.1f}{stats['p90_us']:>12.1f}{budget:>16}")
+
+    report = {
+        "meta": {
+            "seed": SEED,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    status = 0
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            status = 2
+        else:
+            with open(args.baseline) as f:
+                regressions = compare(results, json.load(f), args.threshold, args.stat)
+            for name, base, cur, ratio in regressions:
+                print(f"REGRESSION {name}: {base:.1f}us -> {cur:.1f}us ({ratio:.2f}x)")
+            if regressions:
+                status = 1
+            else:
+                print(f"No regressions beyond {args.threshold:.0%}")
+
+    over_budget = [(name, stats) for name, stats in results.items() if stats.get("within_budget") is False]
+    for name, stats in over_budget:
+        print(f"OVER BUDGET {name}: {stats['median_us']:.1f}us > {stats['budget_us']:.1f}us")
+    if over_budget:
+        status = max(status, 1)
+
+    pygame.quit()
+    sys.exit(status)
+
+if __name__ == '__main__':
+    main()
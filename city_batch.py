@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+NumPy-backed batch version of CityScape.generate_buildings.
+
+generate_cities() runs the original GORILLA.BAS skyline algorithm (slope
+type, width fn_ran(37)+37, height steps, color choice) for thousands of
+cities in one vectorized call and returns them as arrays instead of Building
+objects. Rows convert back into a CityScape only when asked for.
+
+The random numbers come from a numpy.random.Generator instead of the
+`random` module, so a batch does not reproduce CityScape's cities for the same
+seed; it reproduces its own cities for the same seed and follows the same rules.
+
+    batch = generate_cities(10000, 1280, 720, seed=1)
+    batch.height[42, :batch.count[42]]     # building heights of city 42
+    city = batch.cityscape(42)             # CityScape, windows generated now
+"""
+
+import random
+import numpy as np
+from cityscape import Building, CityScape
+from utils import BUILDING_COLORS
+
+class CityBatch:
+    """
+    Cities stored column-wise: x, width, height and color are (n, max_buildings)
+    int arrays, valid up to count[i] for city i (padding is zero).
+    """
+
+    def __init__(self, screen_width: int, screen_height: int, x, width, height, color, count, slope, seed):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.x = x
+        self.width = width
+        self.height = height
+        self.color = color
+        self.count = count
+        self.slope = slope
+        self.seed = seed
+
+    def __len__(self):
+        return len(self.count)
+
+    def buildings(self, index: int) -> list:
+        """
+        City `index` as Building objects. Windows are generated here, seeded from
+        (batch seed, index) so the same row always produces the same windows.
+        """
+        n = int(self.count[index])
+        state = random.getstate()
+        random.seed(f"{self.seed}:{index}")
+        try:
+            return [Building(int(self.x[index, i]), int(self.width[index, i]), int(self.height[index, i]),
+                             BUILDING_COLORS[self.color[index, i]], self.screen_height)
+                    for i in range(n)]
+        finally:
+            random.setstate(state)
+
+    def cityscape(self, index: int, cityscape: CityScape = None) -> CityScape:
+        """Fills `cityscape` (or a new one) with city `index` and returns it."""
+        if cityscape is None:
+            cityscape = CityScape(self.screen_width, self.screen_height, generate=False)
+        cityscape.set_buildings(self.buildings(index))
+        return cityscape
+
+def generate_cities(n: int, screen_width: int, screen_height: int, seed=None) -> CityBatch:
+    """
+    Generates `n` cities at once with the CityScape.generate_buildings rules.
+
+    :param n: Number of cities.
+    :param screen_width: Screen width in pixels.
+    :param screen_height: Screen height in pixels.
+    :param seed: Seed for numpy.random.default_rng.
+    """
+    rng = np.random.default_rng(seed)
+    ground_level = screen_height - 50
+    # narrowest building is 38 wide plus the 2 pixel gap
+    max_buildings = (screen_width - 22) // 40 + 1
+
+    slope = rng.integers(1, 7, size=n)                                   # fn_ran(6)
+    widths = rng.integers(1, 38, size=(n, max_buildings)) + 37           # fn_ran(37) + 37
+    extra = rng.integers(1, 121, size=(n, max_buildings))                # fn_ran(120)
+    color = rng.integers(0, 4, size=(n, max_buildings))                  # fn_ran(4) - 1
+
+    # x of each building: 2, then previous x + width + 2
+    x = np.empty_like(widths)
+    x[:, 0] = 2
+    np.cumsum(widths[:, :-1] + 2, axis=1, out=x[:, 1:])
+    x[:, 1:] += 2
+    valid = x < screen_width - 20
+    count = valid.sum(axis=1)
+
+    # last building is clipped to the screen edge
+    overflow = valid & (x + widths > screen_width)
+    widths = np.where(overflow, screen_width - x - 2, widths)
+
+    # initial height and step per slope type (upward, downward, V, inverted V)
+    upward = (slope == 1) | ((slope >= 3) & (slope <= 5))
+    start = np.where(upward, 15, 130)[:, None]
+    step = np.where(upward, 10, -10)[:, None]
+
+    right_half = x > screen_width // 2
+    linear = ((slope == 1) | (slope == 2))[:, None]
+    v_shape = ((slope >= 3) & (slope <= 5))[:, None]
+    increment = np.where(linear, step,
+                np.where(v_shape, np.where(right_half, -2 * step, 2 * step),
+                                  np.where(right_half, 2 * step, -2 * step)))
+    new_height = start + np.cumsum(increment, axis=1)
+
+    height = np.clip(extra + new_height, 10, ground_level - 50)
+
+    x = np.where(valid, x, 0)
+    widths = np.where(valid, widths, 0)
+    height = np.where(valid, height, 0)
+    color = np.where(valid, color, 0)
+    return CityBatch(screen_width, screen_height, x, widths, height, color, count, slope, seed)
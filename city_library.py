@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Pre-generated city library for the Gorilla game.
+
+A library is one binary file holding many cities for a given resolution, so
+Game.reset can load a city instead of generating it, and test levels can be
+shared and reproduced exactly. The file is memory-mapped and any city is
+located through an offset table in O(1).
+
+File layout (little endian):
+
+    header   4s magic "GCTY", u16 version, u16 screen_width, u16 screen_height,
+             u16 reserved, u32 count
+    offsets  (count + 1) x u64, byte offset of each city record (last = end of file)
+    record   u16 building count, then per building:
+               u16 x, u16 width, u16 height, u8 color index (utils.BUILDING_COLORS),
+               u8 window columns, u8 window rows,
+               packed window bits (Building.window_bits: column-major, LSB first,
+               (cols*rows+7)//8 bytes)
+
+Usage:
+    python city_library.py build cities.gcl --count 10000 --width 1280 --height 720 --seed 0
+    python city_library.py info cities.gcl
+    python game.py --city-library cities.gcl
+"""
+
+import argparse
+import mmap
+import random
+import struct
+from cityscape import Building, CityScape
+from utils import BUILDING_COLORS
+
+MAGIC = b"GCTY"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHI")
+OFFSET = struct.Struct("<Q")
+COUNT = struct.Struct("<H")
+BUILDING = struct.Struct("<HHHBBB")
+
+def encode_city(buildings: list) -> bytes:
+    """Serializes one city's buildings into a record."""
+    parts = [COUNT.pack(len(buildings))]
+    for b in buildings:
+        parts.append(BUILDING.pack(b.x, b.width, b.height, BUILDING_COLORS.index(b.color),
+                                   b.window_cols, b.window_rows))
+        parts.append(bytes(b.window_bits))
+    return b"".join(parts)
+
+def build_library(path: str, count: int, screen_width: int, screen_height: int, seed: int = 0) -> None:
+    """
+    Generates `count` cities with CityScape (city i seeded with seed + i) and writes the library.
+    """
+    city = CityScape(screen_width, screen_height, generate=False)
+    records = []
+    for i in range(count):
+        random.seed(seed + i)
+        city.generate_buildings()
+        records.append(encode_city(city.buildings))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, screen_width, screen_height, 0, count))
+        offset = HEADER.size + OFFSET.size * (count + 1)
+        for record in records:
+            f.write(OFFSET.pack(offset))
+            offset += len(record)
+        f.write(OFFSET.pack(offset))
+        for record in records:
+            f.write(record)
+
+class CityLibrary:
+    """
+    Memory-mapped, read-only view of a city library file.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.screen_width, self.screen_height, _, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} city library")
+
+    def __len__(self):
+        return self.count
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def records(self, index: int) -> list:
+        """
+        Raw building records of city `index`:
+        [(x, width, height, color_index, cols, rows, window_bits), ...]
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        pos = OFFSET.unpack_from(self._map, HEADER.size + OFFSET.size * index)[0]
+        (n,) = COUNT.unpack_from(self._map, pos)
+        pos += COUNT.size
+        out = []
+        for _ in range(n):
+            x, width, height, color, cols, rows = BUILDING.unpack_from(self._map, pos)
+            pos += BUILDING.size
+            nbytes = (cols * rows + 7) // 8
+            out.append((x, width, height, color, cols, rows, self._map[pos:pos + nbytes]))
+            pos += nbytes
+        return out
+
+    def buildings(self, index: int) -> list:
+        """City `index` as Building objects."""
+        return [Building(x, width, height, BUILDING_COLORS[color], self.screen_height, window_bits=bits)
+                for x, width, height, color, cols, rows, bits in self.records(index)]
+
+    def load(self, index: int, cityscape: CityScape = None) -> CityScape:
+        """
+        Fills `cityscape` (or a new one) with city `index` and returns it.
+        """
+        if cityscape is None:
+            cityscape = CityScape(self.screen_width, self.screen_height, generate=False)
+        elif (cityscape.screen_width, cityscape.screen_height) != (self.screen_width, self.screen_height):
+            raise ValueError("city library resolution does not match the cityscape")
+        cityscape.set_buildings(self.buildings(index))
+        return cityscape
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect a Gorilla city library")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="pre-generate cities into a library file")
+    build.add_argument("path")
+    build.add_argument("--count", type=int, default=1000)
+    build.add_argument("--width", type=int, default=1280)
+    build.add_argument("--height", type=int, default=720)
+    build.add_argument("--seed", type=int, default=0)
+    info = sub.add_parser("info", help="print library header")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_library(args.path, args.count, args.width, args.height, args.seed)
+        print(f"Wrote {args.count} cities ({args.width}x{args.height}) to {args.path}")
+    else:
+        library = CityLibrary(args.path)
+        sizes = [len(library.records(i)) for i in range(len(library))]
+        buildings = f", {min(sizes)}-{max(sizes)} buildings per city" if sizes else ""
+        print(f"{len(library)} cities, {library.screen_width}x{library.screen_height}{buildings}")
+        library.close()
+
+if __name__ == '__main__':
+    main()
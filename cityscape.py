@@ -9,8 +9,24 @@ from utils import BUILDING_COLORS, WINDOW_COLOR_LIT, WINDOW_COLOR_DARK, fn_ran
 class Building:
     """
     Represents a single building with windows.
+
+    Windows are packed one bit per window (column-major, LSB first) into a
+    bytearray; window sizes and spacing are class-level constants.
     """
-    def __init__(self, x: int, width: int, height: int, color: tuple, screen_height: int):
+    __slots__ = ("x", "width", "height", "color", "screen_height", "building_top",
+                 "window_cols", "window_rows", "window_bits")
+
+    # Window dimensions and spacing
+    WINDOW_WIDTH = 6
+    WINDOW_HEIGHT = 10
+    WINDOW_SPACING_X = 10
+    WINDOW_SPACING_Y = 15
+
+    def __init__(self, x: int, width: int, height: int, color: tuple, screen_height: int, window_bits=None):
+        """
+        :param window_bits: Prebuilt packed window bits (e.g. from a city library) matching this
+                            building's window grid. If None, windows are randomly generated.
+        """
         self.x = x
         self.width = width
         self.height = height
@@ -18,57 +34,86 @@ class Building:
         self.screen_height = screen_height
         self.building_top = self.screen_height - self.height - 50
 
-        # Window dimensions and spacing
-        self.window_width = 6
-        self.window_height = 10
-        self.window_spacing_x = 10
-        self.window_spacing_y = 15
-        self.window_map = []
-        self.generate_windows()
+        if window_bits is None:
+            self.generate_windows()
+        else:
+            self.window_cols, self.window_rows = self.window_grid()
+            if len(window_bits) != (self.window_cols * self.window_rows + 7) // 8:
+                raise ValueError("window_bits does not match the building's window grid")
+            self.window_bits = bytearray(window_bits)
+
+    def window_grid(self) -> tuple:
+        """(columns, rows) of windows that fit the building at its current height."""
+        # Skip windows if building height too small
+        if self.height < self.WINDOW_HEIGHT + 5:
+            return 0, 0
+        cols = len(range(self.x + 3, self.x + self.width - self.WINDOW_WIDTH, self.WINDOW_SPACING_X))
+        # every row in this range lies within the building, whatever its height
+        rows = len(range(self.building_top + 5, self.screen_height - 50 - self.WINDOW_HEIGHT, self.WINDOW_SPACING_Y))
+        return cols, rows
 
     def generate_windows(self):
         """
         Re-generates window map according to updated building height after explosion.
         Ensures no windows appear in destroyed areas.
         """
-        self.window_map.clear()
-
-        # Skip windows if building height too small
-        if self.height < self.window_height + 5:
-            return
-
-        for wx in range(self.x + 3, self.x + self.width - self.window_width, self.window_spacing_x):
-            column = []
-            for wy in range(self.building_top + 5, self.screen_height - 50 - self.window_height, self.window_spacing_y):
-                if wy < self.building_top + self.height:  # Only generate windows within new height
-                    column.append(fn_ran(4) != 1)
-            self.window_map.append(column)
-
-
-    def draw(self, screen: pygame.Surface):
+        self.window_cols, self.window_rows = self.window_grid()
+        count = self.window_cols * self.window_rows
+        bits = bytearray((count + 7) // 8)
+        for i in range(count):
+            if fn_ran(4) != 1:
+                bits[i >> 3] |= 1 << (i & 7)
+        self.window_bits = bits
+
+    def is_lit(self, col: int, row: int) -> bool:
+        """True if the window at (col, row) is lit."""
+        i = col * self.window_rows + row
+        return bool(self.window_bits[i >> 3] & (1 << (i & 7)))
+
+    @property
+    def window_map(self) -> list:
+        """Windows unpacked as a list of columns of lit flags (for inspection and tools)."""
+        return [[self.is_lit(c, r) for r in range(self.window_rows)] for c in range(self.window_cols)]
+
+    def draw(self, screen: pygame.Surface, lit_color=WINDOW_COLOR_LIT):
         """
         Draws the building and its windows.
+
+        :param lit_color: Color of lit windows; an indexed screen passes its own palette
+                          entry (see palette.LIT_WINDOW_INDEX).
         """
         pygame.draw.rect(screen, self.color, (self.x, self.building_top, self.width, self.height))
 
-        for col_idx, column in enumerate(self.window_map):
-            wx = self.x + 3 + col_idx * self.window_spacing_x
-            for row_idx, lit in enumerate(column):
-                wy = self.building_top + 5 + row_idx * self.window_spacing_y
-                color = WINDOW_COLOR_LIT if lit else WINDOW_COLOR_DARK
-                pygame.draw.rect(screen, color, (wx, wy, self.window_width, self.window_height))
+        bits = self.window_bits
+        rows = self.window_rows
+        i = 0
+        for col_idx in range(self.window_cols):
+            wx = self.x + 3 + col_idx * self.WINDOW_SPACING_X
+            for row_idx in range(rows):
+                wy = self.building_top + 5 + row_idx * self.WINDOW_SPACING_Y
+                color = lit_color if bits[i >> 3] & (1 << (i & 7)) else WINDOW_COLOR_DARK
+                pygame.draw.rect(screen, color, (wx, wy, self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+                i += 1
 
 
 class CityScape:
     """
     Cityscape generation based on original QB GORILLA.BAS logic.
     """
-    def __init__(self, screen_width: int, screen_height: int, num_buildings: int = 10):
+    def __init__(self, screen_width: int, screen_height: int, num_buildings: int = 10, generate: bool = True):
+        """
+        :param generate: If False, start with no buildings (e.g. to fill from a city library).
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.num_buildings = num_buildings
         self.buildings = []
-        self.generate_buildings()
+        if generate:
+            self.generate_buildings()
+
+    def set_buildings(self, buildings: list) -> None:
+        """Replaces the current city with prebuilt Building objects."""
+        self.buildings[:] = buildings
 
     def generate_buildings(self):
         """
@@ -124,15 +169,17 @@ class CityScape:
             x += b_width + 2
             cur_building += 1
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, lit_color=WINDOW_COLOR_LIT):
         """
         Draws cityscape onto the screen.
+
+        :param lit_color: Color of lit windows (see Building.draw).
         """
         # Draw ground
         pygame.draw.rect(screen, (50, 50, 50), (0, self.screen_height - 50, self.screen_width, 50))
         # Draw buildings
         for building in self.buildings:
-            building.draw(screen)
+            building.draw(screen, lit_color)
 
     def get_building_positions(self):
         """
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+"""
+Collision records for the Gorilla game.
+"""
+
+import pygame
+
+class CollisionObject:
+    """
+    A named collision target (sun, gorilla1, gorilla2, ground, building).
+    Slotted, since a batch simulation can hold thousands of these.
+    """
+    __slots__ = ("name", "rect")
+
+    def __init__(self, name: str, rect: pygame.Rect):
+        self.name = name
+        self.rect = rect
+
+    def __repr__(self):
+        return f"CollisionObject({self.name!r}, {self.rect!r})"
@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+"""
+Gym-style environment around the Gorilla game, for training throwing policies.
+
+GorillaEnv plays the same rules as Game (city generation, throw jitter, wind,
+banana flight, demolition) without a window, events or real-time delays: one
+step() flies a whole throw to its impact.
+
+    env = GorillaEnv(seed=1)
+    obs = env.reset()
+    obs, reward, done, info = env.step((45.0, 60.0))   # (angle, power)
+
+VectorGorillaEnv steps N independent matches per call, spread over a pool of
+worker processes, and resets finished matches automatically.
+"""
+
+import os
+import random
+import multiprocessing
+import pygame
+from banana import Banana
+from cityscape import CityScape
+from collision import CollisionObject
+from physics import throw_velocity_kmph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class GorillaEnv:
+    """
+    Single headless match. Players alternate; every step is one throw by the
+    player whose turn it is, and the reward is from that thrower's point of view:
+    +1 for hitting the opponent, -1 for hitting itself, 0 otherwise.
+    """
+
+    def __init__(
+        self,
+        screen_width: int = 1280,
+        screen_height: int = 720,
+        dt: float = 1 / 60,
+        max_throws: int = 50,
+        angle_jitter: float = 5.0,
+        power_jitter: float = 5.0,
+        wind_range: float = 2.0,
+        skyline_bins: int = 64,
+        integrator: str = "closed_form",
+        seed=None
+    ):
+        """
+        :param screen_width: Playfield width (same meaning as Game.screen_width).
+        :param screen_height: Playfield height.
+        :param dt: Flight simulation step in seconds.
+        :param max_throws: Match ends in a draw after this many throws.
+        :param angle_jitter: Uniform +/- degrees added to every throw (Game uses 5).
+        :param power_jitter: Uniform +/- km/h added to every throw (Game uses 5).
+        :param wind_range: Wind is drawn from uniform(-wind_range, wind_range) m/s^2 (Game uses 2).
+        :param skyline_bins: Number of columns in the skyline observation.
+        :param integrator: Banana integrator (see physics.INTEGRATOR_NAMES).
+        :param seed: Seed for the first reset.
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.dt = dt
+        self.max_throws = max_throws
+        self.angle_jitter = angle_jitter
+        self.power_jitter = power_jitter
+        self.wind_range = wind_range
+        self.skyline_bins = skyline_bins
+        self.integrator = integrator
+        self.seed = seed
+
+        self.bounds = pygame.Rect(0, 0, screen_width, screen_height)
+        self.rng = random.Random(seed)
+        self.cityscape = None
+        self.gorillas = [(0, 0), (0, 0)]
+        self.collision_objects = []
+        self.turn = 0
+        self.wind = 0.0
+        self.throws = 0
+        self.done = True
+
+    def reset(self, seed=None):
+        """
+        Starts a new match and returns the first observation.
+
+        :param seed: Optional seed for this and the following matches.
+        """
+        if seed is not None:
+            self.seed = seed
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+            self.seed = None  # later resets continue the sequence
+
+        # The city draws from the global `random` module (utils.fn_ran), which every
+        # env in the process shares; seed it from this match's rng for the call so
+        # the city does not depend on how the other envs stepped
+        state = random.getstate()
+        random.seed(self.rng.getrandbits(64))
+        try:
+            if self.cityscape is None:
+                self.cityscape = CityScape(self.screen_width, self.screen_height)
+            else:
+                self.cityscape.generate_buildings()
+        finally:
+            random.setstate(state)
+        self._place_gorillas()
+        self.turn = 0
+        self.throws = 0
+        self.wind = self.rng.uniform(-self.wind_range, self.wind_range)
+        self.done = False
+        return self.observation()
+
+    def _place_gorillas(self):
+        """Same placement and hitboxes as Game (second and second-to-last building)."""
+        positions = self.cityscape.get_building_positions()
+        self.gorillas = [(positions[1][0] + 20, positions[1][1] - 30),
+                         (positions[-2][0] + 20, positions[-2][1] - 30)]
+        self.collision_objects = [
+            CollisionObject("sun", pygame.Rect(self.screen_width // 2 - 22, 25 - 18, 44, 36)),
+            CollisionObject("gorilla1", pygame.Rect(self.gorillas[0][0] - 15, self.gorillas[0][1], 30, 40)),
+            CollisionObject("gorilla2", pygame.Rect(self.gorillas[1][0] - 15, self.gorillas[1][1], 30, 40)),
+            CollisionObject("ground", pygame.Rect(0, self.screen_height - 50, self.screen_width, 50)),
+        ]
+        for b in self.cityscape.buildings:
+            self.collision_objects.append(CollisionObject("building", pygame.Rect(b.x, b.building_top, b.width, b.height)))
+        # flat copies for the C-level Rect.collidelist probe in _fly
+        self._rects = [obj.rect for obj in self.collision_objects]
+        self._names = [obj.name for obj in self.collision_objects]
+
+    def observation(self) -> dict:
+        """
+        :return: {"skyline": building height per column (skyline_bins values),
+                  "gorillas": [[x1, y1], [x2, y2]], "wind": m/s^2, "turn": 0 or 1}
+                 as float32 NumPy arrays when NumPy is available, lists otherwise.
+        """
+        skyline = [0.0] * self.skyline_bins
+        column = self.screen_width / self.skyline_bins
+        for b in self.cityscape.buildings:
+            first = int(b.x / column)
+            last = min(self.skyline_bins - 1, int((b.x + b.width - 1) / column))
+            for i in range(first, last + 1):
+                skyline[i] = max(skyline[i], float(b.height))
+        gorillas = [list(map(float, g)) for g in self.gorillas]
+        if np is not None:
+            skyline = np.asarray(skyline, dtype=np.float32)
+            gorillas = np.asarray(gorillas, dtype=np.float32)
+        return {"skyline": skyline, "gorillas": gorillas, "wind": self.wind, "turn": self.turn}
+
+    def step(self, action):
+        """
+        Throws for the current player.
+
+        :param action: (angle_deg, power) with the ThrowController's ranges (10..80, 0..100).
+        :return: (observation, reward, done, info); info has "result" (collision name or "miss"),
+                 "impact" (x, y), "thrower" and "throws".
+        """
+        if self.done:
+            raise RuntimeError("step() called on a finished match; call reset()")
+        angle, power = action
+        thrower = self.turn
+        x, y = self.gorillas[thrower]
+
+        angle += self.rng.uniform(-self.angle_jitter, self.angle_jitter)
+        velocity = throw_velocity_kmph(power, self.screen_width,
+                                       jitter=self.rng.uniform(-self.power_jitter, self.power_jitter))
+        if thrower == 1:
+            angle, velocity = -angle, -velocity
+        banana = Banana(x, y, angle, velocity_kmph=velocity, gravity_mps2=9.8, wind_mps2=self.wind,
+                        integrator=self.integrator)
+
+        result = self._fly(banana)
+        self.throws += 1
+        self.turn = 1 - thrower
+        self.wind = self.rng.uniform(-self.wind_range, self.wind_range)
+
+        reward = 0.0
+        if result in ("gorilla1", "gorilla2"):
+            hit = 0 if result == "gorilla1" else 1
+            reward = -1.0 if hit == thrower else 1.0
+            self.done = True
+        elif self.throws >= self.max_throws:
+            self.done = True
+
+        info = {"result": result, "impact": (banana.x, banana.y), "thrower": thrower, "throws": self.throws}
+        return self.observation(), reward, self.done, info
+
+    def _fly(self, banana: Banana, max_steps: int = 5000) -> str:
+        """
+        Advances the banana to its impact, applying the same outcomes as Game.update.
+        Equivalent to Banana.check_collision (first hit in list order), but done with a
+        1x1 probe rect and Rect.collidelist, which is several times faster.
+        """
+        width, height = self.screen_width, self.screen_height
+        probe = pygame.Rect(0, 0, 1, 1)
+        for _ in range(max_steps):
+            banana.update(self.dt, width, height)
+            probe.x, probe.y = int(banana.x), int(banana.y)
+            index = probe.collidelist(self._rects)
+            if index >= 0:
+                result = self._names[index]
+            elif not self.bounds.colliderect(probe):
+                result = "boundary"
+            else:
+                result = "none"
+            if result in ("none", "sun"):
+                if not banana.alive:
+                    return "miss"
+                continue
+            if result == "boundary":
+                if banana.y <= 0 and 0 <= banana.x <= width:
+                    continue  # flying high, it will come back
+                return "miss"
+            if result == "building":
+                self.cityscape.destroy_building_area(banana.x, banana.y, 30)
+                self._place_gorillas()
+            return result
+        return "miss"
+
+def _step_shard(envs: list, actions: list) -> list:
+    """Steps a list of matches, auto-resetting finished ones."""
+    out = []
+    for env, action in zip(envs, actions):
+        obs, reward, done, info = env.step(action)
+        if done:
+            info["terminal_observation"] = obs
+            obs = env.reset()
+        out.append((obs, reward, done, info))
+    return out
+
+def _worker(conn, seeds: list, env_kwargs: dict) -> None:
+    """Worker process loop: owns one shard of matches and serves reset/step commands."""
+    envs = [GorillaEnv(seed=seed, **env_kwargs) for seed in seeds]
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "step":
+                conn.send(_step_shard(envs, payload))
+            elif command == "reset":
+                conn.send([env.reset() for env in envs])
+            else:
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+class VectorGorillaEnv:
+    """
+    N independent GorillaEnv matches stepped together.
+
+    With processes > 1 the matches are split into one shard per worker process;
+    each worker keeps its matches alive between calls, so only actions and
+    results cross the process boundary. Finished matches reset automatically
+    (the final observation is in info["terminal_observation"]).
+    """
+
+    def __init__(self, num_envs: int, processes: int = None, seed: int = None, **env_kwargs):
+        """
+        :param num_envs: Number of matches.
+        :param processes: Worker processes (None = os.cpu_count(), 0 or 1 = step in this process).
+        :param seed: Base seed; match i uses seed + i.
+        :param env_kwargs: Passed to every GorillaEnv.
+        """
+        self.num_envs = num_envs
+        seeds = [None if seed is None else seed + i for i in range(num_envs)]
+        if processes is None:
+            processes = os.cpu_count() or 1
+        self.processes = max(1, min(processes, num_envs))
+
+        self.envs = None
+        self._conns = []
+        self._procs = []
+        if self.processes == 1:
+            self.envs = [GorillaEnv(seed=s, **env_kwargs) for s in seeds]
+            return
+
+        size = -(-num_envs // self.processes)
+        self._shards = [seeds[i:i + size] for i in range(0, num_envs, size)]
+        for shard in self._shards:
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_worker, args=(child, shard, env_kwargs), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+
+    def __len__(self):
+        return self.num_envs
+
+    def reset(self) -> list:
+        if self.envs is not None:
+            return [env.reset() for env in self.envs]
+        for conn in self._conns:
+            conn.send(("reset", None))
+        return [obs for conn in self._conns for obs in conn.recv()]
+
+    def step(self, actions) -> tuple:
+        """
+        :param actions: One (angle, power) per match.
+        :return: (observations, rewards, dones, infos), each a list of length N.
+        """
+        actions = list(actions)
+        if self.envs is not None:
+            results = _step_shard(self.envs, actions)
+        else:
+            start = 0
+            for conn, shard in zip(self._conns, self._shards):
+                conn.send(("step", actions[start:start + len(shard)]))
+                start += len(shard)
+            results = [r for conn in self._conns for r in conn.recv()]
+        return ([r[0] for r in results], [r[1] for r in results],
+                [r[2] for r in results], [r[3] for r in results])
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for proc in self._procs:
+            proc.join(timeout=1)
+        self._conns, self._procs = [], []
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Per-frame phase timing for the Gorilla game.
+
+Game.run marks the end of each phase (events, update, render, flip) and the
+durations land in a fixed-size ring buffer, so recording never allocates.
+The raw samples can be read back or exported as CSV, and a toggleable overlay
+shows frame-time percentiles plus a sparkline of recent frames.
+"""
+
+import time
+from array import array
+import pygame
+
+PHASES = ("events", "update", "render", "flip")
+
+class FrameTimer:
+    """
+    Ring buffer of per-phase frame timings (seconds).
+
+    Each row holds one duration per phase, the total of the phases ("work")
+    and the interval since the previous frame started ("frame").
+    """
+
+    def __init__(self, capacity: int = 600, phases: tuple = PHASES):
+        """
+        :param capacity: Number of frames kept.
+        :param phases: Phase names, in the order Game.run reaches them.
+        """
+        self.capacity = capacity
+        self.phases = tuple(phases)
+        self.columns = self.phases + ("work", "frame")
+        self._width = len(self.columns)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._buffer = array("d", [0.0]) * (capacity * self._width)
+        self._row = 0          # next row to write
+        self.count = 0         # rows written so far (capped at capacity)
+        self._frame_start = None
+        self._last = 0.0
+
+        # overlay cache
+        # Extra overlay lines: label -> callable returning {50: s, 95: s, 99: s},
+        # called only when the overlay is re-rendered
+        self.extra_percentiles = {}
+        self._font = None
+        self._font_size = None
+        self._overlay = None
+        self._overlay_age = 0
+
+    def begin_frame(self) -> None:
+        """Starts a new frame row."""
+        now = time.perf_counter()
+        base = self._row * self._width
+        for i in range(self._width):
+            self._buffer[base + i] = 0.0
+        if self._frame_start is not None:
+            self._buffer[base + self._width - 1] = now - self._frame_start
+        self._frame_start = now
+        self._last = now
+
+    def lap(self, phase: str) -> None:
+        """Records the time since the previous mark as `phase`."""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        base = self._row * self._width
+        self._buffer[base + self._index[phase]] += elapsed
+        self._buffer[base + self._width - 2] += elapsed
+
+    def end_frame(self) -> None:
+        """Commits the current row."""
+        self._row = (self._row + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def samples(self, column: str = None) -> list:
+        """
+        Returns the recorded rows, oldest first. With `column`, returns just that
+        column's values; otherwise a list of tuples in self.columns order.
+        """
+        start = (self._row - self.count) % self.capacity
+        rows = []
+        for n in range(self.count):
+            base = ((start + n) % self.capacity) * self._width
+            rows.append(tuple(self._buffer[base:base + self._width]))
+        if column is not None:
+            i = self._index[column]
+            return [row[i] for row in rows]
+        return rows
+
+    def percentiles(self, column: str = "work", points=(50, 95, 99)) -> dict:
+        """Returns {percentile: seconds} for a column over the recorded frames."""
+        values = sorted(self.samples(column))
+        if not values:
+            return {p: 0.0 for p in points}
+        return {p: values[min(len(values) - 1, int(p / 100 * len(values)))] for p in points}
+
+    def export_csv(self, path: str) -> None:
+        """Writes the raw samples (milliseconds) to a CSV file."""
+        import csv
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + tuple(f"{c}_ms" for c in self.columns))
+            for n, row in enumerate(self.samples()):
+                writer.writerow((n,) + tuple(f"{v * 1000:.4f}" for v in row))
+
+    def draw_overlay(self, screen: pygame.Surface, pos=(10, 100), refresh_frames: int = 15,
+                     scale: float = 1.0) -> None:
+        """
+        Blits the stats overlay. The overlay surface is only re-rendered every
+        `refresh_frames` calls, so showing it costs one blit most frames.
+
+        :param pos: Top-left corner, in unscaled pixels.
+        :param scale: Size of the overlay (and its position) relative to a 720-row screen.
+        """
+        self._overlay_age -= 1
+        if self._overlay is None or self._overlay_age <= 0:
+            self._overlay = self._render_overlay(scale)
+            if screen.get_bitsize() == 8:
+                # SDL cannot alpha-blend into an indexed screen (see palette.py)
+                from palette import index_sprite
+                self._overlay = index_sprite(self._overlay)
+            self._overlay_age = refresh_frames
+        screen.blit(self._overlay, (round(pos[0] * scale), round(pos[1] * scale)))
+
+    def _render_overlay(self, scale: float = 1.0) -> pygame.Surface:
+        font_size = round(20 * scale)
+        if self._font is None or self._font_size != font_size:
+            self._font = pygame.font.Font(None, font_size)
+            self._font_size = font_size
+        rows = [(column, self.percentiles(column)) for column in self.columns]
+        rows += [(label, source()) for label, source in self.extra_percentiles.items()]
+        lines = []
+        for column, pct in rows:
+            lines.append(f"{column:<7} p50 {pct[50] * 1000:6.2f}  p95 {pct[95] * 1000:6.2f}  p99 {pct[99] * 1000:6.2f} ms")
+
+        spark_w, spark_h, line_h, margin = (round(n * scale) for n in (240, 40, 16, 5))
+        texts = [self._font.render(text, True, (255, 255, 255)) for text in lines]
+        width = max([spark_w] + [text.get_width() for text in texts])
+        surf = pygame.Surface((width + 2 * margin, len(lines) * line_h + spark_h + 3 * margin), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 160))
+        for i, text in enumerate(texts):
+            surf.blit(text, (margin, margin + i * line_h))
+
+        # sparkline of the last spark_w frames' work time, 16.7ms budget line in red
+        top = len(lines) * line_h + 2 * margin
+        values = self.samples("work")[-spark_w:]
+        y_scale = spark_h / max(1 / 30, max(values, default=0))
+        budget_y = top + spark_h - int((1 / 60) * y_scale)
+        pygame.draw.line(surf, (255, 85, 85), (margin, budget_y), (margin + spark_w, budget_y))
+        if len(values) > 1:
+            points = [(margin + i, top + spark_h - int(v * y_scale)) for i, v in enumerate(values)]
+            pygame.draw.lines(surf, (85, 255, 85), False, points)
+        return surf
@@ -6,37 +6,110 @@ Now integrates:
 2. Multi-message UI support
 """
 
+import time
+# Process start, for the startup report (taken before the pygame import on purpose)
+_LAUNCHED_AT = time.perf_counter()
+
 import pygame
 import random
 import math
 from gorilla import Gorilla
 from banana import Banana
 from cityscape import CityScape
+from collision import CollisionObject
 from graphics import Graphics
-from sound import Sound
-from utils import SKY_COLOR, GROUND_COLOR, GORILLA_COLOR, SUN_COLOR
+from aim_preview import AimPreview
+from wind import draw_wind_arrow
+from trails import TrailLayer
+from frame_timer import FrameTimer
+from physics import throw_velocity_kmph
+from assets import start_loading, load_assets
+from synth import SAMPLE_RATE
+from utils import SKY_COLOR, GROUND_COLOR, GORILLA_COLOR, SUN_COLOR, EGA_RESOLUTION
 
 # (Paste ThrowController class here if not in a separate file)
 from throw_controller import ThrowController  # Example if you made a separate file
+from input_handler import InputHandler
+from palette import BASE_PALETTE, LIT_WINDOW_INDEX, PaletteEffects, index_sprite, indexed_surface
 
 class Game:
-    def __init__(self):
+    def __init__(self, city_library: str = None, background_assets: bool = True,
+                 native_ega: bool = False, window_scale: int = 2, indexed: bool = False):
+        """
+        :param city_library: Optional path to a city_library file; rounds then load a random
+                             pre-generated city instead of generating one. ValueError if
+                             it holds no cities.
+        :param background_assets: Decode sprites and load sounds on a background thread
+                                  (see assets.py) so the first frame is not held up by them.
+                                  False loads them here, without sound, for headless tools
+                                  that need identical frames from the first render.
+        :param native_ega: Play on GORILLA.BAS's own 640x350 screen: the scene is drawn
+                           into an offscreen surface of that size (self.screen) and
+                           present() scales it up to the window once per frame.
+        :param window_scale: Integer window pixels per screen pixel in native_ega mode (1 or more).
+        :param indexed: Draw into an 8-bit surface on the EGA palette and do flashes and
+                        night with palette changes (see palette.py).
+        """
+        if window_scale < 1:
+            raise ValueError(f"window_scale must be at least 1, got {window_scale}")
+        # (phase, seconds since launch) milestones; see startup_report()
+        self.startup_marks = [("imports", time.perf_counter() - _LAUNCHED_AT)]
+
+        # PC-speaker style mono mixer at the synth rate, so packed clips play as they are
+        pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=1)
         pygame.init()
-        self.screen_width, self.screen_height = 1280, 720
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        if native_ega:
+            # Game logic and drawing use render-target pixels; only present() sees the window
+            self.screen_width, self.screen_height = EGA_RESOLUTION
+            self.window = pygame.display.set_mode((self.screen_width * window_scale,
+                                                   self.screen_height * window_scale))
+        else:
+            self.screen_width, self.screen_height = 1280, 720
+            self.window = pygame.display.set_mode((self.screen_width, self.screen_height))
+        screen_size = (self.screen_width, self.screen_height)
+        # Window-format copy of an indexed screen, scaled up from by present()
+        self._present_buffer = None
+        self.palette_effects = None
+        # (source, indexed copy) of the last wind overlay blitted to an indexed screen
+        self._indexed_overlay = (None, None)
+        if indexed:
+            self.screen = indexed_surface(screen_size)
+            self.palette_effects = PaletteEffects()
+            if native_ega:
+                self._present_buffer = pygame.Surface(screen_size).convert()
+        elif native_ega:
+            self.screen = pygame.Surface(screen_size).convert()
+        else:
+            self.screen = self.window
+        # HUD text and messages are sized for 720 rows and shrink with the render target
+        self.hud_scale = self.screen_height / 720
         pygame.display.set_caption("Gorilla Game")
+        self._mark_startup("display")
 
         self.clock = pygame.time.Clock()
         self.running = True
 
-        # Graphics, sound, city init
-        self.graphics = Graphics(self.screen)
-        try:
-            self.sound = Sound()
-        except:
-            self.sound = None
-
-        self.cityscape = CityScape(self.screen_width, self.screen_height)
+        # Graphics and sound; sprites/sound are installed by _poll_assets once loaded
+        self.graphics = Graphics(self.screen, load_sprites=False, present=self.present)
+        self.sound = None
+        self.assets = None
+        if background_assets:
+            self.assets = start_loading()
+        else:
+            self._install_assets(load_assets(with_sound=False))
+
+        self.city_library = None
+        if city_library:
+            from city_library import CityLibrary
+            self.city_library = CityLibrary(city_library)
+            if not len(self.city_library):
+                self.city_library.close()
+                raise ValueError(f"{city_library} holds no cities")
+            self.cityscape = CityScape(self.screen_width, self.screen_height, generate=False)
+            self._new_city()
+        else:
+            self.cityscape = CityScape(self.screen_width, self.screen_height)
+        self._mark_startup("city")
 
         # Gorilla / Banana
         positions = self.cityscape.get_building_positions()
@@ -44,6 +117,10 @@ class Game:
         self.gorilla2 = Gorilla(positions[-2][0] + 20, positions[-2][1] - 30)
 
         self.banana = None
+        # Flight integrator (see physics.INTEGRATOR_NAMES / bench_integrators.py)
+        self.banana_integrator = "closed_form"
+        # Wind for the next throw, picked ahead of time so the aim preview can use it
+        self.wind = random.uniform(-2, 2)
 
         # Turn logic
         self.turn = 0
@@ -58,69 +135,155 @@ class Game:
         self._load_collision_objects()
         self._load_collision_buildings()
 
-        # Throw controller
+        # Input actions (filtered, motion-coalesced event queue) and the throw controller
+        self.input = InputHandler()
+        self.input.pointer_scale = window_scale if native_ega else 1
+        self.input.install()
         self.throw_controller = ThrowController()
         # 也可在此切換模式: self.throw_controller.set_input_mode("mouse")
 
+        # Spatially varying wind ([W] toggles); rebuilt whenever self.wind changes
+        self.wind_field_enabled = False
+        self.wind_field = None
+
+        # Predicted arc while aiming ([P] toggles)
+        self.aim_preview = AimPreview()
+        self.aim_preview_enabled = False
+
+        # Ghost trails of this round's throws ([T] toggles)
+        self.trails = TrailLayer(self.screen_width, self.screen_height)
+        self.ghost_trails_enabled = False
+
+        # Sky, ground and buildings, redrawn only when the city changes
+        self._background = indexed_surface(screen_size) if indexed else pygame.Surface(screen_size)
+        self._background_dirty = True
+
+        # Per-frame phase timings ([F3] toggles the overlay); other probes
+        # (e.g. alloc_tracker.AllocationTracker) can be appended to frame_probes
+        self.frame_timer = FrameTimer()
+        # Input-to-photon latency (action pickup to the flip that shows it) in the F3 overlay
+        self.frame_timer.extra_percentiles["latency"] = self.input.latency_percentiles
+        self.frame_probes = [self.frame_timer]
+        self.show_frame_stats = False
+
+        # Pause after a round ends before the new city appears
+        self.round_delay_ms = 1000
+
         # For multi-message UI
         self.ui_messages = []  # each item: (text_surface, rect, start_time, duration_ms)
+        self._mark_startup("game_state")
+
+    def _mark_startup(self, phase: str):
+        self.startup_marks.append((phase, time.perf_counter() - _LAUNCHED_AT))
+
+    def _install_assets(self, assets):
+        """Hands loaded sprites and sound (assets.LoadedAssets) to the game."""
+        self.graphics.set_sprites(assets.sprites, assets.anchors)
+        self.sound = assets.sound
+        if self.sound:
+            self.sound.play_intro()
+        self._mark_startup("assets_ready")
+
+    def _poll_assets(self):
+        """Installs the background-loaded assets once their future has resolved."""
+        if self.assets is not None and self.assets.done():
+            assets, self.assets = self.assets, None
+            self._install_assets(assets.result())
+
+    def startup_report(self) -> str:
+        """Startup milestones, with the time since launch and since the previous milestone."""
+        lines = [f"{'phase':<14}{'at ms':>9}{'+ms':>9}"]
+        previous = 0.0
+        for phase, at in sorted(self.startup_marks, key=lambda mark: mark[1]):
+            lines.append(f"{phase:<14}{at * 1000:9.1f}{(at - previous) * 1000:9.1f}")
+            previous = at
+        return "\n".join(lines)
 
     def _load_collision_objects(self):
         self.collision_objects = [
-            {
-                "name": "sun",
-                "rect": pygame.Rect(self.sun_x - 22, self.sun_y - 18, 44, 36)
-            },
-            {
-                "name": "gorilla1",
-                "rect": pygame.Rect(self.gorilla1.x - 15, self.gorilla1.y, 30, 40)
-            },
-            {
-                "name": "gorilla2",
-                "rect": pygame.Rect(self.gorilla2.x - 15, self.gorilla2.y, 30, 40)
-            }
+            CollisionObject("sun", pygame.Rect(self.sun_x - 22, self.sun_y - 18, 44, 36)),
+            CollisionObject("gorilla1", pygame.Rect(self.gorilla1.x - 15, self.gorilla1.y, 30, 40)),
+            CollisionObject("gorilla2", pygame.Rect(self.gorilla2.x - 15, self.gorilla2.y, 30, 40)),
+            CollisionObject("ground", pygame.Rect(0, self.screen_height - 50, self.screen_width, 50)),
         ]
 
     def _load_collision_buildings(self):
         for building in self.cityscape.buildings:
             rect = pygame.Rect(building.x, building.building_top, building.width, building.height)
-            self.collision_objects.append({
-                "name": "building",
-                "rect": rect
-            })
+            self.collision_objects.append(CollisionObject("building", rect))
+
+    def _new_city(self):
+        """Generates the next round's city, or loads a random one from the city library."""
+        if self.city_library is not None:
+            self.city_library.load(random.randrange(len(self.city_library)), self.cityscape)
+        else:
+            self.cityscape.generate_buildings()
 
     def run(self):
+        first_frame = True
         while self.running:
             dt = self.clock.tick(60) / 1000.0
-            if not self.handle_events():
+            if not self.frame(dt):
                 break
-            self.update(dt)
-            self.render()
+            if first_frame:
+                self._mark_startup("first_frame")
+                first_frame = False
 
         pygame.quit()
 
+    def frame(self, dt: float) -> bool:
+        """
+        Runs one frame (events, update, render, flip), reporting each phase to the frame probes.
+        Returns False when the player quit.
+        """
+        probes = self.frame_probes
+        for probe in probes:
+            probe.begin_frame()
+        if not self.handle_events():
+            return False
+        for probe in probes:
+            probe.lap("events")
+        self._poll_assets()
+        self.update(dt)
+        for probe in probes:
+            probe.lap("update")
+        self.render(flip=False)
+        for probe in probes:
+            probe.lap("render")
+        self.present()
+        self.input.frame_presented()
+        for probe in probes:
+            probe.lap("flip")
+        for probe in probes:
+            probe.end_frame()
+        return True
+
     def handle_events(self) -> bool:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for action in self.input.poll():
+            kind = action.kind
+            if kind == "quit":
                 return False
-            # Pass to throw_controller
-            self.throw_controller.handle_event(event)
-
-            # Example: if releasing SPACE or finishing mouse drag triggers banana throw
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_SPACE:
-                    # finalize banana throw
-                    angle, power = self.throw_controller.get_throw_params()
-                    if power > 1:  # avoid zero throws
-                        self.do_throw(angle, power)
-                    self.throw_controller.reset()
-
-            if event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1 and self.throw_controller.mode == "mouse":
-                    angle, power = self.throw_controller.get_throw_params()
-                    if power > 1:
-                        self.do_throw(angle, power)
-                    self.throw_controller.reset()
+            if kind == "toggle_preview":
+                self.aim_preview_enabled = not self.aim_preview_enabled
+            elif kind == "toggle_stats":
+                self.show_frame_stats = not self.show_frame_stats
+            elif kind == "toggle_trails":
+                self.ghost_trails_enabled = not self.ghost_trails_enabled
+                if not self.ghost_trails_enabled:
+                    self.trails.clear()
+            elif kind == "toggle_wind":
+                self.wind_field_enabled = not self.wind_field_enabled
+                self._rebuild_wind_field()
+            elif kind == "toggle_night":
+                if self.palette_effects:
+                    self.palette_effects.toggle_night()
+
+            # Releasing SPACE or finishing a mouse drag throws the banana
+            elif self.throw_controller.handle_action(action):
+                angle, power = self.throw_controller.get_throw_params()
+                if power > 1:  # avoid zero throws
+                    self.do_throw(angle, power)
+                self.throw_controller.reset()
 
         return True
 
@@ -135,23 +298,27 @@ class Game:
 
 
         angle += random.uniform(-5, 5)
-        power = 15 + 35 * power // 100 + random.uniform(-5, 5)
-        if 0!= (self.screen_width//640):
-            power = int(power * math.sqrt(self.screen_width//640))
+        power = throw_velocity_kmph(power, self.screen_width, jitter=random.uniform(-5, 5))
 
         # If right gorilla, angle might invert
         final_angle = angle if self.turn == 0 else -angle
         final_power = power if self.turn == 0 else -power
         print(f"final power={final_power}, angle={angle}")
 
+        # A wind field needs a stepping integrator; Verlet keeps it within a pixel
+        integrator = "verlet" if self.wind_field else self.banana_integrator
         self.banana = Banana(
             thrower_x, thrower_y,
             final_angle, velocity_kmph=final_power,
-            gravity_mps2=9.8, wind_mps2=random.uniform(-2, 2),
-            graphics=self.graphics
+            gravity_mps2=9.8, wind_mps2=self.wind,
+            graphics=self.graphics, integrator=integrator, wind_field=self.wind_field
         )
+        self.trails.begin_path((255, 255, 85) if self.turn == 0 else (85, 255, 255))
+
         # Switch turn
         self.turn = (self.turn + 1) % 2
+        self.wind = random.uniform(-2, 2)
+        self._rebuild_wind_field()
 
         # arms up
         if self.turn == 0:
@@ -167,14 +334,29 @@ class Game:
     def update(self, dt: float):
         self.throw_controller.update(dt)
 
+        if self.aim_preview_active():
+            thrower = self.gorilla1 if self.turn == 0 else self.gorilla2
+            self.aim_preview.update(
+                thrower.x, thrower.y,
+                self.throw_controller.angle, self.throw_controller.power, self.wind,
+                self.turn == 1, self.collision_objects, self.screen_width, self.screen_height,
+                wind_field=self.wind_field
+            )
+
         # Update banana
         if self.banana and self.banana.alive:
             self.banana.update(dt, self.screen_width, self.screen_height)
-            collision_result = self.banana.check_collision(self.collision_objects)
+            if self.ghost_trails_enabled:
+                self.trails.add_point(self.banana.x, self.banana.y)
+            collision_result = self.banana.check_collision(self.collision_objects, self.screen.get_rect())
             self.sun_happy = True
             if collision_result != "none":
                 self.banana.alive = False
+                if self.palette_effects and collision_result in ("gorilla1", "gorilla2", "building", "ground"):
+                    self.palette_effects.flash()
                 if collision_result == "sun":
+                    if self.palette_effects:
+                        self.palette_effects.shock()
                     self.sun_happy = False
                     print("Hit the sun!")
                     self.banana.alive = True
@@ -182,23 +364,26 @@ class Game:
                 elif collision_result == "gorilla1":
                     self.graphics.draw_explosion(self.banana.x, self.banana.y)
                     self.add_ui_message("Gorilla Richard WIN!!", duration_ms=3000)
-                    self.gorilla2.victory_dance(self.screen, self.render, self.sound.play_victory if self.sound else None, cycles=5)
-                    pygame.time.delay(1000)
+                    self.gorilla2.victory_dance(self.screen, lambda: self.render(flip=False), self.sound.play_victory if self.sound else None, cycles=5, present=self.present)
+                    pygame.time.delay(self.round_delay_ms)
                     self.reset()
                 elif collision_result == "gorilla2":
                     self.graphics.draw_explosion(self.banana.x, self.banana.y)
                     self.add_ui_message("Gorilla Loki WIN!!", duration_ms=3000)
-                    self.gorilla1.victory_dance(self.screen, self.render, self.sound.play_victory if self.sound else None, cycles=5)
-                    pygame.time.delay(1000)
+                    self.gorilla1.victory_dance(self.screen, lambda: self.render(flip=False), self.sound.play_victory if self.sound else None, cycles=5, present=self.present)
+                    pygame.time.delay(self.round_delay_ms)
                     self.reset()
                 elif collision_result == "building":
                     self.graphics.draw_explosion(self.banana.x, self.banana.y)
                     self.cityscape.destroy_building_area(self.banana.x, self.banana.y, 30)
+                    self._background_dirty = True
                     print("Banana hit building!")
                     # reload building collision
-                    self.collision_objects = [obj for obj in self.collision_objects if obj["name"] != "building"]
+                    self.collision_objects = [obj for obj in self.collision_objects if obj.name != "building"]
                     self._load_collision_buildings()
                     self.snap_gorilla_onto_building()
+                    self._rebuild_wind_field()
+                    self.aim_preview.invalidate()
 
                 elif collision_result == "ground":
                     self.graphics.draw_explosion(self.banana.x, self.banana.y)
@@ -211,6 +396,9 @@ class Game:
 
                 if self.sound and not self.banana.alive:
                     self.sound.play_explosion()
+
+            if self.banana and not self.banana.alive:
+                self.trails.end_path()
      
         # 更新 UI 訊息 (移除過期)
         current_time = pygame.time.get_ticks()
@@ -220,19 +408,44 @@ class Game:
             if dur <= 0 or (current_time - st) < dur
         ]
 
-    def render(self):
-        self.screen.fill(SKY_COLOR)
-        pygame.draw.rect(self.screen, GROUND_COLOR, (0, self.screen_height - 50, self.screen_width, 50))
-        self.collision_objects.append({"name": "ground", "rect": pygame.Rect(0, self.screen_height - 50, self.screen_width, 50)})
+    def _render_background(self):
+        """Redraws the cached sky, ground and skyline."""
+        self._background.fill(SKY_COLOR)
+        pygame.draw.rect(self._background, GROUND_COLOR, (0, self.screen_height - 50, self.screen_width, 50))
+        if self.palette_effects:
+            self.cityscape.draw(self._background, LIT_WINDOW_INDEX)
+        else:
+            self.cityscape.draw(self._background)
+        self._background_dirty = False
+
+    def render(self, flip: bool = True):
+        if self._background_dirty:
+            self._render_background()
+        self.screen.blit(self._background, (0, 0))
+        if self.ghost_trails_enabled:
+            self.trails.draw(self.screen)
 
+        # The sun never overlaps the skyline, so drawing it after the cached city is equivalent
         self.graphics.draw_sun(self.sun_x, self.sun_y, happy=self.sun_happy)
-        self.cityscape.draw(self.screen)
-        self.gorilla1.draw(self.screen)
-        self.gorilla2.draw(self.screen)
+        self.graphics.draw_gorilla(self.gorilla1)
+        self.graphics.draw_gorilla(self.gorilla2)
 
         if self.banana and self.banana.alive:
             self.banana.draw(self.screen)
 
+        if self.aim_preview_active():
+            self.aim_preview.draw(self.screen)
+
+        # Wind indicator: field arrows when enabled, plus the classic arrow at the bottom
+        if self.wind_field:
+            overlay = self.wind_field.overlay()
+            if self.palette_effects:
+                if self._indexed_overlay[0] is not overlay:
+                    self._indexed_overlay = (overlay, index_sprite(overlay))
+                overlay = self._indexed_overlay[1]
+            self.screen.blit(overlay, (0, 0))
+        draw_wind_arrow(self.screen, self.screen_width // 2, self.screen_height - 25, self.wind * 20)
+
         # 顯示 UI 訊息
         for (surf, rect, start_time, duration) in self.ui_messages:
             self.screen.blit(surf, rect)
@@ -241,17 +454,64 @@ class Game:
         angle_text = f"Angle: {int(self.throw_controller.angle)}"
         power_text = f"Power: {int(self.throw_controller.power)} / {int(self.throw_controller.max_power)}"
         player_text = f"Gorilla: Loki" if self.turn == 0 else f"Gorilla: Richard"
-        player_text = f"{player_text}  [SPACE]: Charging Power. [UP]/[DOWN]: Adjust Angle"
-        font = pygame.font.Font(None, 28)
-        angle_surf = font.render(angle_text, True, (255,255,255))
-        power_surf = font.render(power_text, True, (255,255,255))
-        player_surf = font.render(player_text, True, (255,255,0))
-        self.screen.blit(angle_surf, (10, 10))
-        self.screen.blit(power_surf, (10, 40))
-        self.screen.blit(player_surf, (10, 70))
-
+        player_text = f"{player_text}  [SPACE]: Charging Power. [UP]/[DOWN]: Adjust Angle. [P]: Aim Preview. [W]: Wind Field. [T]: Trails"
+        if self.palette_effects:
+            player_text += ". [N]: Night"
+        s = self.hud_scale
+        antialias = self.palette_effects is None  # indexed screens take only opaque text
+        font = pygame.font.Font(None, round(28 * s))
+        angle_surf = font.render(angle_text, antialias, (255,255,255))
+        power_surf = font.render(power_text, antialias, (255,255,255))
+        player_surf = font.render(player_text, antialias, (255,255,0))
+        self.screen.blit(angle_surf, (round(10 * s), round(10 * s)))
+        self.screen.blit(power_surf, (round(10 * s), round(40 * s)))
+        self.screen.blit(player_surf, (round(10 * s), round(70 * s)))
+
+        if self.show_frame_stats:
+            self.frame_timer.draw_overlay(self.screen, scale=self.hud_scale)
+
+        if flip:
+            self.present()
+
+    def present(self):
+        """
+        Shows the rendered screen: one nearest-neighbour upscale into the window (native_ega),
+        then the flip. An indexed screen is copied through this frame's effect palette.
+        """
+        if self.screen is not self.window:
+            palette = self.palette_effects.palette() if self.palette_effects else None
+            if palette:
+                self.screen.set_palette(palette)
+            frame = self.screen
+            if self._present_buffer is not None:
+                # Palette lookup at screen size, before scaling
+                self._present_buffer.blit(frame, (0, 0))
+                frame = self._present_buffer
+            if frame.get_size() == self.window.get_size():
+                self.window.blit(frame, (0, 0))
+            else:
+                pygame.transform.scale(frame, self.window.get_size(), self.window)
+            if palette:
+                self.screen.set_palette(BASE_PALETTE)
         pygame.display.flip()
 
+    def _rebuild_wind_field(self):
+        """Precomputes the wind grid for the current wind and skyline (or drops it when disabled)."""
+        if self.wind_field_enabled:
+            from wind import WindField
+            # Gusts are seeded from the wind draw itself, so rebuilds for the same wind
+            # (building hits, [W]) keep the field the player aimed with
+            self.wind_field = WindField(self.wind, self.screen_width, self.screen_height, self.cityscape.buildings,
+                                        seed=self.wind)
+        else:
+            self.wind_field = None
+
+    def aim_preview_active(self) -> bool:
+        """True while the preview is enabled and the current player is aiming."""
+        if not self.aim_preview_enabled or (self.banana and self.banana.alive):
+            return False
+        return self.throw_controller.charging or self.throw_controller.mouse_drag
+
     def add_ui_message(self, text: str, duration_ms: int = 2000, position=None, font_size: int = 48, color=(255,255,255)):
         """
         Adds a message to the screen UI for a set duration. 
@@ -263,8 +523,8 @@ class Game:
         else:
             x, y = position
 
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, color)
+        font = pygame.font.Font(None, round(font_size * self.hud_scale))
+        text_surface = font.render(text, self.palette_effects is None, color)
         rect = text_surface.get_rect(center=(x,y))
         start_time = pygame.time.get_ticks()
         self.ui_messages.append((text_surface, rect, start_time, duration_ms))
@@ -275,7 +535,9 @@ class Game:
         """
         self.ui_messages.clear()
 
-        self.cityscape.generate_buildings()
+        self._new_city()
+        self._background_dirty = True
+        self.trails.clear()
         positions = self.cityscape.get_building_positions()
         self.gorilla1.x, self.gorilla1.y = positions[1][0] + 20, positions[1][1] - 30
         self.gorilla2.x, self.gorilla2.y = positions[-2][0] + 20, positions[-2][1] - 30
@@ -285,12 +547,14 @@ class Game:
 
         self.banana = None
         self.sun_happy = True
+        self._rebuild_wind_field()
+        self.aim_preview.invalidate()
 
         self._load_collision_objects()
         self._load_collision_buildings()
 
         self.render()
-        pygame.time.delay(1000)
+        pygame.time.delay(self.round_delay_ms)
 
     def snap_gorilla_onto_building(self):
         """
@@ -308,10 +572,37 @@ class Game:
 
 
 
+def _window_scale(value: str) -> int:
+    """argparse type for --window-scale: an integer of at least 1."""
+    import argparse
+    try:
+        scale = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if scale < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {scale}")
+    return scale
+
 def main():
-    game = Game()
+    import argparse
+    parser = argparse.ArgumentParser(description="QB Gorilla")
+    parser.add_argument("--city-library", help="load rounds from a pre-generated city library (see city_library.py)")
+    parser.add_argument("--native-ega", action="store_true",
+                        help="draw at GORILLA.BAS's 640x350 and scale the frame up to the window")
+    parser.add_argument("--window-scale", type=_window_scale, default=2,
+                        help="window pixels per screen pixel with --native-ega (1 or more)")
+    parser.add_argument("--indexed", action="store_true",
+                        help="8-bit palette-indexed screen with palette flashes and night mode ([N])")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print the startup phase timings when the game exits")
+    args = parser.parse_args()
+
+    game = Game(city_library=args.city_library, native_ega=args.native_ega, window_scale=args.window_scale,
+                indexed=args.indexed)
     # 如果要用滑鼠 => game.throw_controller.set_input_mode("mouse")
     game.run()
+    if args.startup_report:
+        print(game.startup_report())
 
 if __name__ == '__main__':
     main()
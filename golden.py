@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Golden-frame rendering regression checks for the Gorilla game.
+
+Each scene builds a deterministic Game state from a fixed seed, renders it on
+the SDL dummy display and compares the frame with a stored PNG in golden/
+using NumPy surfarray diffs. A pixel mismatches when any channel differs by
+more than --tolerance; a scene fails when more than --max-pixels mismatch, and
+a diff image (mismatches in red over the dimmed frame) is written to
+golden/diff/.
+
+Usage:
+    python golden.py            # compare every scene
+    python golden.py --update   # re-record the golden images
+    python golden.py --scene banana_in_flight --tolerance 8
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import sys
+import time
+import numpy as np
+import pygame
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+def new_game(seed: int):
+    """Game seeded for a reproducible city, gorillas and wind."""
+    random.seed(seed)
+    from game import Game
+    game = Game(background_assets=False)
+    game.round_delay_ms = 0
+    return game
+
+def scene_city(game):
+    pass
+
+def scene_banana_in_flight(game):
+    game.do_throw(55, 45)
+    for _ in range(25):
+        game.update(1 / 60)
+
+def scene_sun_shocked(game):
+    game.sun_happy = False
+
+def scene_after_impact(game):
+    for building in game.cityscape.buildings[2:-2:2]:
+        game.cityscape.destroy_building_area(building.x + building.width // 2, building.building_top + 10, 30)
+    game._background_dirty = True
+    game.collision_objects = [obj for obj in game.collision_objects if obj.name != "building"]
+    game._load_collision_buildings()
+
+def scene_aim_preview(game):
+    game.aim_preview_enabled = True
+    game.throw_controller.charging = True
+    game.throw_controller.power = 60
+    game.update(1 / 60)
+
+def scene_trails(game):
+    game.ghost_trails_enabled = True
+    for angle in (40, 60):
+        game.do_throw(angle, 50)
+        for _ in range(40):
+            game.update(1 / 60)
+        game.banana = None
+        game.trails.end_path()
+
+SCENES = {
+    "city_seed_1": (1, scene_city),
+    "city_seed_2": (2, scene_city),
+    "banana_in_flight": (3, scene_banana_in_flight),
+    "sun_shocked": (4, scene_sun_shocked),
+    "after_impact": (5, scene_after_impact),
+    "aim_preview": (6, scene_aim_preview),
+    "trails": (7, scene_trails),
+}
+
+def render_scene(name: str) -> pygame.Surface:
+    """Builds and renders one scene, returning a copy of the frame."""
+    seed, setup = SCENES[name]
+    game = new_game(seed)
+    # explosion animations draw straight to the display; scenes only want the final frame
+    game.graphics.draw_explosion = lambda *a, **k: None
+    setup(game)
+    game.render(flip=False)
+    return game.screen.copy()
+
+def compare_frames(frame, golden, tolerance: int):
+    """
+    Returns (mismatch_count, max_channel_delta, mask) comparing two RGB surfaces.
+    """
+    a = pygame.surfarray.pixels3d(frame)
+    b = pygame.surfarray.pixels3d(golden)
+    if a.shape != b.shape:
+        return a.shape[0] * a.shape[1], 255, None
+    if np.array_equal(a, b):
+        return 0, 0, None
+    delta = np.abs(a.astype(np.int16) - b).max(axis=2)
+    mask = delta > tolerance
+    return int(mask.sum()), int(delta.max()), mask
+
+def write_diff(frame, mask, path: str) -> None:
+    """Saves the frame dimmed to 1/4 with mismatching pixels in red."""
+    pixels = pygame.surfarray.array3d(frame) // 4
+    pixels[mask] = (255, 0, 0)
+    pygame.image.save(pygame.surfarray.make_surface(pixels), path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden-frame rendering checks")
+    parser.add_argument("--update", action="store_true", help="re-record golden images")
+    parser.add_argument("--scene", action="append", choices=tuple(SCENES), help="only these scenes")
+    parser.add_argument("--tolerance", type=int, default=0, help="max per-channel difference")
+    parser.add_argument("--max-pixels", type=int, default=0, help="mismatching pixels allowed per scene")
+    args = parser.parse_args()
+
+    names = args.scene or list(SCENES)
+    frames = {name: render_scene(name) for name in names}
+
+    if args.update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        for name, frame in frames.items():
+            pygame.image.save(frame, os.path.join(GOLDEN_DIR, f"{name}.png"))
+        print(f"Recorded {len(frames)} golden frames in {GOLDEN_DIR}")
+        return
+
+    failed = 0
+    start = time.perf_counter()
+    for name, frame in frames.items():
+        path = os.path.join(GOLDEN_DIR, f"{name}.png")
+        if not os.path.exists(path):
+            print(f"MISSING {name}: no golden image, run with --update")
+            failed += 1
+            continue
+        golden = pygame.image.load(path)
+        count, worst, mask = compare_frames(frame, golden, args.tolerance)
+        if count > args.max_pixels:
+            failed += 1
+            if mask is not None:
+                os.makedirs(os.path.join(GOLDEN_DIR, "diff"), exist_ok=True)
+                write_diff(frame, mask, os.path.join(GOLDEN_DIR, "diff", f"{name}.png"))
+            print(f"FAIL {name}: {count} pixels differ (max delta {worst})")
+        else:
+            print(f"ok   {name}")
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{len(frames) - failed}/{len(frames)} scenes match ({elapsed:.0f} ms to compare)")
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
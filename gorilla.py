@@ -6,7 +6,7 @@ attempting to mimic the original QBasic GORILLA.BAS shape and arms.
 
 import math
 import pygame
-from qbdraw import QBDraw
+from qbdraw import QBDraw, DisplayList
 
 class Gorilla:
     # Arms state constants
@@ -29,15 +29,36 @@ class Gorilla:
         self.outline_color = (0, 0, 0)   # Black
         self.scale = 1.0  # Scaling factor
 
+    # Recorded figures, keyed by (arms_state, scale, body_color, outline_color)
+    _display_lists = {}
+
+    def display_list(self) -> DisplayList:
+        """
+        The gorilla's figure for its current arms state, scale and colors, relative
+        to its reference point; recorded from _draw_commands once and then cached.
+        """
+        key = (self.arms_state, self.scale, self.body_color, self.outline_color)
+        display_list = Gorilla._display_lists.get(key)
+        if display_list is None:
+            drawer = QBDraw.recorder(scale=self.scale)
+            self._draw_commands(drawer)
+            display_list = Gorilla._display_lists[key] = drawer.display_list()
+        return display_list
+
     def draw(self, surface: pygame.Surface) -> None:
         """
         Draw the gorilla on the given Pygame surface using QBasic-like commands.
         
         :param surface: The Pygame surface to draw on
         """
-        # Create QBDraw instance with the gorilla's position and scale
-        drawer = QBDraw(surface, offset_x=self.x, offset_y=self.y, scale=self.scale)
+        self.display_list().replay(surface, self.x, self.y)
 
+    def _draw_commands(self, drawer: QBDraw) -> None:
+        """
+        Issues the gorilla's QBDraw commands, relative to its reference point.
+
+        :param drawer: A QBDraw (normally a recorder, see display_list).
+        """
         # Draw head (two filled rectangles)
         drawer.LINE(-4, 0, 3, 6, self.body_color, box=True, fill=True)
         drawer.LINE(-5, 2, 4, 4, self.body_color, box=True, fill=True)
@@ -93,19 +114,28 @@ class Gorilla:
         """
         self.arms_state = new_state
  
-    def victory_dance(self, surface: pygame.Surface, game_render_func, sound=None, cycles: int = 3, delay_ms: int = 200) -> None:
+    def victory_dance(self, surface: pygame.Surface, game_render_func, sound=None, cycles: int = 3, delay_ms: int = 200,
+                      present=None) -> None:
+        """
+        :param game_render_func: Redraws the scene (without showing it).
+        :param sound: Called on every arm swap.
+        :param present: Shows the redrawn scene (default pygame.display.flip).
+        """
+        present = present or pygame.display.flip
         original_state = self.arms_state
         dance_sequence = [Gorilla.LEFT_UP, Gorilla.RIGHT_UP]
 
         for _ in range(cycles):
             for state in dance_sequence:
                 self.set_arms_state(state)
+                if sound:
+                    sound()  # GORILLA.BAS plays the jingle on every arm swap
                 game_render_func()  # 呼叫 game.render()
-                pygame.display.flip()
+                present()
                 pygame.time.delay(delay_ms)
 
         # 回復原狀
         self.set_arms_state(Gorilla.ARMS_DOWN)
         game_render_func()
-        pygame.display.flip()
+        present()
 
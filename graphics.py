@@ -4,9 +4,11 @@ Handles graphical rendering for the Gorilla game (banana with 4 orientations usi
 """
 
 import math
+import numpy as np
 import pygame
 import struct
 from qbdraw import QBDraw
+from palette import index_sprite
 from utils import SUN_COLOR, SKY_COLOR, EXPLOSION_COLOR, scl
 
 banana_ega_data = {
@@ -51,142 +53,140 @@ EGA_PALETTE = [
     (255, 255, 255),
 ]
 
-# Nibble flip lookup table used in fake_decode_ega.py
-HALF_BYTE_LUT = [
-    0x0,  # 0000 -> 0000
-    0x8,  # 0001 -> 1000
-    0x4,  # 0010 -> 0100
-    0xC,  # 0011 -> 1100
-    0x2,  # 0100 -> 0010
-    0xA,  # 0101 -> 1010
-    0x6,  # 0110 -> 0110
-    0xE,  # 0111 -> 1110
-    0x1,  # 1000 -> 0001
-    0x9,  # 1001 -> 1001
-    0x5,  # 1010 -> 0101
-    0xD,  # 1011 -> 1101
-    0x3,  # 1100 -> 0011
-    0xB,  # 1101 -> 1011
-    0x7,  # 1110 -> 0111
-    0xF   # 1111 -> 1111
-]
-
-def invert_32bits_fast(value: int) -> int:
-    """
-    This function flips the nibbles of a 32-bit integer, matching the approach 
-    in fake_decode_ega.py. Each half-byte (4 bits) is reversed using HALF_BYTE_LUT.
+def decode_ega_indices(data_list: list[int]) -> np.ndarray:
     """
-    value &= 0xFFFFFFFF
-    b0 = value & 0xFF
-    b1 = (value >> 8) & 0xFF
-    b2 = (value >> 16) & 0xFF
-    b3 = (value >> 24) & 0xFF
-
-    # Perform nibble flipping for each byte
-    nb0 = ((HALF_BYTE_LUT[b0 & 0xF] << 4) | HALF_BYTE_LUT[b0 >> 4])
-    nb1 = ((HALF_BYTE_LUT[b1 & 0xF] << 4) | HALF_BYTE_LUT[b1 >> 4])
-    nb2 = ((HALF_BYTE_LUT[b2 & 0xF] << 4) | HALF_BYTE_LUT[b2 >> 4])
-    nb3 = ((HALF_BYTE_LUT[b3 & 0xF] << 4) | HALF_BYTE_LUT[b3 >> 4])
-
-    # Recombine into a single 32-bit value
-    return (nb3 << 24) | (nb2 << 16) | (nb1 << 8) | nb0
-
-def decode_ega(
-    data_list: list[int]
-    ) -> pygame.Surface:
+    Decodes GORILLA.BAS EGA DATA (the QBasic GET format) to palette indices.
+
+    - data_list[0] holds two little-endian 16-bit fields: width, height.
+    - The remaining integers are the image bytes (little-endian 32-bit words): for
+      each row, 4 bitplanes of pwidth = 8 * ceil(width / 8) bits each, most
+      significant bit first. Plane n contributes bit n of a pixel's color index.
+
+    :param data_list: The raw EGA data (list of integers).
+    :return: uint8 array of EGA_PALETTE indices, shape (width, height) and indexed
+             [x, y] like pygame.surfarray; empty when the data holds no image.
     """
-    Decodes EGA banana (or similar) data to a pygame.Surface using a 4-plane approach.
-    1) The first 32 bits may store width/height in <HH> form, or might be other info 
-       depending on how GORILLA.bas arranges its data.
-    2) The rest of the integers define EGA bitplanes.
-    
-    In the original fake_decode_ega.py logic:
-      - We interpret data_list[0] as two 16-bit fields (width, height).
-      - Then we read the rest as pixel data across 4 planes.
-      - Planes are arranged in "pwidth" chunks, each line repeated across 4 planes.
+    w, h = struct.unpack('<HH', (data_list[0] & 0xFFFFFFFF).to_bytes(4, byteorder='little'))
+    if w * h == 0 or len(data_list) < 2:
+        return np.zeros((0, 0), dtype=np.uint8)
 
-    If your GORILLA data differs, adapt this function accordingly.
+    pwidth = 8 * ((w + 7) // 8)
+    words = np.array([value & 0xFFFFFFFF for value in data_list[1:]], dtype='<u4')
+    bits = np.unpackbits(words.view(np.uint8))
+    needed = h * 4 * pwidth
+    if bits.size < needed:  # a short DATA block leaves the remaining bits clear
+        bits = np.concatenate([bits, np.zeros(needed - bits.size, dtype=np.uint8)])
+    planes = bits[:needed].reshape(h, 4, pwidth)[:, :, :w]
+    indices = planes[:, 0] | (planes[:, 1] << 1) | (planes[:, 2] << 2) | (planes[:, 3] << 3)
+    return np.ascontiguousarray(indices.T)
+
+def decode_ega(data_list: list[int]) -> pygame.Surface:
+    """
+    Decodes EGA banana (or similar) data to a pygame.Surface (see decode_ega_indices).
+    Color index 0 is transparent.
 
     :param data_list: The raw EGA data (list of integers).
-    :param requested_width: If not None, override the width from data_list[0].
-    :param requested_height: If not None, override the height from data_list[0].
     :return: A pygame.Surface with the decoded image.
     """
-    # Extract width and height from the first integer if not provided
-    # 'little' byteorder, <HH => 2 unsigned shorts
-    first_u32 = data_list[0] & 0xFFFFFFFF
-    bytes_le = first_u32.to_bytes(4, byteorder='little', signed=False)
-    w, h = struct.unpack('<HH', bytes_le)
-
-    # The rest of the data (from index=1 onward) is the pixel planes
-    # We compute the total number of bits: 32 * (len(data_list)-1)
-    max_pixels = 8 * (len(data_list) - 1)  # Because each 32 bits => 32 *  (8 pixels per plane chunk?), 
-                                          # but effectively we handle them in 4-plane blocks.
-
-    total_pixels = w * h
-    if total_pixels == 0 or len(data_list) < 2:
+    indices = decode_ega_indices(data_list)
+    if indices.size == 0:
         # Return a small placeholder if invalid
         surf = pygame.Surface((1,1), pygame.SRCALPHA)
         surf.fill((255,0,255,255))  # Magenta for debugging
         return surf
 
-    # Calculate how many bytes or bits per line for EGA's 4-plane arrangement.
-    # In fake_decode_ega.py, we use pwidth=8*((w+7)//8) to handle alignment to 8-pixel boundary
-    pwidth = 8 * ((w + 7) // 8)
+    surf = pygame.Surface(indices.shape, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surf)[...] = np.array(EGA_PALETTE, dtype=np.uint8)[indices]
+    pygame.surfarray.pixels_alpha(surf)[...] = np.where(indices != 0, 255, 0)
+    return surf
 
-    # Combine the integer bits into a single large bitset, flipping nibbles if needed
-    combined_bits = 0
-    shift_acc = 0
-    for i in range(1, len(data_list)):
-        val_inverted = invert_32bits_fast(data_list[i])
-        combined_bits |= (val_inverted << shift_acc)
-        shift_acc += 32
-
-    # Create the output surface
-    surf = pygame.Surface((w, h), pygame.SRCALPHA)
-    surf.fill((0,0,0,255))  # transparent background
-
-    # For each pixel, we figure out which bits belong to that pixel across the 4 planes
-    # The code uses x + pwidth*(plane_index) + pwidth*lines*(y) arrangement
-    # plane0 => bit offset = pi
-    # plane1 => bit offset = pi + pwidth
-    # plane2 => pi + 2*pwidth
-    # plane3 => pi + 3*pwidth
-    for i in range(total_pixels):
-        x = i % w
-        y = i // w
-        # pi is the bit index for plane0
-        pi = x + pwidth*4 * y
-
-        p0 = 1 if (combined_bits & (1 << pi)) else 0
-        p1 = 1 if (combined_bits & (1 << (pi + pwidth))) else 0
-        p2 = 1 if (combined_bits & (1 << (pi + 2 * pwidth))) else 0
-        p3 = 1 if (combined_bits & (1 << (pi + 3 * pwidth))) else 0
-
-        color_index = (p0 << 0) | (p1 << 1) | (p2 << 2) | (p3 << 3)
-        col = EGA_PALETTE[color_index]
-        surf.set_at((x, y), col + (255 if 0 != color_index else 0,))
+def decode_ega_scaled(data_list: list[int], scale_factor: int = 1) -> pygame.Surface:
+    """
+    Decodes EGA data and scales the result by an integer factor.
+    :param data_list: The raw EGA data as a list of integers.
+    :param scale_factor: How much to scale the resulting surface.
+    """
+    decoded_surf = decode_ega(data_list)
+    if scale_factor > 1:
+        w = decoded_surf.get_width()
+        h = decoded_surf.get_height()
+        decoded_surf = pygame.transform.scale(decoded_surf, (w * scale_factor, h * scale_factor))
+    return decoded_surf
 
-    return surf
+def decode_sprites(scale_factor: int = 1) -> dict:
+    """
+    Decodes the four banana orientations.
+    :return: Surfaces keyed "banana_left", "banana_right", "banana_up", "banana_down".
+    """
+    return {
+        f"banana_{direction.lower()}": decode_ega_scaled(data, scale_factor)
+        for direction, data in banana_ega_data.items()
+    }
 
 class Graphics:
     """
     Class for handling game graphics (no CGA/EGA modes, only modern screen usage).
     """
 
-    def __init__(self, screen, scale_factor=1):
+    def __init__(self, screen, scale_factor=1, load_sprites=True, present=None):
         """
         Initialize the graphics module.
         :param screen: The main pygame surface where we draw.
+        :param load_sprites: False leaves ega_surfaces empty so the sprites can be decoded
+                             elsewhere (see assets.py) and installed with set_sprites().
+        :param present: Shows `screen` in the window (default pygame.display.flip); the
+                        game passes Game.present when drawing to an offscreen target.
         """
         self.screen = screen
+        self.present = present or pygame.display.flip
         self.ega_surfaces = {}
+        # Draw-origin pixel of pre-rasterized figures (see asset_pack.py), keyed like ega_surfaces
+        self.figure_anchors = {}
         self.banana_color = (255, 255, 0)  # Yellow
         self.outline_color = (0, 0, 0)     # Black
-        self.add_ega_surface('banana_left', banana_ega_data['Left'], scale_factor)
-        self.add_ega_surface('banana_right', banana_ega_data['Right'], scale_factor)
-        self.add_ega_surface('banana_up', banana_ega_data['Up'], scale_factor)
-        self.add_ega_surface('banana_down', banana_ega_data['Down'], scale_factor)
+        if load_sprites:
+            self.set_sprites(decode_sprites(scale_factor))
+
+    def set_sprites(self, surfaces: dict, anchors: dict = None):
+        """
+        Installs decoded sprites (see decode_sprites) and pre-rasterized figures.
+        :param surfaces: Surfaces keyed like ega_surfaces, e.g. "banana_left" or "sun_happy".
+        :param anchors: (anchor_x, anchor_y, row) for the keys that are figures (see draw_figure).
+        """
+        if self.screen.get_bitsize() == 8:
+            # Indexed screen (see palette.py): sprites become colorkeyed index arrays
+            surfaces = {key: index_sprite(surf) for key, surf in surfaces.items()}
+        elif pygame.display.get_surface() is not None:
+            # Match the display format once here; per-pixel alpha blits of unconverted
+            # RGBA surfaces cost several times more per frame
+            surfaces = {key: surf.convert_alpha() for key, surf in surfaces.items()}
+        self.ega_surfaces.update(surfaces)
+        if anchors:
+            self.figure_anchors.update(anchors)
+
+    def draw_figure(self, key: str, x: float, y: float) -> bool:
+        """
+        Blits a pre-rasterized figure so that its anchor lands on (x, y).
+
+        :return: False when the figure is not loaded, or the rasterized copy may round
+                 differently here (x/y not whole pixels, or y is not the row the figure
+                 is pinned to); the caller then draws it with QBDraw.
+        """
+        anchor = self.figure_anchors.get(key)
+        if anchor is None or x != int(x) or y != int(y):
+            return False
+        anchor_x, anchor_y, row = anchor
+        if row is not None and y != row:
+            return False
+        self.screen.blit(self.ega_surfaces[key], (int(x) - anchor_x, int(y) - anchor_y))
+        return True
+
+    def draw_gorilla(self, gorilla) -> None:
+        """
+        Draws a Gorilla from its pre-rasterized pose when available, else with QBDraw.
+        """
+        if not self.draw_figure(f"gorilla_{gorilla.arms_state}", gorilla.x, gorilla.y):
+            gorilla.draw(self.screen)
 
     def add_ega_surface(
         self,
@@ -202,25 +202,36 @@ class Graphics:
         :param requested_height: Optional override for height.
         :param scale_factor: How much to scale the resulting surface.
         """
-        decoded_surf = decode_ega(data_list)
-        w = decoded_surf.get_width()
-        h = decoded_surf.get_height()
-        if scale_factor > 1:
-            decoded_surf = pygame.transform.scale(decoded_surf, (w * scale_factor, h * scale_factor))
-        #print(f"Add new banana[{key}]  wxh={w}x{h}  scale={scale_factor}")
-        self.ega_surfaces[key] = decoded_surf
+        self.ega_surfaces[key] = decode_ega_scaled(data_list, scale_factor)
+
+    # Recorded sun faces and explosion frames, shared by every Graphics instance
+    _sun_display_lists = {}
+    _explosion_frames = {}
 
     def draw_sun(self, x: int, y: int, happy: bool = True) -> None:
         """
-        Draws the sun exactly as the original GORILLA.BAS,
-        using QBDraw methods only (assuming future support of filled circles).
+        Draws the sun exactly as the original GORILLA.BAS: the pre-rasterized figure
+        when the asset pack provides one, else the recorded QBDraw display list.
 
         :param x: X coordinate of sun center.
         :param y: Y coordinate of sun center.
         :param happy: True draws smiling mouth; False draws surprised mouth ("O").
         """
-        drawer = QBDraw(self.screen, offset_x=x, offset_y=y, scale=1)
-
+        if self.draw_figure("sun_happy" if happy else "sun_surprised", x, y):
+            return
+        display_list = Graphics._sun_display_lists.get(happy)
+        if display_list is None:
+            drawer = QBDraw.recorder(scale=1)
+            self._sun_commands(drawer, happy)
+            display_list = Graphics._sun_display_lists[happy] = drawer.display_list()
+        display_list.replay(self.screen, x, y)
+
+    @staticmethod
+    def _sun_commands(drawer: QBDraw, happy: bool) -> None:
+        """
+        Issues the sun's QBDraw commands relative to its center,
+        using QBDraw methods only (assuming future support of filled circles).
+        """
         # Sun body (filled circle, radius=12 as original)
         drawer.CIRCLE(0, 0, scl(12), SUN_COLOR, fill=True)
 
@@ -269,16 +280,26 @@ class Graphics:
         :param y: Center y-coordinate of explosion.
         :param radius: Maximum radius of explosion circle.
         """
-        drawer = QBDraw(self.screen, offset_x=int(x), offset_y=int(y), scale=1)
-
-        # Explosion grows outward
-        for r in range(1, radius, 2):
-            drawer.CIRCLE(0, 0, r, EXPLOSION_COLOR)
-            pygame.display.flip()
+        for frame in self.explosion_frames(radius):
+            frame.replay(self.screen, int(x), int(y))
+            self.present()
             pygame.time.delay(20)
 
-        # Explosion shrinks inward
-        for r in reversed(range(1, radius, 2)):
-            drawer.CIRCLE(0, 0, r, SKY_COLOR)
-            pygame.display.flip()
-            pygame.time.delay(20)
+    @classmethod
+    def explosion_frames(cls, radius: int = 30) -> list:
+        """
+        One display list per explosion animation frame: rings grow outward in
+        EXPLOSION_COLOR, then shrink inward in SKY_COLOR. Recorded once per radius.
+        """
+        frames = cls._explosion_frames.get(radius)
+        if frames is None:
+            frames = []
+            # Explosion grows outward, then shrinks inward
+            steps = [(r, EXPLOSION_COLOR) for r in range(1, radius, 2)]
+            steps += [(r, SKY_COLOR) for r in reversed(range(1, radius, 2))]
+            for r, color in steps:
+                drawer = QBDraw.recorder(scale=1)
+                drawer.CIRCLE(0, 0, r, color)
+                frames.append(drawer.display_list())
+            frames = cls._explosion_frames[radius] = frames
+        return frames
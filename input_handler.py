@@ -1,17 +1,122 @@
 #!/usr/bin/env python
 """
 Handles user input for the Gorilla game.
+
+InputHandler turns the pygame event queue into a stream of Actions that the
+game and both ThrowController modes consume:
+
+  - input devices the game does not read (wheel, text input, joysticks and
+    controllers, touch, file drops) are kept off the queue (BLOCKED_EVENTS),
+  - runs of MOUSEMOTION events collapse into one "move" carrying the latest
+    position, so a high-rate mouse cannot flood a frame during a drag,
+  - pointer positions are divided by pointer_scale, so with a scaled-up window
+    (Game(native_ega=True)) they arrive in render-target pixels,
+  - every action is timestamped when the frame picks it up, and the time from
+    there to the display flip that shows its effect is kept as input latency.
+    pygame does not expose SDL's event timestamps, so time spent waiting in the
+    queue before the frame starts is not included.
 """
 
+from array import array
+import time
 import pygame
 
+# Input the game never reads; high-rate sources (sensors, finger motion, text
+# editing) would otherwise fill the queue between frames. Window, focus, quit,
+# audio device, mixer end-events and USEREVENTs stay allowed: poll() skips what it
+# does not map, and the mixer and pygame's window handling rely on them.
+BLOCKED_EVENTS = (
+    pygame.MOUSEWHEEL,
+    pygame.TEXTINPUT,
+    pygame.TEXTEDITING,
+    pygame.KEYMAPCHANGED,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+    pygame.CONTROLLERAXISMOTION,
+    pygame.CONTROLLERBUTTONDOWN,
+    pygame.CONTROLLERBUTTONUP,
+    pygame.CONTROLLERDEVICEADDED,
+    pygame.CONTROLLERDEVICEREMOVED,
+    pygame.CONTROLLERDEVICEREMAPPED,
+    pygame.CONTROLLERTOUCHPADDOWN,
+    pygame.CONTROLLERSENSORUPDATE,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.FINGERMOTION,
+    pygame.MULTIGESTURE,
+    pygame.DROPFILE,
+    pygame.DROPTEXT,
+    pygame.DROPBEGIN,
+    pygame.DROPCOMPLETE,
+)
+
+# Key presses that map straight to an action
+KEY_ACTIONS = {
+    pygame.K_UP: "angle_up",
+    pygame.K_DOWN: "angle_down",
+    pygame.K_SPACE: "charge_start",
+    pygame.K_p: "toggle_preview",
+    pygame.K_F3: "toggle_stats",
+    pygame.K_t: "toggle_trails",
+    pygame.K_w: "toggle_wind",
+    pygame.K_n: "toggle_night",
+}
+KEY_RELEASE_ACTIONS = {
+    pygame.K_SPACE: "charge_end",
+}
+
+class Action:
+    """
+    One input action.
+
+    kind is one of: quit, angle_up, angle_down, charge_start, charge_end,
+    press, move, release (left mouse button / pointer, with pos) and toggle_*.
+    """
+    __slots__ = ("kind", "pos", "time")
+
+    def __init__(self, kind: str, pos: tuple = None, time: float = 0.0):
+        """
+        :param kind: Action name.
+        :param pos: Pointer position for press/move/release.
+        :param time: time.perf_counter() when the frame picked the input up.
+        """
+        self.kind = kind
+        self.pos = pos
+        self.time = time
+
+    def __repr__(self):
+        return f"Action({self.kind!r}, {self.pos!r})"
+
 class InputHandler:
     """
     Class for handling player inputs.
     """
 
-    def __init__(self):
+    def __init__(self, latency_capacity: int = 600):
+        """
+        :param latency_capacity: Number of per-action latency samples kept (ring buffer).
+        """
         self.keys = {}
+        self.motion_events = 0
+        self.motion_coalesced = 0
+        # Window pixels per render-target pixel (integer)
+        self.pointer_scale = 1
+        self._latency = array("d", bytes(8 * latency_capacity))
+        self._latency_next = 0
+        self._latency_count = 0
+        self._unpresented = []
+
+    def install(self) -> None:
+        """
+        Keeps BLOCKED_EVENTS off the pygame event queue. Safe for headless tools
+        that build a Game as well: they only post keyboard and mouse events.
+        """
+        pygame.event.set_blocked(list(BLOCKED_EVENTS))
 
     def handle_event(self, event):
         """
@@ -32,3 +137,72 @@ class InputHandler:
         :return: True if key is pressed, else False.
         """
         return self.keys.get(key, False)
+
+    def poll(self) -> list:
+        """
+        Drains the event queue into actions, in event order, with consecutive
+        mouse motion collapsed to its last position.
+
+        :return: List of Action.
+        """
+        now = time.perf_counter()
+        actions = []
+        motion = None
+        for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                self.motion_events += 1
+                if motion is not None:
+                    self.motion_coalesced += 1
+                motion = event.pos
+                continue
+            if motion is not None:
+                actions.append(Action("move", motion, now))
+                motion = None
+
+            self.handle_event(event)
+            kind, pos = None, None
+            if event.type == pygame.QUIT:
+                kind = "quit"
+            elif event.type == pygame.KEYDOWN:
+                kind = KEY_ACTIONS.get(event.key)
+            elif event.type == pygame.KEYUP:
+                kind = KEY_RELEASE_ACTIONS.get(event.key)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                kind, pos = "press", event.pos
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                kind, pos = "release", event.pos
+            if kind:
+                actions.append(Action(kind, pos, now))
+        if motion is not None:
+            actions.append(Action("move", motion, now))
+
+        scale = self.pointer_scale
+        if scale != 1:
+            for action in actions:
+                if action.pos is not None:
+                    action.pos = (action.pos[0] // scale, action.pos[1] // scale)
+        self._unpresented.extend(action.time for action in actions)
+        return actions
+
+    def frame_presented(self) -> None:
+        """Call right after the display flip: records the latency of every action polled since the last one."""
+        now = time.perf_counter()
+        capacity = len(self._latency)
+        for picked_up in self._unpresented:
+            self._latency[self._latency_next] = now - picked_up
+            self._latency_next = (self._latency_next + 1) % capacity
+            self._latency_count = min(self._latency_count + 1, capacity)
+        self._unpresented.clear()
+
+    def latency_samples(self) -> list:
+        """Recorded action-to-flip latencies in seconds, oldest first."""
+        if self._latency_count < len(self._latency):
+            return list(self._latency[:self._latency_count])
+        return list(self._latency[self._latency_next:]) + list(self._latency[:self._latency_next])
+
+    def latency_percentiles(self, points=(50, 95, 99)) -> dict:
+        """Latency percentiles in seconds (0.0 when nothing was recorded yet)."""
+        values = sorted(self.latency_samples())
+        if not values:
+            return {p: 0.0 for p in points}
+        return {p: values[min(len(values) - 1, int(p / 100 * len(values)))] for p in points}
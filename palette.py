@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+8-bit palette-indexed rendering for the Gorilla game.
+
+The game only ever draws with the 16 colors of utils.EGA_COLORS. With
+Game(indexed=True) the scene goes into an 8-bit surface whose palette holds
+them (entry n = EGA color n), sprites become index arrays on that palette, so
+blitting them is a byte copy, and screen-wide color effects change palette
+entries instead of pixels:
+
+    flash   every color fades in from a flash color (explosions)
+    shock   the sky entry flashes (the banana hits the sun)
+    night   everything but the lit windows darkens ([N] toggles)
+
+Lit windows have their own entry (LIT_WINDOW_INDEX, a copy of their color
+past the EGA ones, which RGB drawing never maps to): the city draws them with
+that raw index, so night leaves them lit while the sun and banana, also
+bright yellow, darken with the rest.
+
+pygame maps RGB colors through a surface's palette when drawing, so the
+drawing palette (BASE_PALETTE) never changes; Game.present() swaps the effect
+palette in only while the frame is copied to the window. An effect therefore
+costs O(palette) per frame instead of O(pixels).
+
+SDL does not alpha-blend into 8-bit surfaces, so translucent overlays are
+converted with index_sprite (alpha thresholded) and text is rendered without
+antialiasing on an indexed screen.
+"""
+
+import pygame
+from utils import EGA_COLORS, SKY_COLOR, WINDOW_COLOR_LIT
+
+EGA_PALETTE = list(EGA_COLORS.values())
+# Lit windows, drawn with this index (nearest-color mapping picks the EGA entry first)
+LIT_WINDOW_INDEX = len(EGA_PALETTE)
+# Transparent index of indexed sprites (colorkey)
+KEY_INDEX = 255
+# The remaining entries repeat black, so nearest-color mapping never picks them
+_COLORS = EGA_PALETTE + [WINDOW_COLOR_LIT]
+BASE_PALETTE = _COLORS + [(0, 0, 0)] * (256 - len(_COLORS))
+
+SKY_INDEX = EGA_PALETTE.index(SKY_COLOR)
+
+def indexed_surface(size: tuple) -> pygame.Surface:
+    """An 8-bit surface on BASE_PALETTE."""
+    surface = pygame.Surface(size, 0, 8)
+    surface.set_palette(BASE_PALETTE)
+    return surface
+
+def index_sprite(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a sprite to EGA indices on BASE_PALETTE. SDL maps the colors: the
+    EGA colors exactly, others through its 8-bit color map (close to, but not
+    always, the nearest EGA color). Pixels with alpha below 128 become
+    KEY_INDEX, the sprite's colorkey.
+
+    :param surface: Sprite in any format (typically RGBA).
+    """
+    sprite = indexed_surface(surface.get_size())
+    # Opaque copy first: SDL would alpha-blend an RGBA source into the 8-bit target
+    sprite.blit(surface.convert(32, 0), (0, 0))
+    if surface.get_flags() & pygame.SRCALPHA:
+        pygame.surfarray.pixels2d(sprite)[pygame.surfarray.pixels_alpha(surface) < 128] = KEY_INDEX
+    sprite.set_colorkey(KEY_INDEX)
+    return sprite
+
+def _blend(color: tuple, target: tuple, amount: float) -> tuple:
+    return tuple(int(c + (t - c) * amount) for c, t in zip(color, target))
+
+class PaletteEffects:
+    """
+    Timed palette effects for an indexed screen; palette() gives the colors to
+    show this frame.
+    """
+
+    def __init__(self, clock=None, night_level: float = 0.35):
+        """
+        :param clock: Callable returning the time in ms (default pygame.time.get_ticks).
+        :param night_level: Brightness of the unlit colors at night (0..1).
+        """
+        self.clock = clock or pygame.time.get_ticks
+        self.night_level = night_level
+        self.night = False
+        # (color, started_ms, duration_ms) or None
+        self._flash = None
+        self._shock = None
+
+    def flash(self, color: tuple = (255, 255, 255), duration_ms: int = 150) -> None:
+        """Starts a full-screen flash that fades back to the normal colors."""
+        self._flash = (color, self.clock(), duration_ms)
+
+    def shock(self, color: tuple = (255, 255, 255), duration_ms: int = 300) -> None:
+        """Starts a flash of the sky alone."""
+        self._shock = (color, self.clock(), duration_ms)
+
+    def toggle_night(self) -> None:
+        self.night = not self.night
+
+    def _strength(self, effect, now: float) -> float:
+        """Remaining strength (1 -> 0) of a timed effect, 0 once it has run out."""
+        if effect is None:
+            return 0.0
+        _, started, duration = effect
+        return max(0.0, 1.0 - (now - started) / duration) if duration > 0 else 0.0
+
+    def palette(self):
+        """
+        :return: The 256 colors to show this frame, or None when no effect is active
+                 (BASE_PALETTE applies).
+        """
+        now = self.clock()
+        flash = self._strength(self._flash, now)
+        shock = self._strength(self._shock, now)
+        if not flash:
+            self._flash = None
+        if not shock:
+            self._shock = None
+        if not (flash or shock or self.night):
+            return None
+
+        colors = list(_COLORS)
+        if self.night:
+            colors = [color if index == LIT_WINDOW_INDEX else _blend(color, (0, 0, 0), 1.0 - self.night_level)
+                      for index, color in enumerate(colors)]
+        if shock:
+            colors[SKY_INDEX] = _blend(colors[SKY_INDEX], self._shock[0], shock)
+        if flash:
+            colors = [_blend(color, self._flash[0], flash) for color in colors]
+        return colors + BASE_PALETTE[len(colors):]
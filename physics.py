@@ -1,13 +1,101 @@
 #!/usr/bin/env python
 """
 Physics calculations for the Gorilla game.
+
+All trajectories go through one engine: a launch state in screen coordinates
+(y grows downward) plus constant acceleration. iter_trajectory() streams the
+positions lazily, trajectory_array() computes them in bulk with NumPy. Banana
+flights advance through the step functions below (INTEGRATORS, or
+closed_form_stepper for the exact solution), so previews and flights share it.
 """
 
 import math
+from utils import meters_to_pixels, kmph_to_pixels_per_sec
+
+try:
+    import numpy as np
+except ImportError:  # bulk mode only
+    np = None
+
+def launch_state(angle_deg: float, velocity_kmph: float, gravity_mps2: float = 9.8, wind_mps2: float = 0) -> tuple:
+    """
+    Converts a throw in game units into the engine's pixel units.
+
+    :param angle_deg: Throwing angle in degrees (negative velocity throws to the left).
+    :param velocity_kmph: Launch velocity in km/h.
+    :param gravity_mps2: Gravity in m/s^2.
+    :param wind_mps2: Horizontal wind acceleration in m/s^2.
+    :return: (vx, vy, ax, ay) in pixels/s and pixels/s^2.
+    """
+    angle_rad = math.radians(angle_deg)
+    velocity_px = kmph_to_pixels_per_sec(velocity_kmph)
+    return (math.cos(angle_rad) * velocity_px,
+            -math.sin(angle_rad) * velocity_px,
+            meters_to_pixels(wind_mps2),
+            meters_to_pixels(gravity_mps2))
+
+def throw_velocity_kmph(power: float, screen_width: int, jitter: float = 0.0) -> float:
+    """
+    Maps the controller's 0..100 power to a launch velocity in km/h, as Game.do_throw does.
+
+    :param power: Controller power (0..max_power).
+    :param screen_width: Screen width; wider screens throw harder to cover the distance.
+    :param jitter: Random velocity offset added before scaling (0 for previews).
+    """
+    velocity = 15 + 35 * power // 100 + jitter
+    if 0 != (screen_width // 640):
+        velocity = int(velocity * math.sqrt(screen_width // 640))
+    return velocity
+
+def iter_trajectory(x0: float, y0: float, vx0: float, vy0: float, ax: float, ay: float, dt: float,
+                    min_x: float = None, max_x: float = None, max_y: float = None, max_steps: int = None):
+    """
+    Lazily yields (x, y) positions at t = 0, dt, 2*dt, ... until the shot leaves
+    the given bounds. Consumers that stop reading early never pay for the rest.
+
+    :param min_x: Stop when x < min_x (None = unbounded).
+    :param max_x: Stop when x > max_x (None = unbounded).
+    :param max_y: Stop when y > max_y (None = unbounded).
+    :param max_steps: Stop after this many positions (None = unbounded).
+    """
+    i = 0
+    while max_steps is None or i < max_steps:
+        t = i * dt
+        x = x0 + vx0 * t + 0.5 * ax * t * t
+        y = y0 + vy0 * t + 0.5 * ay * t * t
+        if (min_x is not None and x < min_x) or (max_x is not None and x > max_x) or (max_y is not None and y > max_y):
+            return
+        yield x, y
+        i += 1
+
+def trajectory_array(x0: float, y0: float, vx0: float, vy0: float, ax: float, ay: float, dt: float, steps: int,
+                     min_x: float = None, max_x: float = None, max_y: float = None):
+    """
+    Bulk variant of iter_trajectory for analysis: returns (xs, ys) NumPy arrays
+    of at most `steps` positions, truncated at the first out-of-bounds sample.
+    """
+    if np is None:
+        raise RuntimeError("trajectory_array requires numpy")
+    t = np.arange(steps, dtype=np.float64) * dt
+    xs = x0 + vx0 * t + 0.5 * ax * t * t
+    ys = y0 + vy0 * t + 0.5 * ay * t * t
+
+    out = np.zeros(steps, dtype=bool)
+    if min_x is not None:
+        out |= xs < min_x
+    if max_x is not None:
+        out |= xs > max_x
+    if max_y is not None:
+        out |= ys > max_y
+    if out.any():
+        n = int(out.argmax())
+        xs, ys = xs[:n], ys[:n]
+    return xs, ys
 
 def plot_shot(start_x: float, start_y: float, angle: float, velocity: float, gravity: float, wind: float, screen_width: int) -> list:
     """
-    Computes the trajectory of a thrown banana.
+    Computes the trajectory of a thrown banana in abstract (unconverted) units,
+    sampled every 0.1 time units until it drops below start_y or leaves the screen.
 
     :param start_x: Initial x position.
     :param start_y: Initial y position.
@@ -19,19 +107,110 @@ def plot_shot(start_x: float, start_y: float, angle: float, velocity: float, gra
     :return: List of (x, y) positions of the trajectory.
     """
     angle_rad = math.radians(angle)
-    x_velocity = math.cos(angle_rad) * velocity
-    y_velocity = math.sin(angle_rad) * velocity
-    trajectory = []
-    t = 0
-
-    while True:
-        x = start_x + (x_velocity * t) + (0.5 * wind * (t ** 2))
-        y = start_y - ((y_velocity * t) - (0.5 * gravity * (t ** 2)))
-        
-        if x < 0 or x > screen_width or y > start_y:
-            break
-
-        trajectory.append((x, y))
-        t += 0.1
-
-    return trajectory
+    vx = math.cos(angle_rad) * velocity
+    vy = -math.sin(angle_rad) * velocity
+    return list(iter_trajectory(start_x, start_y, vx, vy, wind, gravity, 0.1,
+                                min_x=0, max_x=screen_width, max_y=start_y))
+
+def closed_form_position(x0: float, y0: float, vx0: float, vy0: float, ax: float, ay: float, t: float) -> tuple:
+    """
+    Exact position under constant acceleration (screen coordinates, y grows downward).
+
+    :return: (x, y) after t seconds.
+    """
+    return (x0 + vx0 * t + 0.5 * ax * t * t,
+            y0 + vy0 * t + 0.5 * ay * t * t)
+
+# ---------------------------------------------------------------------------
+# Step integrators
+#
+# Every integrator has the same signature:
+#     step(x, y, vx, vy, dt, accel) -> (x, y, vx, vy)
+# where accel(x, y) returns the (ax, ay) acceleration in pixels/s^2 at a point.
+# ---------------------------------------------------------------------------
+
+def step_semi_euler(x, y, vx, vy, dt, accel):
+    """
+    The original Banana.update scheme: velocity first for x, position first for y.
+    """
+    ax, ay = accel(x, y)
+    vx += ax * dt
+    x += vx * dt
+    y += vy * dt
+    vy += ay * dt
+    return x, y, vx, vy
+
+def step_symplectic_euler(x, y, vx, vy, dt, accel):
+    """Symplectic (semi-implicit) Euler: update velocity, then position, on both axes."""
+    ax, ay = accel(x, y)
+    vx += ax * dt
+    vy += ay * dt
+    return x + vx * dt, y + vy * dt, vx, vy
+
+def step_verlet(x, y, vx, vy, dt, accel):
+    """Velocity Verlet. Exact for constant acceleration, second order otherwise."""
+    ax, ay = accel(x, y)
+    x += vx * dt + 0.5 * ax * dt * dt
+    y += vy * dt + 0.5 * ay * dt * dt
+    nax, nay = accel(x, y)
+    vx += 0.5 * (ax + nax) * dt
+    vy += 0.5 * (ay + nay) * dt
+    return x, y, vx, vy
+
+def step_rk4(x, y, vx, vy, dt, accel):
+    """Classic fourth-order Runge-Kutta on the (position, velocity) state."""
+    half = 0.5 * dt
+    ax1, ay1 = accel(x, y)
+    ax2, ay2 = accel(x + vx * half, y + vy * half)
+    vx2, vy2 = vx + ax1 * half, vy + ay1 * half
+    ax3, ay3 = accel(x + vx2 * half, y + vy2 * half)
+    vx3, vy3 = vx + ax2 * half, vy + ay2 * half
+    ax4, ay4 = accel(x + vx3 * dt, y + vy3 * dt)
+    vx4, vy4 = vx + ax3 * dt, vy + ay3 * dt
+
+    x += (vx + 2 * vx2 + 2 * vx3 + vx4) * dt / 6
+    y += (vy + 2 * vy2 + 2 * vy3 + vy4) * dt / 6
+    vx += (ax1 + 2 * ax2 + 2 * ax3 + ax4) * dt / 6
+    vy += (ay1 + 2 * ay2 + 2 * ay3 + ay4) * dt / 6
+    return x, y, vx, vy
+
+def closed_form_stepper(x0: float, y0: float, vx0: float, vy0: float, ax: float, ay: float):
+    """
+    The "closed_form" integrator as a step function with the signature above: each
+    step evaluates the exact solution from the launch state at the accumulated
+    time, so it never drifts. accel is ignored; the acceleration is the constant
+    (ax, ay). The returned step keeps the elapsed time, so use one per flight.
+    """
+    t = 0.0
+
+    def step(x, y, vx, vy, dt, accel):
+        nonlocal t
+        t += dt
+        x, y = closed_form_position(x0, y0, vx0, vy0, ax, ay, t)
+        return x, y, vx0 + ax * t, vy0 + ay * t
+    return step
+
+# "closed_form" needs the launch state, so it is built per flight (closed_form_stepper)
+INTEGRATORS = {
+    "semi_euler": step_semi_euler,
+    "symplectic_euler": step_symplectic_euler,
+    "verlet": step_verlet,
+    "rk4": step_rk4,
+}
+
+INTEGRATOR_NAMES = ("closed_form",) + tuple(INTEGRATORS)
+
+def iter_integrated(x0: float, y0: float, vx0: float, vy0: float, dt: float, accel, step=step_verlet,
+                    min_x: float = None, max_x: float = None, max_y: float = None, max_steps: int = None):
+    """
+    Counterpart of iter_trajectory for position-dependent acceleration (e.g. a wind field):
+    yields (x, y) by stepping `step` with accel(x, y) -> (ax, ay). Same bounds semantics.
+    """
+    x, y, vx, vy = x0, y0, vx0, vy0
+    i = 0
+    while max_steps is None or i < max_steps:
+        if (min_x is not None and x < min_x) or (max_x is not None and x > max_x) or (max_y is not None and y > max_y):
+            return
+        yield x, y
+        x, y, vx, vy = step(x, y, vx, vy, dt, accel)
+        i += 1
@@ -1,7 +1,320 @@
+"""
+QBasic-style drawing commands (LINE, CIRCLE, PSET, PAINT, GET, PUT) on a pygame surface.
+
+Every command is turned into a primitive tuple with the scale already applied
+and only the offset left to add. A QBDraw drawing on a surface executes each
+primitive at once; a recording QBDraw (QBDraw.recorder()) collects them into a
+DisplayList instead, which can be replayed at any offset with one call or
+rasterized to a surface. Replay does the same final arithmetic as immediate
+drawing (offset + pre-scaled value, then the same int()/Rect truncation), so
+a replayed figure is pixel-identical to drawing it directly at that offset.
+
+PAINT is a scanline span fill (see paint()): the border test runs once over a
+surfarray view of the whole surface, spans are then found with bytearray
+searches and written with one Surface.fill per span, so filling an empty
+1280x720 screen takes 720 span operations instead of ~900k set_at calls.
+
+GET copies a rectangle's raw pixel values into an ImageBuffer and PUT writes
+one back with QBasic's action verbs (PSET, PRESET, AND, OR, XOR), as NumPy
+bitwise operations on a surfarray view of the target rectangle. XOR-ing the
+same image twice restores the background, which is how GORILLA.BAS moved the
+banana without repainting the scene. The verbs act on pixel values, as EGA's
+acted on color indices; on an RGB surface that means per-channel bits.
+"""
+
 import pygame
 import math
+import numpy as np
 from utils import scl
 
+PUT_MODES = ("PSET", "PRESET", "AND", "OR", "XOR")
+# surfarray.pixels2d element type per Surface.get_bytesize()
+_PIXEL_TYPES = {1: np.uint8, 2: np.uint16, 3: np.uint32, 4: np.uint32}
+
+def paint(surface, x, y, fill_color, border_color=None) -> int:
+    """
+    QBasic PAINT: fills the region around (x, y) bounded by border_color.
+
+    Like QBasic, every pixel that is not border_color is painted over, including
+    pixels that already have the fill color; the region is 4-connected.
+
+    :param surface: Surface to paint on (any pixel format).
+    :param x: Seed column.
+    :param y: Seed row.
+    :param fill_color: Fill color.
+    :param border_color: Color that stops the fill (default fill_color, as in QBasic).
+    :return: Number of pixels painted (0 when the seed is off the surface or on the border).
+    """
+    width, height = surface.get_size()
+    x, y = int(x), int(y)
+    if not (0 <= x < width and 0 <= y < height):
+        return 0
+    border = surface.map_rgb(fill_color if border_color is None else border_color)
+    pixels, _ = _pixel_view(surface)
+    # Row-major mask, 1 = border or already painted; bytearray find/rfind locate span ends
+    border_mask = pixels.T == border
+    del pixels  # unlock the surface
+    blocked = bytearray(border_mask.tobytes())
+
+    # Seeds are flat indices into the mask; spans are only marked here, the
+    # surface is written once at the end
+    seed = y * width + x
+    if blocked[seed]:
+        return 0
+    painted = 0
+    find, rfind = blocked.find, blocked.rfind
+    ones = b"\x01" * width
+    size = width * height
+    seeds = [seed]
+    while seeds:
+        seed = seeds.pop()
+        if blocked[seed]:
+            continue
+        row = seed - seed % width
+        left = rfind(1, row, seed) + 1 or row
+        right = find(1, seed, row + width)
+        if right < 0:
+            right = row + width
+        blocked[left:right] = ones[:right - left]
+        painted += right - left
+
+        # One seed per open run directly above and below the span
+        for offset in (-width, width):
+            start, end = left + offset, right + offset
+            if start < 0 or end > size:
+                continue
+            start = find(0, start, end)
+            while start >= 0:
+                seeds.append(start)
+                start = find(1, start, end)
+                if start < 0:
+                    break
+                start = find(0, start, end)
+
+    filled = np.frombuffer(blocked, dtype=bool).reshape(height, width) ^ border_mask
+    pixels, write_back = _pixel_view(surface)
+    np.copyto(pixels, pixels.dtype.type(surface.map_rgb(fill_color)), where=filled.T)
+    if write_back:
+        pygame.surfarray.blit_array(surface, pixels)
+    del pixels
+    return painted
+
+def _color_mask(surface) -> int:
+    """Bits of a mapped pixel value that hold color (all of them on palettized surfaces)."""
+    red, green, blue, _ = surface.get_masks()
+    return (red | green | blue) or (1 << surface.get_bitsize()) - 1
+
+class ImageBuffer:
+    """
+    A rectangle of mapped pixel values, as captured by GET (QBasic's image array).
+
+    Pixel values belong to the pixel format of the surface they were taken from
+    (or mapped for, see from_ega); PUT them on surfaces of that format.
+    """
+    __slots__ = ("pixels",)
+
+    def __init__(self, pixels: np.ndarray):
+        """
+        :param pixels: Mapped color values, shape (width, height), indexed [x, y].
+        """
+        self.pixels = pixels
+
+    @property
+    def size(self) -> tuple:
+        return self.pixels.shape
+
+    @classmethod
+    def from_ega(cls, data_list: list, surface: pygame.Surface) -> "ImageBuffer":
+        """
+        Builds a buffer from GORILLA.BAS EGA DATA (see graphics.decode_ega_indices).
+
+        :param data_list: The packed DATA integers.
+        :param surface: Surface whose pixel format the values are mapped to.
+        """
+        from graphics import decode_ega_indices
+        return cls(_ega_lut(surface)[decode_ega_indices(data_list)])
+
+def _ega_lut(surface) -> np.ndarray:
+    """The 16 EGA colors as pixel values of a surface, indexed by EGA color number."""
+    from graphics import EGA_PALETTE
+    mask = _color_mask(surface)
+    return np.array([surface.map_rgb(color) & mask for color in EGA_PALETTE],
+                    dtype=_PIXEL_TYPES[surface.get_bytesize()])
+
+class _PackedImage:
+    """
+    Packed EGA DATA given to PUT: decoded once, then mapped once per pixel
+    format it is put on. The DATA list is assumed not to change.
+    """
+    __slots__ = ("data", "indices", "_buffers")
+
+    def __init__(self, data_list: list):
+        from graphics import decode_ega_indices
+        self.data = data_list
+        self.indices = decode_ega_indices(data_list)
+        # format key -> ImageBuffer
+        self._buffers = {}
+
+    def buffer(self, surface) -> ImageBuffer:
+        """The image as an ImageBuffer for the surface's pixel format."""
+        lut = None
+        if surface.get_masks()[0]:
+            key = (surface.get_bytesize(), surface.get_masks())
+        else:
+            # Palettized: the pixel values depend on the palette
+            lut = _ega_lut(surface)
+            key = lut.tobytes()
+        image = self._buffers.get(key)
+        if image is None:
+            if lut is None:
+                lut = _ega_lut(surface)
+            image = self._buffers[key] = ImageBuffer(lut[self.indices])
+        return image
+
+def _pixel_view(surface):
+    """(array, write_back) for a surface: a live view, or a copy to blit back for 24-bit surfaces."""
+    try:
+        return pygame.surfarray.pixels2d(surface), False
+    except ValueError:
+        return pygame.surfarray.array2d(surface), True
+
+def get_image(surface, x1, y1, x2, y2) -> ImageBuffer:
+    """
+    QBasic GET: copies the rectangle (x1, y1)-(x2, y2), corners included.
+
+    :raise ValueError: If the rectangle is not entirely on the surface (QBasic's
+                       "Illegal function call").
+    """
+    left, top = min(x1, x2), min(y1, y2)
+    rect = pygame.Rect(left, top, abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+    if not surface.get_rect().contains(rect):
+        raise ValueError(f"GET rectangle {tuple(rect)} is outside the {surface.get_size()} surface")
+    pixels, _ = _pixel_view(surface.subsurface(rect))
+    image = ImageBuffer(pixels & _color_mask(surface))
+    del pixels
+    return image
+
+def put_image(surface, x, y, image: ImageBuffer, mode: str = "XOR") -> None:
+    """
+    QBasic PUT: combines an image with the surface, top-left corner at (x, y).
+
+    PSET copies the image, PRESET copies its inverse, AND/OR/XOR combine it with
+    the pixels underneath (XOR is QBasic's default). Only color bits change, and
+    parts of the image off the surface are clipped.
+
+    :param image: An ImageBuffer for this surface's pixel format.
+    :param mode: One of PUT_MODES.
+    """
+    if mode not in PUT_MODES:
+        raise ValueError(f"unknown PUT mode {mode!r}; expected one of {PUT_MODES}")
+    width, height = image.size
+    x, y = int(x), int(y)
+    rect = pygame.Rect(x, y, width, height).clip(surface.get_rect())
+    if not rect.width or not rect.height:
+        return
+    source = image.pixels[rect.x - x:rect.right - x, rect.y - y:rect.bottom - y]
+    target = surface.subsurface(rect)
+    pixels, write_back = _pixel_view(target)
+    mask = pixels.dtype.type(_color_mask(surface))
+
+    if mode == "XOR":
+        pixels ^= source
+    elif mode == "OR":
+        pixels |= source
+    elif mode == "AND":
+        pixels &= source | ~mask
+    else:
+        pixels &= ~mask
+        pixels |= source if mode == "PSET" else source ^ mask
+
+    if write_back:
+        pygame.surfarray.blit_array(target, pixels)
+    del pixels
+
+def _draw_line(surface, op, ox, oy):
+    _, color, x1, y1, x2, y2, thickness = op
+    pygame.draw.line(surface, color, (int(ox + x1), int(oy + y1)), (int(ox + x2), int(oy + y2)), thickness)
+
+def _draw_box(surface, op, ox, oy):
+    _, color, x1, y1, x2, y2, width = op
+    x1, y1, x2, y2 = int(ox + x1), int(oy + y1), int(ox + x2), int(oy + y2)
+    pygame.draw.rect(surface, color, (min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1), width)
+
+def _draw_circle(surface, op, ox, oy):
+    _, color, cx, cy, radius, width = op
+    pygame.draw.circle(surface, color, (ox + cx, oy + cy), radius, width)
+
+def _draw_arc(surface, op, ox, oy):
+    _, color, rx, ry, size, start_angle, end_angle = op
+    pygame.draw.arc(surface, color, pygame.Rect(ox + rx, oy + ry, size, size), start_angle, end_angle, 1)
+
+def _draw_pset(surface, op, ox, oy):
+    _, color, x, y, point_size = op
+    pos = (int(ox + x), int(oy + y))
+    if point_size == 1:
+        surface.set_at(pos, color)  # Single pixel
+    else:
+        pygame.draw.circle(surface, color, pos, point_size)  # Scaled size
+
+def _draw_paint(surface, op, ox, oy):
+    _, color, x, y, border_color = op
+    paint(surface, ox + x, oy + y, color, border_color)
+
+def _draw_put(surface, op, ox, oy):
+    _, image, x, y, mode = op
+    if isinstance(image, _PackedImage):
+        image = image.buffer(surface)
+    put_image(surface, ox + x, oy + y, image, mode)
+
+_EXECUTE = {
+    "line": _draw_line,
+    "box": _draw_box,
+    "circle": _draw_circle,
+    "arc": _draw_arc,
+    "pset": _draw_pset,
+    "paint": _draw_paint,
+    "put": _draw_put,
+}
+
+class DisplayList:
+    """
+    Recorded QBDraw primitives, relative to the recording's origin.
+    """
+
+    def __init__(self, ops: list):
+        """
+        :param ops: Primitive tuples as produced by QBDraw (kind, color, ...).
+        """
+        self.ops = tuple(ops)
+        self._steps = tuple((_EXECUTE[op[0]], op) for op in self.ops)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def replay(self, surface: pygame.Surface, x: float = 0, y: float = 0) -> None:
+        """Draws the recorded figure with its origin at (x, y)."""
+        for execute, op in self._steps:
+            execute(surface, op, x, y)
+
+    def rasterize(self, origin: tuple = (64, 64), size: tuple = (128, 128)) -> tuple:
+        """
+        Renders the figure onto a transparent canvas and crops it to what was drawn.
+
+        pygame.draw.arc does not round identically at every canvas position (notably
+        near the top edge), so a figure with arcs is only guaranteed to match direct
+        drawing at rows away from the edge; prefer replay() where exactness matters.
+
+        :param origin: Canvas position of the figure's origin.
+        :param size: Canvas size; must hold the whole figure.
+        :return: (surface, (anchor_x, anchor_y)) where the anchor is the origin's pixel in
+                 the cropped surface, i.e. blit at (x - anchor_x, y - anchor_y).
+        """
+        canvas = pygame.Surface(size, pygame.SRCALPHA)
+        canvas.fill((0, 0, 0, 0))
+        self.replay(canvas, origin[0], origin[1])
+        bounds = canvas.get_bounding_rect()
+        return canvas.subsurface(bounds).copy(), (origin[0] - bounds.x, origin[1] - bounds.y)
+
 class QBDraw:
     def __init__(self, surface, offset_x=0, offset_y=0, scale=1.0, line_thickness=1, point_size=1, scale_lines=True, scale_points=True):
         """
@@ -26,37 +339,52 @@ class QBDraw:
         self.scale_lines = scale_lines
         # Scale point size if scale_points is True, otherwise keep it fixed; ensure at least 1 pixel
         self.point_size = max(1, int(point_size * scale)) if scale_points else point_size
+        # Primitives collected instead of drawn (see recorder)
+        self._recording = None
+        # id(EGA DATA list) -> _PackedImage, for PUT
+        self._packed = {}
 
     def _scale_pos(self, x, y):
         """Scale and offset a position from unscaled units to screen coordinates."""
         return int(self.offset_x + x * self.scale), int(self.offset_y + y * self.scale)
 
+    @classmethod
+    def recorder(cls, scale=1.0, **options) -> "QBDraw":
+        """
+        A QBDraw that records instead of drawing; collect the result with display_list().
+
+        :param scale: Scale baked into the recorded primitives.
+        :param options: Other QBDraw options (line_thickness, point_size, ...).
+        """
+        drawer = cls(None, scale=scale, **options)
+        drawer._recording = []
+        return drawer
+
+    def display_list(self) -> DisplayList:
+        """The primitives recorded so far (recorder() only)."""
+        return DisplayList(self._recording)
+
+    def _emit(self, op):
+        if self._recording is not None:
+            self._recording.append(op)
+        else:
+            _EXECUTE[op[0]](self.surface, op, self.offset_x, self.offset_y)
+
     def LINE(self, x1, y1, x2, y2, color, box=False, fill=False):
         """Draw a line or box with scaling."""
-        # Scale the coordinates
-        x1, y1 = self._scale_pos(x1, y1)
-        x2, y2 = self._scale_pos(x2, y2)
+        # Scale the coordinates (the offset is added when the primitive is drawn)
+        x1, y1 = x1 * self.scale, y1 * self.scale
+        x2, y2 = x2 * self.scale, y2 * self.scale
 
         if box:
-            # Determine top-left corner and dimensions
-            left = min(x1, x2)
-            top = min(y1, y2)
-            width = abs(x2 - x1) + 1
-            height = abs(y2 - y1) + 1
-
             # Adjust thickness based on scaling option
             thickness = int(self.scale * self.line_thickness) if self.scale_lines else self.line_thickness
-
-            if fill:
-                # Filled box (BF), no thickness
-                pygame.draw.rect(self.surface, color, (left, top, width, height))
-            else:
-                # Unfilled box (B), apply thickness
-                pygame.draw.rect(self.surface, color, (left, top, width, height), thickness)
+            # Filled box (BF) has no thickness; unfilled box (B) applies it
+            self._emit(("box", color, x1, y1, x2, y2, 0 if fill else thickness))
         else:
             # Regular line
             #thickness = int(self.scale * self.line_thickness) if self.scale_lines else self.line_thickness
-            pygame.draw.line(self.surface, color, (x1, y1), (x2, y2), self.line_thickness)#thickness)
+            self._emit(("line", color, x1, y1, x2, y2, self.line_thickness))#thickness)
             
     def LINE_OLD(self, x1, y1, x2, y2, color, box=False, fill=True):
         """Draw a line or rectangle with scaling and optional filling."""
@@ -89,25 +417,43 @@ class QBDraw:
     def CIRCLE(self, x, y, radius, color, start_angle=None, end_angle=None, fill=False):
         if fill:
             # Filled circle
-            pygame.draw.circle(self.surface, color,
-                           (self.offset_x + scl(x), self.offset_y + scl(y)),
-                           scl(radius), 0)
+            self._emit(("circle", color, scl(x), scl(y), scl(radius), 0))
         else:
             if start_angle is None or end_angle is None:
                 # Full circle outline
-                pygame.draw.circle(self.surface, color,
-                               (self.offset_x + scl(x), self.offset_y + scl(y)), scl(radius), 1)
+                self._emit(("circle", color, scl(x), scl(y), scl(radius), 1))
             else:
                 # Arc only
-                rect = pygame.Rect(self.offset_x + scl(x - radius), self.offset_y + scl(y - radius),
-                               2*scl(radius), 2*scl(radius))
-                pygame.draw.arc(self.surface, color, rect, start_angle, end_angle, 1)
+                self._emit(("arc", color, scl(x - radius), scl(y - radius), 2*scl(radius),
+                            start_angle, end_angle))
 
     def PSET(self, x, y, color):
         """Set a pixel or draw a small circle for a point with scaling."""
-        x, y = self._scale_pos(x, y)
-        if self.point_size == 1:
-            self.surface.set_at((x, y), color)  # Single pixel
-        else:
-            pygame.draw.circle(self.surface, color, (x, y), self.point_size)  # Scaled size
+        self._emit(("pset", color, x * self.scale, y * self.scale, self.point_size))
+
+    def PAINT(self, x, y, fill_color, border_color=None):
+        """Flood-fill the area around a point up to border_color (default fill_color); see paint()."""
+        self._emit(("paint", fill_color, x * self.scale, y * self.scale, border_color))
 
+    def GET(self, x1, y1, x2, y2) -> ImageBuffer:
+        """Capture the rectangle (x1, y1)-(x2, y2) with scaling; see get_image()."""
+        if self._recording is not None:
+            raise ValueError("GET reads the surface and cannot be recorded")
+        x1, y1 = self._scale_pos(x1, y1)
+        x2, y2 = self._scale_pos(x2, y2)
+        return get_image(self.surface, x1, y1, x2, y2)
+
+    def PUT(self, x, y, image, mode="XOR"):
+        """
+        Put an image with its top-left corner at a scaled point; see put_image().
+        The image is not scaled. It may also be packed EGA DATA (a list of integers),
+        which is decoded on its first PUT and mapped once per pixel format it is put on.
+        """
+        if mode not in PUT_MODES:
+            raise ValueError(f"unknown PUT mode {mode!r}; expected one of {PUT_MODES}")
+        if not isinstance(image, ImageBuffer):
+            packed = self._packed.get(id(image))
+            if packed is None:
+                packed = self._packed[id(image)] = _PackedImage(image)
+            image = packed
+        self._emit(("put", image, x * self.scale, y * self.scale, mode))
@@ -1,29 +1,111 @@
 #!/usr/bin/env python
 """
 Handles sound effects for the Gorilla game.
+
+Each effect plays sounds/<name>.wav when that file exists; otherwise it is the
+GORILLA.BAS PLAY string from synth.EFFECTS, taken pre-rendered from the asset
+pack when one is loaded or synthesized (and cached) on the spot. Playback goes
+through an audio.AudioScheduler, which keeps each effect category on its own
+channels and limits how many voices overlap.
 """
 
+import os
 import pygame
+import synth
+from audio import AudioScheduler, NullBackend, SilentClip
 
 class Sound:
     """
     Sound manager for the game.
     """
 
-    def __init__(self):
-        pygame.mixer.init()
-        self.throw_sound = pygame.mixer.Sound("sounds/throw.wav")
-        self.explosion_sound = pygame.mixer.Sound("sounds/explosion.wav")
-        self.victory_sound = pygame.mixer.Sound("sounds/victory.wav")
+    EFFECT_FILES = {
+        "intro": "sounds/intro.wav",
+        "throw": "sounds/throw.wav",
+        "explosion": "sounds/explosion.wav",
+        "victory": "sounds/victory.wav",
+    }
+    # (scheduler category, priority) per effect; see audio.DEFAULT_CATEGORIES
+    EFFECT_VOICES = {
+        "intro": ("music", 1),
+        "throw": ("sfx", 0),
+        "explosion": ("sfx", 1),
+        "victory": ("jingle", 2),
+    }
+
+    def __init__(self, pack=None, cache: synth.SynthCache = None, scheduler: AudioScheduler = None,
+                 effects: dict = None):
+        """
+        :param pack: Optional asset_pack.AssetPack holding pre-rendered "sound_<name>" clips.
+        :param cache: Synth cache for clips neither a WAV nor the pack provides.
+        :param scheduler: Channel scheduler (default: one on pygame.mixer).
+        :param effects: Ready clips by effect name; skips the mixer and loading (see headless).
+        """
+        if effects is None:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=synth.SAMPLE_RATE, size=-16, channels=1)
+            self.sample_rate, self.sample_size, self.channels = pygame.mixer.get_init()
+            self.cache = cache or synth.SynthCache(sample_rate=self.sample_rate)
+            effects = {name: self._load_effect(name, pack) for name in self.EFFECT_FILES}
+        self.effects = effects
+        self.scheduler = scheduler or AudioScheduler()
+
+    @classmethod
+    def headless(cls, clock=None, **scheduler_options) -> "Sound":
+        """
+        A silent Sound for simulations: no mixer, NullBackend voices lasting as long as
+        the synthesized effects would.
+
+        :param clock: Callable returning the simulation time in ms.
+        :param scheduler_options: Passed on to AudioScheduler (max_voices, categories...).
+        """
+        effects = {name: SilentClip(synth.play_seconds(synth.EFFECTS[name])) for name in cls.EFFECT_FILES}
+        return cls(scheduler=AudioScheduler(NullBackend(), clock=clock, **scheduler_options), effects=effects)
+
+    def _load_effect(self, name: str, pack) -> pygame.mixer.Sound:
+        path = self.EFFECT_FILES[name]
+        if os.path.exists(path):
+            return pygame.mixer.Sound(path)
+        if self.sample_size != -16:
+            raise pygame.error("synthesized sounds need a 16-bit signed mixer")
+        key = f"sound_{name}"
+        if pack is not None and key in pack.entries and pack.entries[key]["sample_rate"] == self.sample_rate:
+            return synth.to_mixer_sound(pack.data(key), self.channels)
+        return synth.to_mixer_sound(self.cache.play(synth.EFFECTS[name]), self.channels)
+
+    def play(self, name: str) -> bool:
+        """
+        Schedules an effect on its category's channels.
+
+        :return: False when the scheduler coalesced or dropped it.
+        """
+        category, priority = self.EFFECT_VOICES[name]
+        return self.scheduler.play(name, self.effects[name], category, priority)
+
+    def play_intro(self):
+        """Plays the intro tune."""
+        self.play("intro")
 
     def play_throw(self):
         """Plays the banana throw sound."""
-        self.throw_sound.play()
+        self.play("throw")
 
     def play_explosion(self):
         """Plays the explosion sound."""
-        self.explosion_sound.play()
+        self.play("explosion")
 
     def play_victory(self):
         """Plays the victory jingle."""
-        self.victory_sound.play()
+        self.play("victory")
+
+def load_sound(pack=None):
+    """
+    Initializes the mixer and loads (or synthesizes) the sound effects.
+
+    :param pack: Optional asset_pack.AssetPack with pre-rendered clips.
+    :return: A Sound, or None when there is no usable audio device.
+    """
+    try:
+        return Sound(pack)
+    except (pygame.error, OSError):
+        return None
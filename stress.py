@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""
+Headless stress scenarios for the Gorilla game.
+
+Where benchmark.py times single hot paths, these scenarios ramp a load
+parameter and report how throughput and frame time respond, to show where
+the current design stops scaling:
+
+  wide_city      city width (pixels)      generate + draw + collision reload
+  many_bananas   bananas in flight        update + check_collision per frame
+  rapid_impacts  impacts per frame        demolition + collision reload + render,
+                                          explosion sounds through a silent scheduler
+  long_session   rounds played            reset + frames, live object count
+
+Usage:
+    python stress.py                         # all scenarios
+    python stress.py --scenario many_bananas --json stress.json
+    python stress.py --quick                 # smaller loads, fewer frames
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import random
+import time
+import pygame
+
+SEED = 1990
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))] if values else 0.0
+
+def summarize(load, frame_times: list, work_items: int, **extra) -> dict:
+    """Builds one curve point: frame-time percentiles (ms) and items processed per second."""
+    total = sum(frame_times)
+    point = {
+        "load": load,
+        "frames": len(frame_times),
+        "mean_ms": total / len(frame_times) * 1000,
+        "p50_ms": percentile(frame_times, 50) * 1000,
+        "p95_ms": percentile(frame_times, 95) * 1000,
+        "max_ms": max(frame_times) * 1000,
+        "throughput_per_s": work_items / total if total else 0.0,
+        "frame_times_ms": [t * 1000 for t in frame_times],
+    }
+    point.update(extra)
+    return point
+
+def wide_city(game, loads, frames):
+    """Cities of growing width (hundreds of buildings at the top end)."""
+    from cityscape import CityScape
+    curve = []
+    cityscape, collision_objects = game.cityscape, game.collision_objects
+    try:
+        for width in loads:
+            random.seed(SEED)
+            start = time.perf_counter()
+            city = CityScape(width, game.screen_height)
+            generate_ms = (time.perf_counter() - start) * 1000
+            surface = pygame.Surface((width, game.screen_height))
+            # The game's own collision reload (as after an impact) runs on the wide city
+            game.cityscape = city
+
+            times = []
+            for _ in range(frames):
+                start = time.perf_counter()
+                city.draw(surface)
+                game.collision_objects = [obj for obj in game.collision_objects if obj.name != "building"]
+                game._load_collision_buildings()
+                times.append(time.perf_counter() - start)
+            curve.append(summarize(width, times, frames * len(city.buildings),
+                                   buildings=len(city.buildings), generate_ms=generate_ms))
+    finally:
+        game.cityscape, game.collision_objects = cityscape, collision_objects
+    return curve
+
+def many_bananas(game, loads, frames):
+    """Many simultaneous bananas; dead ones are relaunched to keep the load constant."""
+    from banana import Banana
+    objects = game.collision_objects
+    width, height = game.screen_width, game.screen_height
+    curve = []
+
+    def launch(rng):
+        thrower = game.gorilla1 if rng.random() < 0.5 else game.gorilla2
+        direction = 1 if thrower is game.gorilla1 else -1
+        return Banana(thrower.x, thrower.y - 45, direction * rng.uniform(20, 80),
+                      velocity_kmph=direction * rng.uniform(20, 70), wind_mps2=rng.uniform(-2, 2),
+                      integrator=game.banana_integrator)
+
+    for count in loads:
+        rng = random.Random(SEED)
+        bananas = [launch(rng) for _ in range(count)]
+        times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            for i, banana in enumerate(bananas):
+                banana.update(1 / 60, width, height)
+                if not banana.alive or banana.check_collision(objects) not in ("none", "sun"):
+                    bananas[i] = launch(rng)
+            times.append(time.perf_counter() - start)
+        curve.append(summarize(count, times, frames * count))
+    return curve
+
+def rapid_impacts(game, loads, frames):
+    """
+    Several impacts per frame until the skyline is shredded, rendering every frame.
+    Each impact requests an explosion sound from a headless Sound on a frame clock,
+    so the curve also shows how the voice limiter copes (played/coalesced/stolen/dropped).
+    """
+    from sound import Sound
+    curve = []
+    for per_frame in loads:
+        frame_clock = [0.0]
+        sound = Sound.headless(clock=lambda: frame_clock[0])
+        random.seed(SEED)
+        game.cityscape.generate_buildings()
+        game._background_dirty = True
+        game._load_collision_objects()
+        game._load_collision_buildings()
+        rng = random.Random(SEED)
+
+        times = []
+        for n in range(frames):
+            frame_clock[0] = n * 1000 / 60
+            start = time.perf_counter()
+            for _ in range(per_frame):
+                sound.play_explosion()
+                building = rng.choice(game.cityscape.buildings)
+                game.cityscape.destroy_building_area(building.x + rng.randrange(max(1, building.width)),
+                                                     building.building_top + 1, 30)
+                game.collision_objects = [obj for obj in game.collision_objects if obj.name != "building"]
+                game._load_collision_buildings()
+            game._background_dirty = True
+            game.render(flip=False)
+            times.append(time.perf_counter() - start)
+        curve.append(summarize(per_frame, times, frames * per_frame, voices=dict(sound.scheduler.stats)))
+    return curve
+
+def long_session(game, loads, frames):
+    """Plays many rounds back to back; reports frame time and live objects after each block."""
+    curve = []
+    random.seed(SEED)
+    played = 0
+    for rounds in loads:
+        times = []
+        while played < rounds:
+            game.reset()
+            for n in range(frames):
+                if n == 1:
+                    game.do_throw(random.uniform(30, 70), random.uniform(30, 90))
+                start = time.perf_counter()
+                game.update(1 / 60)
+                game.render(flip=False)
+                times.append(time.perf_counter() - start)
+            played += 1
+        gc.collect()
+        curve.append(summarize(rounds, times, len(times), live_objects=len(gc.get_objects())))
+    return curve
+
+SCENARIOS = {
+    "wide_city": (wide_city, (1280, 3840, 7680, 15360), (1280, 3840)),
+    "many_bananas": (many_bananas, (1, 10, 100, 300, 1000), (1, 100)),
+    "rapid_impacts": (rapid_impacts, (1, 5, 20, 50), (1, 10)),
+    "long_session": (long_session, (1, 10, 25, 50), (1, 5)),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Gorilla stress scenarios")
+    parser.add_argument("--scenario", action="append", choices=tuple(SCENARIOS), help="run only these")
+    parser.add_argument("--frames", type=int, default=120, help="frames per load level")
+    parser.add_argument("--quick", action="store_true", help="small loads and 30 frames per level")
+    parser.add_argument("--json", help="write the curves (including raw frame times) here")
+    args = parser.parse_args()
+
+    random.seed(SEED)
+    from game import Game
+    game = Game(background_assets=False)
+    game.round_delay_ms = 0
+    # explosion animations flip and sleep; stress runs measure game logic and rendering only
+    game.graphics.draw_explosion = lambda *a, **k: None
+    game.render()
+
+    frames = 30 if args.quick else args.frames
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        func, loads, quick_loads = SCENARIOS[name]
+        print(f"\n== {name}")
+        print(f"{'load':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'items/s':>14}")
+        curve = func(game, quick_loads if args.quick else loads, frames)
+        for point in curve:
+            print(f"{point['load']:>8}{point['mean_ms']:>10.2f}{point['p50_ms']:>10.2f}{point['p95_ms']:>10.2f}"
+                  f"{point['max_ms']:>10.2f}{point['throughput_per_s']:>14.0f}")
+        results[name] = curve
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""
+QBasic PLAY / SOUND synthesizer for the Gorilla game.
+
+GORILLA.BAS made all of its noises with PLAY strings and SOUND statements on
+the PC speaker, so instead of shipping WAV files this module renders them to
+16-bit PCM (a square wave, like the speaker) and hands the samples to
+pygame.mixer.Sound as a buffer.
+
+Supported PLAY commands:
+    A-G [#|+|-] [length] [.]   note, optional sharp/flat, length, dots
+    N n                        note number 0-84 (0 = rest)
+    O n, <, >                  octave 0-6 (default 4), down, up
+    L n                        default length (1 = whole note, 4 = quarter ...)
+    T n                        tempo in quarter notes per minute (32-255)
+    P n                        pause of length n
+    MN, ML, MS                 normal (7/8), legato (full), staccato (3/4)
+    MF, MB                     foreground/background; recorded but never blocks,
+                               every clip plays in the background here
+
+SOUND frequency, duration plays frequency Hz for duration clock ticks
+(18.2 per second).
+
+Rendered clips are cached by a hash of (command, sample rate) in memory and,
+as raw int16 files, on disk (CACHE_DIR), so each clip is synthesized once.
+"""
+
+import hashlib
+import os
+import re
+import numpy as np
+
+SYNTH_VERSION = 1
+TICKS_PER_SECOND = 18.2
+SAMPLE_RATE = 22050
+AMPLITUDE = 6000
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".synth_cache")
+
+# Sound effects, after the PLAY strings in GORILLA.BAS
+EFFECTS = {
+    "intro": "MBT160O1L8CDEDCDL4ECC",
+    "throw": "MBO0L32A-L64CL16BL64A+",
+    "explosion": "MBO0L32EFGEFDC",
+    "victory": "MFO0L32EFGEFDC",
+}
+
+_NOTE_STEPS = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+_TOKEN = re.compile(r"(M[NLSFB])|([A-G])([#+-]?)(\d*)(\.*)|([NOLTP])(\d+)(\.*)|([<>])")
+
+class PlayError(ValueError):
+    """Raised for a PLAY string that cannot be parsed."""
+
+def note_frequency(number: int) -> float:
+    """
+    Frequency of PLAY note number 1-84 (N1 is the C of octave 0; O3 holds middle C,
+    A in octave 3 is 440 Hz).
+    """
+    return 440.0 * 2.0 ** ((number - 46) / 12.0)
+
+def parse_play(music: str) -> tuple:
+    """
+    Turns a PLAY string into tones.
+
+    :return: (tones, background) where tones is a list of (frequency_hz, sound_seconds,
+             silence_seconds); frequency 0 is a rest. background is True when the
+             string ends in MB mode.
+    """
+    tones = []
+    octave, length, tempo = 4, 4, 120
+    articulation = 7 / 8
+    background = False
+
+    text = re.sub(r"\s+", "", music.upper())
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match:
+            raise PlayError(f"bad PLAY command at {pos}: {text[pos:pos + 8]!r}")
+        pos = match.end()
+        mode, note, accidental, note_length, note_dots, command, value, command_dots, shift = match.groups()
+
+        if mode:
+            if mode == "MN":
+                articulation = 7 / 8
+            elif mode == "ML":
+                articulation = 1.0
+            elif mode == "MS":
+                articulation = 3 / 4
+            else:
+                background = mode == "MB"
+            continue
+        if shift:
+            octave = max(0, octave - 1) if shift == "<" else min(6, octave + 1)
+            continue
+
+        dots = note_dots or command_dots or ""
+        if note:
+            number = octave * 12 + _NOTE_STEPS[note] + 1
+            number += {"#": 1, "+": 1, "-": -1}.get(accidental, 0)
+            tone_length = int(note_length) if note_length else length
+        else:
+            value = int(value)
+            if command == "O":
+                octave = min(6, value)
+                continue
+            if command == "L":
+                length = max(1, min(64, value))
+                continue
+            if command == "T":
+                tempo = max(32, min(255, value))
+                continue
+            if command == "P":
+                number, tone_length = 0, max(1, value)
+            else:  # N
+                number, tone_length = value, length
+
+        seconds = 4 * 60.0 / tempo / tone_length * (1.5 ** len(dots))
+        if number <= 0:
+            tones.append((0.0, 0.0, seconds))
+        else:
+            tones.append((note_frequency(number), seconds * articulation, seconds * (1 - articulation)))
+    return tones, background
+
+def play_seconds(music: str) -> float:
+    """Length of a PLAY string in seconds, without rendering it."""
+    return sum(on + off for _, on, off in parse_play(music)[0])
+
+def sound_tones(frequency: float, duration_ticks: float) -> list:
+    """
+    Tones for a SOUND statement (frequencies below 37 Hz are silent, as on the speaker).
+    """
+    seconds = duration_ticks / TICKS_PER_SECOND
+    if frequency < 37:
+        return [(0.0, 0.0, seconds)]
+    return [(float(frequency), seconds, 0.0)]
+
+def render_tones(tones: list, sample_rate: int = SAMPLE_RATE, amplitude: int = AMPLITUDE) -> np.ndarray:
+    """
+    Renders tones to mono int16 PCM as a square wave.
+    """
+    parts = []
+    for frequency, on_seconds, off_seconds in tones:
+        on = int(round(on_seconds * sample_rate))
+        off = int(round(off_seconds * sample_rate))
+        if on and frequency > 0:
+            phase = np.arange(on) * (2.0 * frequency / sample_rate)
+            wave = np.where(phase.astype(np.int64) & 1, -amplitude, amplitude)
+            parts.append(wave.astype(np.int16))
+        elif on:
+            off += on
+        if off:
+            parts.append(np.zeros(off, dtype=np.int16))
+    if not parts:
+        return np.zeros(0, dtype=np.int16)
+    return np.concatenate(parts)
+
+def render_play(music: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Mono int16 PCM for a PLAY string."""
+    return render_tones(parse_play(music)[0], sample_rate)
+
+def render_sound(frequency: float, duration_ticks: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Mono int16 PCM for a SOUND statement."""
+    return render_tones(sound_tones(frequency, duration_ticks), sample_rate)
+
+class SynthCache:
+    """
+    Memory and disk cache of rendered clips, keyed by command and sample rate.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, sample_rate: int = SAMPLE_RATE):
+        """
+        :param cache_dir: Directory for the raw int16 clips, or None for memory only.
+        :param sample_rate: Rate the clips are rendered at (use the mixer's).
+        """
+        self.cache_dir = cache_dir
+        self.sample_rate = sample_rate
+        self._clips = {}
+
+    def _key(self, command: str) -> str:
+        return hashlib.sha1(f"{SYNTH_VERSION}:{self.sample_rate}:{command}".encode()).hexdigest()
+
+    def _clip(self, command: str, render) -> np.ndarray:
+        key = self._key(command)
+        samples = self._clips.get(key)
+        if samples is not None:
+            return samples
+        path = os.path.join(self.cache_dir, key + ".pcm") if self.cache_dir else None
+        if path and os.path.exists(path):
+            samples = np.fromfile(path, dtype=np.int16)
+        else:
+            samples = render()
+            if path:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    samples.tofile(path)
+                except OSError:
+                    pass
+        self._clips[key] = samples
+        return samples
+
+    def play(self, music: str) -> np.ndarray:
+        """Mono int16 PCM for a PLAY string, rendered once."""
+        return self._clip(f"PLAY {music}", lambda: render_play(music, self.sample_rate))
+
+    def sound(self, frequency: float, duration_ticks: float) -> np.ndarray:
+        """Mono int16 PCM for a SOUND statement, rendered once."""
+        return self._clip(f"SOUND {frequency},{duration_ticks}",
+                          lambda: render_sound(frequency, duration_ticks, self.sample_rate))
+
+def to_mixer_sound(samples, channels: int = 1):
+    """
+    Wraps mono int16 samples in a pygame.mixer.Sound (the mixer must use 16-bit samples).
+
+    :param samples: Mono int16 array (or any buffer of int16 samples).
+    :param channels: Mixer channel count; the mono samples are duplicated to fill them.
+    """
+    import pygame
+    samples = np.frombuffer(samples, dtype=np.int16) if not isinstance(samples, np.ndarray) else samples
+    if channels > 1:
+        samples = np.repeat(samples, channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
@@ -1,4 +1,3 @@
-import pygame
 import math
 
 class ThrowController:
@@ -34,40 +33,45 @@ class ThrowController:
         else:
             print(f"Unsupported mode: {mode}")
 
-    def handle_event(self, event):
-        """Main event handler, calls different sub-handlers depending on mode."""
+    def handle_action(self, action) -> bool:
+        """
+        Consumes one input_handler.Action; keyboard mode reacts to the angle/charge
+        actions, mouse mode to press/move/release.
+
+        :return: True when the action releases a throw (get_throw_params, then reset).
+        """
+        kind = action.kind
+        if kind == "charge_end":
+            self.charging = False
+            return True
         if self.mode == "keyboard":
-            self._handle_keyboard_event(event)
-        else:
-            self._handle_mouse_event(event)
+            self._handle_keyboard_action(kind)
+            return False
+        return self._handle_mouse_action(kind, action.pos)
 
-    def _handle_keyboard_event(self, event):
+    def _handle_keyboard_action(self, kind):
         """Keyboard-based angle & power adjustment."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                self.angle = min(self.angle + 1, self.angle_max)
-            elif event.key == pygame.K_DOWN:
-                self.angle = max(self.angle - 1, self.angle_min)
-            elif event.key == pygame.K_SPACE:
-                self.charging = True
-        elif event.type == pygame.KEYUP:
-            if event.key == pygame.K_SPACE:
-                self.charging = False
-
-    def _handle_mouse_event(self, event):
+        if kind == "angle_up":
+            self.angle = min(self.angle + 1, self.angle_max)
+        elif kind == "angle_down":
+            self.angle = max(self.angle - 1, self.angle_min)
+        elif kind == "charge_start":
+            self.charging = True
+
+    def _handle_mouse_action(self, kind, pos) -> bool:
         """Mouse-drag for angle & power."""
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # left click
-                self.mouse_drag = True
-                self.drag_start_pos = pygame.mouse.get_pos()
-                self.drag_current_pos = self.drag_start_pos
-        elif event.type == pygame.MOUSEMOTION:
+        if kind == "press":
+            self.mouse_drag = True
+            self.drag_start_pos = pos
+            self.drag_current_pos = pos
+        elif kind == "move":
             if self.mouse_drag:
-                self.drag_current_pos = pygame.mouse.get_pos()
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 1:
-                self.mouse_drag = False
-                self._update_angle_power_from_drag(finalize=True)
+                self.drag_current_pos = pos
+        elif kind == "release":
+            self.mouse_drag = False
+            self._update_angle_power_from_drag(finalize=True)
+            return True
+        return False
 
     def update(self, dt):
         """Continuous update (e.g. for keyboard charging)."""
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+"""
+Headless AI-vs-AI tournament runner for the Gorilla game.
+
+Plays N full matches of env.GorillaEnv between two bot strategies, spread over
+all cores with a ProcessPoolExecutor. Each finished match is appended to a
+JSONL file as soon as it completes (seed, bots, winner, throws), and a rerun
+with the same output file and settings skips the matches already recorded, so
+an interrupted tournament resumes where it stopped (a file written with other
+bots, env settings or seed is refused rather than mixed in).
+
+Usage:
+    python tournament.py --matches 1000 --bot1 aim --bot2 adjust --output results.jsonl
+    python tournament.py --matches 1000 --angle-jitter 3 --wind-range 1.5 --output tuned.jsonl
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from env import GorillaEnv
+from physics import launch_state, iter_trajectory, throw_velocity_kmph
+
+# same limits as ThrowController
+ANGLE_MIN, ANGLE_MAX = 10.0, 80.0
+
+class RandomBot:
+    """Throws with uniformly random angle and power."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def act(self, env: GorillaEnv, obs: dict) -> tuple:
+        return self.rng.uniform(ANGLE_MIN, ANGLE_MAX), self.rng.uniform(10, 100)
+
+    def observe(self, env: GorillaEnv, info: dict) -> None:
+        pass
+
+class FixedBot(RandomBot):
+    """Always throws at 45 degrees with 60 power."""
+
+    def act(self, env, obs):
+        return 45.0, 60.0
+
+class AdjustBot(RandomBot):
+    """
+    Plays like a human: starts at 45/50 and corrects the power after each
+    throw depending on whether the banana landed short of or past the opponent.
+    """
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.angle = 45.0
+        self.power = 50.0
+
+    def act(self, env, obs):
+        return self.angle, self.power
+
+    def observe(self, env, info):
+        me = info["thrower"]
+        my_x = env.gorillas[me][0]
+        target_x = env.gorillas[1 - me][0]
+        impact_x = info["impact"][0]
+        short = abs(impact_x - my_x) < abs(target_x - my_x)
+        self.power = max(10.0, min(100.0, self.power + (6.0 if short else -4.0)))
+
+class AimBot(RandomBot):
+    """
+    Searches a coarse (angle, power) grid with the noise-free trajectory engine
+    against the current skyline and picks the throw landing closest to the opponent.
+    """
+
+    ANGLES = range(20, 81, 5)
+    POWERS = range(10, 101, 6)
+
+    def act(self, env, obs):
+        me = env.turn
+        x, y = env.gorillas[me]
+        target_x, target_y = env.gorillas[1 - me]
+        rects = env._rects
+        best, best_dist = (45.0, 50.0), math.inf
+        for angle in self.ANGLES:
+            for power in self.POWERS:
+                velocity = throw_velocity_kmph(power, env.screen_width)
+                a, v = (angle, velocity) if me == 0 else (-angle, -velocity)
+                vx, vy, ax, ay = launch_state(a, v, 9.8, env.wind)
+                hit = None
+                for i, (px, py) in enumerate(iter_trajectory(x, y, vx, vy, ax, ay, env.dt * 2,
+                                                             min_x=0, max_x=env.screen_width,
+                                                             max_y=env.screen_height, max_steps=2000)):
+                    if i and any(r.collidepoint(px, py) for r in rects[1:]):
+                        hit = (px, py)
+                        break
+                if hit is None:
+                    continue
+                dist = math.hypot(hit[0] - target_x, hit[1] - (target_y + 20))
+                if dist < best_dist:
+                    best, best_dist = (float(angle), float(power)), dist
+        return best
+
+BOTS = {
+    "random": RandomBot,
+    "fixed": FixedBot,
+    "adjust": AdjustBot,
+    "aim": AimBot,
+}
+
+def play_match(match: int, seed: int, bot_names: tuple, env_kwargs: dict) -> dict:
+    """Plays one full match and returns its JSON-serializable record."""
+    env = GorillaEnv(seed=seed, **env_kwargs)
+    obs = env.reset()
+    rng = random.Random(seed)
+    bots = [BOTS[name](random.Random(rng.random())) for name in bot_names]
+
+    winner = None
+    done = False
+    while not done:
+        thrower = env.turn
+        obs, reward, done, info = env.step(bots[thrower].act(env, obs))
+        bots[thrower].observe(env, info)
+        if reward > 0:
+            winner = thrower
+        elif reward < 0:
+            winner = 1 - thrower
+
+    return {
+        "match": match,
+        "seed": seed,
+        "bot1": bot_names[0],
+        "bot2": bot_names[1],
+        "winner": None if winner is None else f"gorilla{winner + 1}",
+        "winner_bot": None if winner is None else bot_names[winner],
+        "throws": env.throws,
+        **env_kwargs,
+    }
+
+def completed_matches(path: str, config: dict, base_seed: int) -> set:
+    """
+    Match indices already recorded in a (possibly truncated) JSONL file.
+
+    :param config: Bots and env settings of this run (record fields: bot1, bot2, max_throws, ...).
+    :param base_seed: --seed of this run; match i must have been played with base_seed + i.
+    :raise ValueError: If the file holds matches played with another config or seed;
+                       resuming would skip those matches and mix both in the summary.
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                match = record["match"]
+            except (ValueError, KeyError):
+                continue  # partial last line from an interrupted run
+            expected = dict(config, seed=base_seed + match)
+            differ = {key: record.get(key) for key, value in expected.items() if record.get(key) != value}
+            if differ:
+                raise ValueError(f"{path} holds match {match} played with {differ}, not {expected}; "
+                                 f"use another --output or the same settings")
+            done.add(match)
+    return done
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Gorilla bot tournament")
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--bot1", choices=tuple(BOTS), default="aim", help="left gorilla")
+    parser.add_argument("--bot2", choices=tuple(BOTS), default="adjust", help="right gorilla")
+    parser.add_argument("--output", default="tournament.jsonl")
+    parser.add_argument("--seed", type=int, default=0, help="match i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--max-throws", type=int, default=50)
+    parser.add_argument("--angle-jitter", type=float, default=5.0)
+    parser.add_argument("--power-jitter", type=float, default=5.0)
+    parser.add_argument("--wind-range", type=float, default=2.0)
+    args = parser.parse_args()
+
+    env_kwargs = {
+        "max_throws": args.max_throws,
+        "angle_jitter": args.angle_jitter,
+        "power_jitter": args.power_jitter,
+        "wind_range": args.wind_range,
+    }
+    bot_names = (args.bot1, args.bot2)
+    try:
+        done = completed_matches(args.output, {"bot1": args.bot1, "bot2": args.bot2, **env_kwargs}, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    pending = [m for m in range(args.matches) if m not in done]
+    if done:
+        print(f"Resuming: {len(done)} matches already in {args.output}, {len(pending)} to play")
+
+    # a truncated last line would corrupt the next record; make sure we start on a fresh line
+    if os.path.exists(args.output) and os.path.getsize(args.output):
+        with open(args.output, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    with open(args.output, "a") as out, ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(play_match, m, args.seed + m, bot_names, env_kwargs) for m in pending]
+        for n, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            if n % 50 == 0 or n == len(futures):
+                print(f"{n}/{len(futures)} matches played")
+
+    # summary over the whole file (including resumed matches)
+    wins = {"gorilla1": 0, "gorilla2": 0, None: 0}
+    throws = []
+    with open(args.output) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            wins[record["winner"]] = wins.get(record["winner"], 0) + 1
+            if record["winner"]:
+                throws.append(record["throws"])
+    total = sum(wins.values()) or 1
+    print(f"gorilla1 ({args.bot1}) wins {wins['gorilla1'] / total:.1%}, "
+          f"gorilla2 ({args.bot2}) wins {wins['gorilla2'] / total:.1%}, draws {wins[None] / total:.1%}")
+    if throws:
+        print(f"mean throws to win: {sum(throws) / len(throws):.1f}")
+
+if __name__ == '__main__':
+    main()
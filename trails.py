@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Ghost trails for the Gorilla game: every banana path of the current round,
+accumulated into one off-screen layer.
+
+Each new banana position only draws the segment from the previous position, so
+nothing is re-drawn from stored point lists and compositing the layer costs a
+single blit per frame regardless of how many throws have happened.
+"""
+
+import pygame
+
+# Colorkey for the empty parts of the layer (never used by the game palette)
+_TRANSPARENT = (255, 0, 255)
+
+class TrailLayer:
+    """
+    Off-screen surface that banana paths are drawn into incrementally.
+    """
+
+    def __init__(self, width: int, height: int, width_px: int = 1):
+        """
+        :param width: Layer width (screen width).
+        :param height: Layer height (screen height).
+        :param width_px: Line width of the trails.
+        """
+        self.surface = pygame.Surface((width, height))
+        self.surface.set_colorkey(_TRANSPARENT)
+        self.width_px = width_px
+        self.color = (255, 255, 255)
+        self.empty = True
+        self._last = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Erases every trail (new round)."""
+        self.surface.fill(_TRANSPARENT)
+        self.empty = True
+        self._last = None
+
+    def begin_path(self, color) -> None:
+        """Starts a new trail for a freshly thrown banana."""
+        self.color = color
+        self._last = None
+
+    def add_point(self, x: float, y: float) -> None:
+        """Extends the current trail to (x, y)."""
+        point = (int(x), int(y))
+        if self._last is not None:
+            pygame.draw.line(self.surface, self.color, self._last, point, self.width_px)
+            self.empty = False
+        self._last = point
+
+    def end_path(self) -> None:
+        """Closes the current trail; the next add_point starts a new one."""
+        self._last = None
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Composites the layer onto the screen."""
+        if not self.empty:
+            screen.blit(self.surface, (0, 0))
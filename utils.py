@@ -31,6 +31,9 @@ EGA_COLORS = {
     'WHITE': (255, 255, 255),
 }
 
+# GORILLA.BAS screen (SCREEN 9, EGA), the render target of Game(native_ega=True)
+EGA_RESOLUTION = (640, 350)
+
 # Color constants used in the game
 SKY_COLOR = EGA_COLORS['BLUE']
 BUILDING_COLORS = [
@@ -46,6 +49,7 @@ SUN_COLOR = EGA_COLORS['BRIGHT_YELLOW']
 GROUND_COLOR = EGA_COLORS['GRAY']
 WINDOW_COLOR_LIT = EGA_COLORS['BRIGHT_YELLOW']
 WINDOW_COLOR_DARK = EGA_COLORS['DARK_GRAY']
+WIND_COLOR = EGA_COLORS['BRIGHT_RED']
 
 # unit conversion constants
 PIXELS_PER_METER = 30  # Adjust this as needed
@@ -90,15 +94,25 @@ def fn_ran(x: int) -> int:
     """
     return int(random.random() * x) + 1
 
-def calc_delay() -> float:
+_calc_delay_cache = None
+
+def calc_delay(sample_seconds: float = 0.02) -> float:
     """
     Measures system speed for timing adjustments, returning a computed delay factor.
-    
-    :return: A float representing the system's approximate operation speed.
+
+    The original spun for a full 0.5 s; this samples a short window, scales the
+    count to 0.5 s and caches it, so only the first call costs anything.
+
+    :param sample_seconds: Length of the measuring window on the first call.
+    :return: A float representing the system's approximate operation speed
+             (increments per 0.5 s).
     """
-    start_time = time.time()
-    counter = 0
-    # Count as many increments as possible in 0.5 seconds
-    while time.time() - start_time < 0.5:
-        counter += 1
-    return float(counter)
+    global _calc_delay_cache
+    if _calc_delay_cache is None:
+        start_time = time.perf_counter()
+        counter = 0
+        while time.perf_counter() - start_time < sample_seconds:
+            counter += 1
+        elapsed = time.perf_counter() - start_time
+        _calc_delay_cache = float(counter) * 0.5 / elapsed
+    return _calc_delay_cache
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Spatially varying wind for the Gorilla game.
+
+The field is precomputed once per throw on a coarse grid (node spacing
+`cell_size` pixels) and sampled with bilinear interpolation. Values are stored
+in pixels/s^2 so Banana can use them directly as horizontal acceleration.
+
+Shape of the field:
+  - above the rooftops the wind strengthens with altitude,
+  - inside the skyline the buildings shelter the air,
+  - the gaps between buildings channel gusts whose direction is random per gap.
+"""
+
+import math
+import random
+import pygame
+from utils import meters_to_pixels, WIND_COLOR
+
+try:
+    import numpy as np
+except ImportError:  # vectorized sampling only
+    np = None
+
+class WindField:
+    """
+    Coarse wind grid with bilinear lookup, for one banana (sample) or many (sample_many).
+    """
+
+    def __init__(
+        self,
+        base_wind_mps2: float,
+        screen_width: int,
+        screen_height: int,
+        buildings: list = (),
+        cell_size: int = 40,
+        altitude_gain: float = 1.0,
+        shelter: float = 0.3,
+        gust_mps2: float = 1.5,
+        seed=None
+    ):
+        """
+        :param base_wind_mps2: Wind at rooftop level, as picked by Game for the throw.
+        :param screen_width: Screen width in pixels.
+        :param screen_height: Screen height in pixels.
+        :param buildings: cityscape.Building list used for shelter and gusts.
+        :param cell_size: Grid spacing in pixels.
+        :param altitude_gain: Extra wind fraction at the top of the screen.
+        :param shelter: Fraction of the wind that reaches inside the skyline.
+        :param gust_mps2: Strength of the gusts channelled between buildings.
+        :param seed: Seed for the gust directions.
+        """
+        self.base_wind = base_wind_mps2
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.cell_size = cell_size
+        self._inv_cell = 1.0 / cell_size
+        self.cols = screen_width // cell_size + 2
+        self.rows = screen_height // cell_size + 2
+
+        rng = random.Random(seed)
+        ground = screen_height - 50
+        base_px = meters_to_pixels(base_wind_mps2)
+        gust_px = meters_to_pixels(gust_mps2)
+
+        # rooftop height and gap gusts per grid column
+        roof = [ground] * self.cols
+        gust = [0.0] * self.cols
+        gaps = [b.x + b.width + 1 for b in buildings]
+        for b in buildings:
+            for col in range(int(b.x * self._inv_cell), int((b.x + b.width) * self._inv_cell) + 1):
+                if 0 <= col < self.cols:
+                    roof[col] = min(roof[col], b.building_top)
+        for gap_x in gaps:
+            col = int(round(gap_x * self._inv_cell))
+            if 0 <= col < self.cols:
+                gust[col] += rng.choice((-1.0, 1.0)) * gust_px
+
+        self.grid = []
+        for row in range(self.rows):
+            y = row * cell_size
+            altitude = max(0.0, 1.0 - y / ground)
+            line = []
+            for col in range(self.cols):
+                if y < roof[col]:
+                    line.append(base_px * (1.0 + altitude_gain * altitude))
+                else:
+                    line.append(base_px * shelter + gust[col])
+            self.grid.append(line)
+
+        self.array = np.array(self.grid, dtype=np.float64) if np is not None else None
+        # Bilinear weights per cell, row-major: wind = a + bx*fx + (by + bxy*fx)*fy
+        self._cells = []
+        for r in range(self.rows - 1):
+            top, bottom = self.grid[r], self.grid[r + 1]
+            for c in range(self.cols - 1):
+                a, b = top[c], top[c + 1]
+                d, e = bottom[c], bottom[c + 1]
+                self._cells.append((a, b - a, d - a, e - d - b + a))
+        self._sample = self.accelerator(0.0)
+        self._overlay = None
+
+    def sample(self, x: float, y: float) -> float:
+        """Bilinear wind (pixels/s^2) at one point; clamped to the grid."""
+        return self._sample(x, y)[0]
+
+    def accelerator(self, gravity: float):
+        """
+        Banana acceleration function for this field: accel(x, y) -> (wind, gravity),
+        in pixels/s^2. Integrators call it once or more per physics step and the
+        banana moves a few pixels per step, so it keeps the weights of the last
+        cell (see _region) and only looks the grid up again when it leaves it.
+
+        :param gravity: Vertical acceleration returned with the wind.
+        """
+        region = self._region
+        # Empty region: the first call looks the cell up
+        x0, x1, y0, y1 = math.inf, -math.inf, math.inf, -math.inf
+        a = bx = by = bxy = 0.0
+
+        def accel(x, y):
+            nonlocal x0, x1, y0, y1, a, bx, by, bxy
+            if not (x0 <= x < x1 and y0 <= y < y1):
+                x0, x1, y0, y1, a, bx, by, bxy = region(x, y)
+            return a + bx * x + (by + bxy * x) * y, gravity
+        return accel
+
+    def _region(self, x: float, y: float) -> tuple:
+        """
+        The area around (x, y) over which one bilinear formula holds: a grid cell,
+        or a strip/corner outside the grid where sampling clamps.
+
+        :return: (x0, x1, y0, y1, a, bx, by, bxy); for x0 <= x < x1 and y0 <= y < y1
+                 the wind is a + bx*x + (by + bxy*x)*y, in pixels.
+        """
+        c, sx, tx, x0, x1 = self._axis(x, self.cols)
+        r, sy, ty, y0, y1 = self._axis(y, self.rows)
+        # cell weights in cell fractions, with fx = sx*x + tx and fy = sy*y + ty
+        a, bx, by, bxy = self._cells[r * (self.cols - 1) + c]
+        return (x0, x1, y0, y1,
+                a + bx * tx + (by + bxy * tx) * ty,
+                (bx + bxy * ty) * sx,
+                (by + bxy * tx) * sy,
+                bxy * sx * sy)
+
+    def _axis(self, v: float, nodes: int) -> tuple:
+        """
+        Cell index along one axis for pixel coordinate v, with the cell fraction as
+        scale * v + offset and the pixel range [lo, hi) it holds over.
+
+        :return: (index, scale, offset, lo, hi)
+        """
+        top = nodes - 1.001  # clamp limit of the grid coordinate, as in sample_many
+        g = v * self._inv_cell
+        if g < 0:
+            return 0, 0.0, 0.0, -math.inf, 0.0
+        if g > top:
+            return nodes - 2, 0.0, top - (nodes - 2), top * self.cell_size, math.inf
+        c = int(g)
+        return c, self._inv_cell, float(-c), c * self.cell_size, min(c + 1, top) * self.cell_size
+
+    def sample_many(self, xs, ys):
+        """Vectorized bilinear lookup; xs and ys are equal-length arrays."""
+        if self.array is None:
+            raise RuntimeError("sample_many requires numpy")
+        gx = np.clip(np.asarray(xs, dtype=np.float64) * self._inv_cell, 0, self.cols - 1.001)
+        gy = np.clip(np.asarray(ys, dtype=np.float64) * self._inv_cell, 0, self.rows - 1.001)
+        c = gx.astype(np.intp)
+        r = gy.astype(np.intp)
+        fx = gx - c
+        fy = gy - r
+        g = self.array
+        upper = g[r, c] + (g[r, c + 1] - g[r, c]) * fx
+        lower = g[r + 1, c] + (g[r + 1, c + 1] - g[r + 1, c]) * fx
+        return upper + (lower - upper) * fy
+
+    def overlay(self, every: int = 3) -> pygame.Surface:
+        """
+        Cached transparent surface with a small arrow every `every` grid nodes,
+        showing direction and relative strength of the field.
+        """
+        if self._overlay is None:
+            surf = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            peak = max(1e-6, max(abs(v) for line in self.grid for v in line))
+            step = self.cell_size * every
+            for y in range(step // 2, self.screen_height - 50, step):
+                for x in range(step // 2, self.screen_width, step):
+                    length = 12 * self.sample(x, y) / peak
+                    draw_wind_arrow(surf, x, y, length, (*WIND_COLOR, 160))
+            self._overlay = surf
+        return self._overlay
+
+def draw_wind_arrow(surface: pygame.Surface, x: int, y: int, length: float, color=WIND_COLOR) -> None:
+    """
+    Draws a horizontal arrow starting at (x, y), `length` pixels long (negative = to the left),
+    like the wind arrow at the bottom of the original GORILLA.BAS screen.
+    """
+    if abs(length) < 1:
+        return
+    end_x = int(x + length)
+    head = 3 if length > 0 else -3
+    pygame.draw.line(surface, color, (x, y), (end_x, y))
+    pygame.draw.line(surface, color, (end_x, y), (end_x - head, y - 2))
+    pygame.draw.line(surface, color, (end_x, y), (end_x - head, y + 2))